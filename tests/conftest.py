@@ -0,0 +1,22 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from video_engine.config import config
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Point all workspace directories and databases at a temporary directory."""
+    monkeypatch.setattr(type(config), "WORKSPACE_DIR", tmp_path)
+    monkeypatch.setattr(type(config), "VIDEO_OUTPUT_DIR", tmp_path / "videos")
+    monkeypatch.setattr(type(config), "VIDEO_UPLOAD_DIR", tmp_path / "uploads")
+    monkeypatch.setattr(type(config), "JOBS_DIR", tmp_path / "jobs")
+    monkeypatch.setattr(type(config), "TEMP_DIR", tmp_path / "temp")
+    monkeypatch.setattr(type(config), "RENDER_CACHE_DIR", tmp_path / "cache" / "renders")
+    monkeypatch.setattr(type(config), "STORYBOARD_CACHE_PATH", tmp_path / "cache" / "storyboards.db")
+    monkeypatch.setattr(type(config), "IMAGE_VARIANTS_DIR", tmp_path / "cache" / "images")
+    monkeypatch.setattr(type(config), "QUEUE_DB_PATH", tmp_path / "queue.db")
+    monkeypatch.setattr(type(config), "UPLOADS_DB_PATH", tmp_path / "uploads.db")
+    config.ensure_directories()
+    return tmp_path
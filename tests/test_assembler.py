@@ -0,0 +1,144 @@
+"""Tests for incremental final-video assembly."""
+
+import time
+import shutil
+
+import pytest
+
+from video_engine.core import assembler as assembler_module
+from video_engine.core.assembler import ShotAssembler
+from video_engine.models.schemas import Shot
+from video_engine.storage.hls import HLSPlaylist
+from video_engine.config import config
+
+
+def make_shot(index: int, **kwargs) -> Shot:
+    """Build a rendered shot with a known duration."""
+    fields = dict(
+        id=f"shot_{index}",
+        sequence_number=index + 1,
+        duration_seconds=2.0,
+        description="Shot",
+        text_prompt="a forest",
+        output_duration_seconds=2.0,
+    )
+    fields.update(kwargs)
+    return Shot(**fields)
+
+
+@pytest.fixture
+def remux(monkeypatch):
+    """Replace ffmpeg remuxes with byte copies, recording TS offsets."""
+    offsets = []
+
+    def fake_remux_to_ts(input_path, output_path, offset=0.0):
+        offsets.append(offset)
+        shutil.copyfile(input_path, output_path)
+        return True
+
+    def fake_remux_to_mp4(input_path, output_path):
+        shutil.copyfile(input_path, output_path)
+        return True
+
+    monkeypatch.setattr(assembler_module, "remux_to_ts", fake_remux_to_ts)
+    monkeypatch.setattr(assembler_module, "remux_to_mp4", fake_remux_to_mp4)
+    return offsets
+
+
+def write_clips(tmp_path, count):
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"shot_{index}.mp4"
+        path.write_bytes(f"<clip {index}>".encode())
+        paths.append(path)
+    return paths
+
+
+def test_shots_finishing_out_of_order_are_appended_in_sequence(tmp_path, remux):
+    """Each shot lands at its timeline position once its predecessors are in."""
+    clips = write_clips(tmp_path, 3)
+    playlist = HLSPlaylist(tmp_path / "hls")
+    assembler = ShotAssembler(tmp_path / "final.mp4", tmp_path / "assembly", playlist)
+
+    for index in (2, 0, 1):
+        assembler.add(index, make_shot(index), clips[index])
+
+    assert assembler.finish(clips)
+    assert (tmp_path / "final.mp4").read_bytes() == b"<clip 0><clip 1><clip 2>"
+    assert remux == [0.0, 2.0, 4.0]
+
+    # Every appended shot was published live
+    assert (tmp_path / "hls" / "segment_0002.ts").read_bytes() == b"<clip 2>"
+    assert playlist.path.read_text().endswith("#EXT-X-ENDLIST\n")
+
+    assembler.close()
+    assert not (tmp_path / "assembly").exists()
+
+
+def test_crossfades_only_encode_transition_windows(tmp_path, remux, monkeypatch):
+    """Interiors are copied as shots arrive; windows are encoded between them."""
+    clips = write_clips(tmp_path, 2)
+    rendered = []
+
+    def fake_render(piece, input_paths, output_path, offset, transition_duration, has_audio):
+        rendered.append((piece["type"], offset))
+        output_path.write_bytes(f"<{piece['type']}>".encode())
+        return True
+
+    monkeypatch.setattr(assembler_module, "probe_inputs", lambda paths: [
+        {"duration": 4.0, "has_audio": False, "video": ("h264", "yuv420p", 64, 64, 8.0)}
+    ])
+    monkeypatch.setattr(assembler_module, "get_keyframe_times", lambda path: [0.0, 1.0, 3.0])
+    monkeypatch.setattr(assembler_module, "render_crossfade_piece", fake_render)
+
+    assembler = ShotAssembler(tmp_path / "final.mp4", tmp_path / "assembly")
+    for index, clip in enumerate(clips):
+        assembler.add(index, make_shot(index, transition_duration=0.5), clip)
+
+    assert assembler.finish(clips)
+    assert rendered == [("copy", 0.0), ("encode", 3.0), ("copy", 4.5), ("copy", 6.5)]
+    assert (tmp_path / "final.mp4").read_bytes() == b"<copy><encode><copy><copy>"
+
+
+def test_crossfade_jobs_without_smart_render_are_left_to_the_caller(tmp_path, remux, monkeypatch):
+    """Without smart rendering, transitions are joined in one pass at the end."""
+    monkeypatch.setattr(type(config), "SMART_CROSSFADE", False)
+    clips = write_clips(tmp_path, 2)
+    assembler = ShotAssembler(tmp_path / "final.mp4", tmp_path / "assembly")
+
+    for index, clip in enumerate(clips):
+        assembler.add(index, make_shot(index, transition_duration=0.5), clip)
+
+    assert not assembler.finish(clips)
+    assert remux == []
+    assert not (tmp_path / "final.mp4").exists()
+
+
+def test_missing_shots_fall_back_to_a_full_join(tmp_path, remux):
+    """finish refuses to write a video that lacks any of the final shots."""
+    clips = write_clips(tmp_path, 2)
+    playlist = HLSPlaylist(tmp_path / "hls")
+    assembler = ShotAssembler(tmp_path / "final.mp4", tmp_path / "assembly", playlist)
+
+    assembler.add(0, make_shot(0), clips[0])
+
+    assert not assembler.finish(clips)
+    # The partial live stream is withdrawn before the fallback join
+    assert not playlist.path.exists()
+
+
+def test_unfinished_jobs_leave_no_live_playlist(tmp_path, remux):
+    """A job that fails or is cancelled mid-render removes its playlist."""
+    clips = write_clips(tmp_path, 2)
+    playlist = HLSPlaylist(tmp_path / "hls")
+    assembler = ShotAssembler(tmp_path / "final.mp4", tmp_path / "assembly", playlist)
+
+    assembler.add(0, make_shot(0), clips[0])
+    deadline = time.monotonic() + 5
+    while not playlist.path.exists():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    assembler.close()
+
+    assert not (tmp_path / "hls").exists()
@@ -0,0 +1,36 @@
+"""Tests for the shared background event loop."""
+
+import asyncio
+import threading
+import time
+
+from video_engine.utils.async_runner import CallbackRelay, get_loop, run_async
+
+
+def test_relayed_callbacks_run_on_the_waiting_thread():
+    """Slow callbacks run in order on the caller and never stall the loop."""
+    calls = []
+
+    def slow_callback(step, progress):
+        calls.append((step, progress, threading.current_thread()))
+        time.sleep(0.1)
+
+    async def generate(progress_callback):
+        for progress in (10.0, 50.0, 100.0):
+            progress_callback("Rendering", progress)
+            await asyncio.sleep(0)
+        return "done"
+
+    async def heartbeat():
+        await asyncio.sleep(0.01)
+        return time.monotonic()
+
+    relay = CallbackRelay(slow_callback)
+    started = time.monotonic()
+    # The loop keeps serving other coroutines while callbacks run
+    beat = asyncio.run_coroutine_threadsafe(heartbeat(), get_loop())
+
+    assert run_async(generate(relay), relay) == "done"
+    assert beat.result() - started < 0.1
+    assert [progress for _, progress, _ in calls] == [10.0, 50.0, 100.0]
+    assert all(thread is threading.current_thread() for _, _, thread in calls)
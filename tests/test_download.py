@@ -0,0 +1,78 @@
+"""Tests for the video download endpoint."""
+
+import hashlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from video_engine.config import config
+from video_engine.models.schemas import VideoJob
+
+
+VIDEO_BYTES = b"\x00\x00\x00\x18ftypmp42" + b"x" * 1000
+
+
+@pytest.fixture
+def download(workspace, monkeypatch):
+    """Serve one completed job from a temporary output directory."""
+    monkeypatch.setattr(type(config), "VIDEO_ACCEL_REDIRECT_PREFIX", "")
+
+    from video_api.routes import jobs
+
+    output_path = workspace / "videos" / "job_1" / "final_output.mp4"
+    output_path.parent.mkdir(parents=True)
+    output_path.write_bytes(VIDEO_BYTES)
+
+    job = VideoJob(id="job_1", user_prompt="a forest")
+    job.mark_completed(str(output_path), sha256=hashlib.sha256(VIDEO_BYTES).hexdigest())
+    monkeypatch.setattr(jobs.orchestrator, "get_job", lambda job_id: job if job_id == job.id else None)
+
+    app = FastAPI()
+    app.include_router(jobs.router, prefix="/api/v1")
+    return TestClient(app), job
+
+
+def test_completed_video_has_a_strong_etag(download):
+    client, job = download
+
+    response = client.get("/api/v1/jobs/job_1/video")
+
+    assert response.status_code == 200
+    assert response.content == VIDEO_BYTES
+    assert response.headers["etag"] == f'"{job.output_video_sha256}"'
+    assert "immutable" in response.headers["cache-control"]
+
+
+def test_matching_if_none_match_is_not_modified(download):
+    client, job = download
+
+    response = client.get("/api/v1/jobs/job_1/video", headers={"If-None-Match": f'W/"other", "{job.output_video_sha256}"'})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == f'"{job.output_video_sha256}"'
+
+
+def test_proxy_offload_sends_x_accel_redirect(download, monkeypatch):
+    client, _ = download
+    monkeypatch.setattr(type(config), "VIDEO_ACCEL_REDIRECT_PREFIX", "/protected/")
+
+    response = client.get("/api/v1/jobs/job_1/video")
+
+    assert response.status_code == 200
+    assert response.headers["x-accel-redirect"] == "/protected/job_1/final_output.mp4"
+    assert response.content == b""
+
+
+def test_jobs_without_a_hash_are_not_cached_immutably(download):
+    """Videos completed before hashes were recorded get no validator."""
+    client, job = download
+    job.output_video_sha256 = None
+
+    response = client.get("/api/v1/jobs/job_1/video")
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+    assert "immutable" not in response.headers["cache-control"]
+    assert "last-modified" in response.headers
@@ -0,0 +1,112 @@
+"""Tests for streamed, content-addressed upload storage."""
+
+import os
+import time
+
+import pytest
+
+from video_engine.config import config
+from video_engine.storage.file_manager import FileManager, UploadWriter, UploadTooLargeError
+from video_engine.storage.upload_store import UploadStore, file_id_for
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(type(config), "VIDEO_UPLOAD_DIR", tmp_path / "uploads")
+    return tmp_path / "uploads"
+
+
+def write_upload(data: bytes, filename: str = "ref.PNG", max_bytes: int = 1024):
+    writer = UploadWriter(filename, max_bytes=max_bytes)
+    for start in range(0, len(data), 100):
+        writer.write(data[start:start + 100])
+    return writer.finish()
+
+
+def test_identical_uploads_are_stored_once(upload_dir):
+    path, digest, deduplicated = write_upload(b"x" * 500)
+    assert path == upload_dir / digest[:2] / digest[2:4] / f"{digest}.png"
+    assert path.read_bytes() == b"x" * 500
+    assert not deduplicated
+
+    assert write_upload(b"x" * 500, "other.png") == (path, digest, True)
+    assert write_upload(b"y" * 500)[0] != path
+    assert len([p for p in upload_dir.rglob("*") if p.is_file()]) == 2
+
+
+def test_same_bytes_under_another_extension_reuse_the_stored_file(upload_dir, tmp_path):
+    """Re-uploading as .jpeg keeps the .jpg file, so it stays tracked."""
+    store = UploadStore(tmp_path / "uploads.db")
+    path, digest, _ = write_upload(b"x" * 500, "ref.jpg")
+    store.register(path, digest, "ref.jpg", 500)
+
+    again, _, deduplicated = write_upload(b"x" * 500, "ref.jpeg")
+
+    assert (again, deduplicated) == (path, True)
+    assert store.register(again, digest, "ref.jpeg", 500)["path"] == str(path)
+    assert [p for p in upload_dir.rglob("*") if p.is_file()] == [path]
+
+
+def test_oversized_upload_is_aborted_early(upload_dir):
+    """The limit is enforced while streaming and leaves nothing behind."""
+    writer = UploadWriter("ref.png", max_bytes=250)
+    writer.write(b"x" * 200)
+
+    with pytest.raises(UploadTooLargeError):
+        writer.write(b"x" * 100)
+
+    assert list(upload_dir.iterdir()) == []
+
+
+def test_uploads_are_reference_counted(upload_dir, tmp_path):
+    """Uploads used by a job survive purges until the job releases them."""
+    store = UploadStore(tmp_path / "uploads.db")
+    path, digest, _ = write_upload(b"x" * 500)
+    record = store.register(path, digest, "ref.png", 500)
+    assert record["id"] == file_id_for(digest)
+    assert store.register(path, digest, "again.png", 500)["id"] == record["id"]
+
+    assert store.acquire(record["id"], "job_a") == path
+    store.acquire(record["id"], "job_b")
+    assert store.get(record["id"])["refcount"] == 2
+
+    store.release_job("job_a")
+    assert store.purge_unreferenced() == []
+
+    store.release_job("job_b")
+    assert store.purge_unreferenced() == [record["id"]]
+    assert not path.exists()
+    with pytest.raises(ValueError):
+        store.acquire(record["id"], "job_c")
+
+
+def test_cleanup_releases_uploads_of_expired_jobs(upload_dir, tmp_path, monkeypatch):
+    """Uploads used only by expired jobs become purgeable in the same pass."""
+    monkeypatch.setattr(type(config), "VIDEO_OUTPUT_DIR", tmp_path / "videos")
+    monkeypatch.setattr(type(config), "TEMP_DIR", tmp_path / "temp")
+    monkeypatch.setattr(type(config), "UPLOADS_DB_PATH", tmp_path / "uploads.db")
+    (tmp_path / "temp").mkdir()
+    store = UploadStore()
+    path, digest, _ = write_upload(b"x" * 500)
+    record = store.register(path, digest, "ref.png", 500)
+    store.acquire(record["id"], "job_old")
+
+    job_dir = tmp_path / "videos" / "job_old"
+    job_dir.mkdir(parents=True)
+    old = time.time() - 30 * 86400
+    os.utime(job_dir, (old, old))
+    store.db.connection().execute("UPDATE uploads SET uploaded_at = ?", (old,))
+
+    FileManager.cleanup_old_files(days=7)
+
+    assert not job_dir.exists()
+    assert store.get(record["id"]) is None
+    assert not path.exists()
+
+
+def test_hls_dir_lookup_creates_no_directories(tmp_path, monkeypatch):
+    """Checking for a job's playlist leaves no empty job directory behind."""
+    monkeypatch.setattr(type(config), "VIDEO_OUTPUT_DIR", tmp_path / "videos")
+
+    assert FileManager.get_hls_dir("job_a") == tmp_path / "videos" / "job_a" / "hls"
+    assert not (tmp_path / "videos").exists()
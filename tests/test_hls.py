@@ -0,0 +1,51 @@
+"""Tests for live HLS playlists."""
+
+from video_engine.storage.hls import HLSPlaylist
+from video_engine.config import config
+
+
+def test_playlist_grows_with_each_segment_and_ends(tmp_path):
+    """Segments are moved in and listed; ending adds ENDLIST."""
+    playlist = HLSPlaylist(tmp_path / "hls", target_duration=4)
+
+    for number, duration in enumerate([2.0, 3.25]):
+        segment = tmp_path / f"piece_{number}.ts"
+        segment.write_bytes(b"ts")
+        playlist.publish(segment, duration)
+        assert not segment.exists()
+
+    text = playlist.path.read_text()
+    assert "#EXT-X-PLAYLIST-TYPE:EVENT" in text
+    assert "#EXT-X-TARGETDURATION:4" in text
+    assert "#EXTINF:2.000,\nsegment_0000.ts\n#EXT-X-DISCONTINUITY\n#EXTINF:3.250,\nsegment_0001.ts" in text
+    assert "#EXT-X-ENDLIST" not in text
+    assert (tmp_path / "hls" / "segment_0001.ts").read_bytes() == b"ts"
+
+    playlist.end()
+    assert playlist.path.read_text().endswith("#EXT-X-ENDLIST\n")
+
+
+def test_target_duration_is_fixed_at_creation(tmp_path, monkeypatch):
+    """The announced target duration does not change as segments arrive."""
+    monkeypatch.setattr(type(config), "HLS_TARGET_DURATION", 6)
+    playlist = HLSPlaylist(tmp_path / "hls")
+    assert "#EXT-X-TARGETDURATION:6\n" in playlist.render()
+
+    segment = tmp_path / "piece.ts"
+    segment.write_bytes(b"ts")
+    playlist.publish(segment, 1.5)
+
+    assert "#EXT-X-TARGETDURATION:6\n" in playlist.path.read_text()
+
+
+def test_reset_removes_an_earlier_run(tmp_path):
+    """Retried jobs start from an empty playlist."""
+    playlist = HLSPlaylist(tmp_path / "hls")
+    segment = tmp_path / "piece.ts"
+    segment.write_bytes(b"ts")
+    playlist.publish(segment, 1.0)
+
+    playlist.reset()
+
+    assert not playlist.path.exists()
+    assert "segment_" not in playlist.render()
@@ -0,0 +1,94 @@
+"""Tests for the pooled HTTP layer and streaming downloads."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from video_engine.utils.http import download_file, IncompleteDownloadError, PooledTransport
+
+
+VIDEO = bytes(range(256)) * 40
+
+
+async def body(data: bytes):
+    """Stream response content the way a network connection would."""
+    yield data
+
+
+def run_download(handler, dest, **kwargs) -> int:
+    """Download through a mock transport."""
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await download_file("https://cdn.example/video.mp4", dest, client=client, **kwargs)
+    return asyncio.run(scenario())
+
+
+def test_interrupted_download_resumes_with_range(tmp_path):
+    """A short response is completed with a Range request."""
+    ranges = []
+
+    def handler(request):
+        ranges.append(request.headers.get("range"))
+        if "range" not in request.headers:
+            # Connection drops after 1000 bytes
+            return httpx.Response(200, headers={"content-length": str(len(VIDEO))}, content=body(VIDEO[:1000]))
+        start = int(request.headers["range"].split("=")[1].rstrip("-"))
+        return httpx.Response(
+            206,
+            headers={"content-range": f"bytes {start}-{len(VIDEO) - 1}/{len(VIDEO)}"},
+            content=body(VIDEO[start:]),
+        )
+
+    dest = tmp_path / "shot.mp4"
+    written = run_download(handler, dest, chunk_size=256)
+
+    assert written == len(VIDEO)
+    assert dest.read_bytes() == VIDEO
+    assert ranges == [None, "bytes=1000-"]
+
+
+def test_ignored_range_restarts(tmp_path):
+    """Servers that answer a Range request with 200 are downloaded from scratch."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        data = VIDEO[:500] if len(calls) == 1 else VIDEO
+        return httpx.Response(200, headers={"content-length": str(len(VIDEO))}, content=body(data))
+
+    dest = tmp_path / "shot.mp4"
+    run_download(handler, dest)
+
+    assert dest.read_bytes() == VIDEO
+
+
+def test_failed_download_removes_partial_file(tmp_path):
+    """Nothing is left behind when every attempt fails."""
+    def handler(request):
+        return httpx.Response(200, headers={"content-length": "100"}, content=body(b"x" * 10))
+
+    dest = tmp_path / "shot.mp4"
+    with pytest.raises(IncompleteDownloadError):
+        run_download(handler, dest, max_attempts=2)
+
+    assert not dest.exists()
+
+
+def test_pooled_transport_caps_connections_per_host():
+    """A host at its connection cap makes further requests wait; others are unaffected."""
+    transport = PooledTransport(max_per_host=1, http2=False)
+    transport._sync_transport = httpx.MockTransport(lambda request: httpx.Response(200, content=iter([b"ok"])))
+    client = httpx.Client(transport=transport, timeout=httpx.Timeout(5.0, pool=0.1))
+
+    with client.stream("GET", "https://a.example/one"):
+        with pytest.raises(httpx.PoolTimeout):
+            client.get("https://a.example/two")
+        assert client.get("https://b.example/").status_code == 200
+
+    # Closing the first response frees the slot
+    assert client.get("https://a.example/two").status_code == 200
+
+    # Closing a client leaves the shared pool usable
+    client.close()
+    assert httpx.Client(transport=transport).get("https://a.example/").status_code == 200
@@ -0,0 +1,63 @@
+"""Tests for preprocessed upload variants."""
+
+import pytest
+from PIL import Image
+
+from video_engine.storage.image_variants import ImageVariantStore, dhash
+
+
+def test_variants_are_built_once_per_content(tmp_path):
+    """Each target resolution is fitted once; identical files share an entry."""
+    store = ImageVariantStore(tmp_path / "variants")
+    source = tmp_path / "ref.png"
+    Image.new("RGBA", (2048, 2048), (255, 0, 0, 255)).save(source)
+
+    metadata = store.process(source, {"svd": (1024, 576), "other": None})
+
+    assert (metadata["width"], metadata["height"]) == (2048, 2048)
+    assert len(metadata["dhash"]) == 16
+    assert metadata["variants"]["1024x576"]["width"] == 576
+    variant = store.variant_for(source, "svd", (1024, 576))
+    with Image.open(variant) as image:
+        assert image.size == (576, 576)
+        assert image.mode == "RGB"
+
+    # A copy of the same file reuses the stored variants
+    copy = tmp_path / "copy.png"
+    copy.write_bytes(source.read_bytes())
+    mtime = variant.stat().st_mtime_ns
+    assert store.variant_for(copy, "svd", (1024, 576)) == variant
+    assert variant.stat().st_mtime_ns == mtime
+
+
+def test_model_ready_images_keep_their_bytes(tmp_path):
+    store = ImageVariantStore(tmp_path / "variants")
+    source = tmp_path / "ref.jpg"
+    Image.new("RGB", (1024, 576), "blue").save(source)
+
+    variant = store.variant_for(source, "svd", (1024, 576))
+
+    assert variant.suffix == ".jpg"
+    assert variant.read_bytes() == source.read_bytes()
+
+
+def test_decompression_bombs_are_rejected_before_storing(tmp_path, monkeypatch):
+    """Images over PIL's pixel limit raise without leaving an entry behind."""
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 1000)
+    store = ImageVariantStore(tmp_path / "variants")
+    source = tmp_path / "bomb.png"
+    Image.new("RGB", (100, 100)).save(source)
+
+    with pytest.raises(Image.DecompressionBombError):
+        store.process(source, {"svd": (1024, 576)})
+
+    assert not list((tmp_path / "variants").rglob("*"))
+
+
+def test_dhash_tolerates_resizing():
+    """Resized copies of an image have (nearly) the same perceptual hash."""
+    image = Image.linear_gradient("L").convert("RGB")
+    small = image.resize((64, 64))
+
+    distance = bin(int(dhash(image), 16) ^ int(dhash(small), 16)).count("1")
+    assert distance <= 4
@@ -0,0 +1,71 @@
+"""Tests for the in-memory job cache."""
+
+from video_engine.models.schemas import VideoJob
+from video_engine.storage.job_cache import JobCache
+from video_engine.storage.job_store import JobStore
+
+
+def test_repeat_reads_are_cached(tmp_path):
+    """Unchanged jobs are served from memory."""
+    store = JobStore(tmp_path)
+    store.save_job(VideoJob(id="job_a", user_prompt="test"))
+    cache = JobCache(store, max_size=4, revalidate_interval=60.0)
+
+    first = cache.get("job_a")
+    (tmp_path / "job_a.json").unlink()
+    second = cache.get("job_a")
+
+    assert second is first
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_writes_invalidate_entries(tmp_path):
+    """Snapshots and progress writes bump the version and force a reload."""
+    store = JobStore(tmp_path)
+    job = VideoJob(id="job_a", user_prompt="test")
+    store.save_job(job)
+    cache = JobCache(store, max_size=4, revalidate_interval=0.0)
+    cache.get("job_a")
+
+    job.update_progress("Generating shot 1/2", 40.0, "shot_1")
+    store.save_progress(job, force=True)
+
+    assert cache.get("job_a").progress_percentage == 40.0
+    assert cache.stats()["misses"] == 2
+
+    assert cache.get("job_a").progress_percentage == 40.0
+    assert cache.stats()["hits"] == 1
+
+
+def test_deleted_job_is_dropped(tmp_path):
+    """A job removed from the store is not served from the cache."""
+    store = JobStore(tmp_path)
+    store.save_job(VideoJob(id="job_a", user_prompt="test"))
+    cache = JobCache(store, max_size=4, revalidate_interval=0.0)
+    cache.get("job_a")
+
+    store.delete_job("job_a")
+
+    assert cache.get("job_a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_least_recently_used_is_evicted(tmp_path):
+    """The cache stays within its size bound."""
+    store = JobStore(tmp_path)
+    for job_id in ("job_a", "job_b", "job_c"):
+        store.save_job(VideoJob(id=job_id, user_prompt="test"))
+    cache = JobCache(store, max_size=2, revalidate_interval=60.0)
+
+    cache.get("job_a")
+    cache.get("job_b")
+    cache.get("job_a")
+    cache.get("job_c")
+
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+
+    cache.get("job_a")
+    assert cache.stats()["hits"] == 2
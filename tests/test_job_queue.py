@@ -0,0 +1,133 @@
+"""Tests for the persistent job queue."""
+
+import threading
+import time
+
+from video_engine.storage.job_queue import JobQueue, QueueState
+
+
+def test_enqueue_and_claim(tmp_path):
+    """Jobs are claimed oldest first and only once."""
+    queue = JobQueue(tmp_path / "queue.db")
+    queue.enqueue("job_a")
+    queue.enqueue("job_b")
+
+    first = queue.claim("worker-1", visibility_timeout=60)
+    second = queue.claim("worker-2", visibility_timeout=60)
+
+    assert first == {"job_id": "job_a", "attempts": 1}
+    assert second == {"job_id": "job_b", "attempts": 1}
+    assert queue.claim("worker-3", visibility_timeout=60) is None
+
+
+def test_expired_lease_is_reclaimed(tmp_path):
+    """A job whose worker stops heartbeating becomes visible again."""
+    queue = JobQueue(tmp_path / "queue.db")
+    queue.enqueue("job_a")
+
+    queue.claim("worker-1", visibility_timeout=0.05)
+    time.sleep(0.1)
+
+    lease = queue.claim("worker-2", visibility_timeout=60)
+    assert lease == {"job_id": "job_a", "attempts": 2}
+
+    # The original worker has lost its lease
+    assert not queue.heartbeat("job_a", "worker-1")
+    assert queue.heartbeat("job_a", "worker-2")
+
+
+def test_complete_and_fail(tmp_path):
+    """Finished jobs leave the queue; only the lease holder can finish them."""
+    queue = JobQueue(tmp_path / "queue.db")
+    queue.enqueue("job_a")
+    queue.enqueue("job_b")
+    queue.claim("worker-1")
+    queue.claim("worker-1")
+
+    queue.complete("job_a", "someone-else")
+    assert queue.is_pending("job_a")
+
+    queue.complete("job_a", "worker-1")
+    queue.fail("job_b", "worker-1", "boom")
+
+    assert not queue.is_pending("job_a")
+    assert queue.stats()[QueueState.DONE] == 1
+    assert queue.stats()[QueueState.FAILED] == 1
+
+
+def test_enqueue_does_not_reset_active_lease(tmp_path):
+    """Re-enqueueing a leased job leaves the lease alone."""
+    queue = JobQueue(tmp_path / "queue.db")
+    queue.enqueue("job_a")
+    queue.claim("worker-1", visibility_timeout=60)
+
+    queue.enqueue("job_a")
+
+    assert queue.claim("worker-2", visibility_timeout=60) is None
+
+
+def test_events_are_read_after_cursor(tmp_path):
+    """Events are returned in order after the given cursor."""
+    queue = JobQueue(tmp_path / "queue.db")
+    queue.publish_event("job_a", "progress", {"step": "one", "progress": 10.0})
+    cursor = queue.last_event_id()
+    queue.publish_event("job_a", "progress", {"step": "two", "progress": 20.0})
+
+    events = queue.read_events(cursor)
+
+    assert [e["payload"]["step"] for e in events] == ["two"]
+    assert events[0]["job_id"] == "job_a"
+
+
+def test_worker_stops_renewing_lease_of_stalled_job(tmp_path, monkeypatch):
+    """A job without progress loses its lease instead of holding it forever."""
+    from video_engine.config import config
+    from video_engine.core.worker import QueueWorker
+
+    monkeypatch.setattr(type(config), "QUEUE_VISIBILITY_TIMEOUT", 3.0)
+    monkeypatch.setattr(type(config), "QUEUE_STALL_TIMEOUT", 0.5)
+
+    queue = JobQueue(tmp_path / "queue.db")
+    queue.enqueue("job_a")
+    queue.claim("worker-1", visibility_timeout=3.0)
+
+    renewals = []
+    monkeypatch.setattr(queue, "heartbeat", lambda job_id, worker_id: renewals.append(job_id) or True)
+
+    # Skip __init__ so no orchestrator is built
+    worker = QueueWorker.__new__(QueueWorker)
+    worker.worker_id = "worker-1"
+    worker.queue = queue
+    worker._last_activity = time.monotonic() - 1.0
+
+    done = threading.Event()
+    heartbeat = threading.Thread(target=worker._heartbeat, args=("job_a", done))
+    heartbeat.start()
+    heartbeat.join(timeout=5.0)
+    done.set()
+
+    assert not heartbeat.is_alive()
+    assert renewals == []
+
+
+def test_only_one_worker_pool_runs_per_workspace(tmp_path, monkeypatch):
+    """A second pool (e.g. another uvicorn worker's) does not start."""
+    from video_engine.config import config
+    from video_engine.core import worker
+    from video_engine.core.worker import WorkerPool
+
+    monkeypatch.setattr(type(config), "WORKER_POOL_LOCK_PATH", tmp_path / "workers.lock")
+    monkeypatch.setattr(type(config), "QUEUE_DB_PATH", tmp_path / "queue.db")
+    monkeypatch.setattr(worker, "recover_orphaned_jobs", lambda queue: [])
+    monkeypatch.setattr(WorkerPool, "_start_worker", lambda self, index: None)
+
+    first = WorkerPool(num_workers=1)
+    second = WorkerPool(num_workers=1)
+
+    assert first.start()
+    assert not second.start()
+
+    # The lock is released when the running pool stops
+    first.stop()
+    assert second.start()
+    second.stop()
@@ -0,0 +1,169 @@
+"""Tests for job persistence and the job index."""
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from video_engine.config import config
+from video_engine.models.schemas import VideoJob, JobStatus
+from video_engine.storage.job_store import JobStore
+
+
+def make_jobs(store: JobStore, count: int) -> list:
+    """Save jobs with increasing creation times; returns them newest first."""
+    base = datetime(2024, 1, 1)
+    jobs = []
+    for i in range(count):
+        job = VideoJob(
+            id=f"job_{i:03d}",
+            user_prompt=f"prompt {i}",
+            created_at=base + timedelta(minutes=i),
+            status=JobStatus.COMPLETED if i % 2 else JobStatus.QUEUED,
+        )
+        store.save_job(job)
+        jobs.append(job)
+    return list(reversed(jobs))
+
+
+def test_query_jobs_keyset_pagination(tmp_path):
+    """Cursor pagination walks every job exactly once, newest first."""
+    store = JobStore(tmp_path)
+    expected = [job.id for job in make_jobs(store, 7)]
+
+    seen = []
+    cursor = None
+    while True:
+        job_ids, cursor = store.query_jobs(limit=3, cursor=cursor)
+        seen.extend(job_ids)
+        if cursor is None:
+            break
+
+    assert seen == expected
+
+
+def test_query_jobs_filters_by_status(tmp_path):
+    """Status filtering and counts use the index."""
+    store = JobStore(tmp_path)
+    make_jobs(store, 6)
+
+    job_ids, cursor = store.query_jobs(status=JobStatus.COMPLETED, limit=10)
+
+    assert job_ids == ["job_005", "job_003", "job_001"]
+    assert cursor is None
+    assert store.count_jobs(JobStatus.COMPLETED) == 3
+    assert store.count_jobs() == 6
+
+
+def test_query_jobs_offset(tmp_path):
+    """Page-number access is still supported."""
+    store = JobStore(tmp_path)
+    make_jobs(store, 5)
+
+    job_ids, _ = store.query_jobs(limit=2, offset=2)
+
+    assert job_ids == ["job_002", "job_001"]
+
+
+def test_invalid_cursor(tmp_path):
+    """Malformed cursors are rejected."""
+    store = JobStore(tmp_path)
+
+    with pytest.raises(ValueError):
+        store.query_jobs(cursor="not-a-cursor")
+
+
+def test_index_is_rebuilt_from_json(tmp_path):
+    """A store opened over existing JSON documents imports them."""
+    store = JobStore(tmp_path)
+    make_jobs(store, 3)
+    (tmp_path / "index.db").unlink()
+    for suffix in ("-wal", "-shm"):
+        (tmp_path / f"index.db{suffix}").unlink(missing_ok=True)
+
+    reopened = JobStore(tmp_path)
+
+    assert reopened.count_jobs() == 3
+    assert reopened.query_jobs(limit=1)[0] == ["job_002"]
+
+
+def test_delete_job_removes_index_row(tmp_path):
+    """Deleted jobs disappear from listings."""
+    store = JobStore(tmp_path)
+    make_jobs(store, 2)
+
+    assert store.delete_job("job_001")
+
+    assert store.query_jobs()[0] == ["job_000"]
+
+
+def test_query_job_summaries(tmp_path):
+    """Summaries come from the index without loading job documents."""
+    store = JobStore(tmp_path)
+    make_jobs(store, 2)
+    (tmp_path / "job_001.json").unlink()
+
+    summaries, _ = store.query_job_summaries()
+
+    assert [s.id for s in summaries] == ["job_001", "job_000"]
+    assert summaries[0].status == JobStatus.COMPLETED
+    assert summaries[0].user_prompt == "prompt 1"
+    assert summaries[0].created_at == datetime(2024, 1, 1, 0, 1)
+
+
+def test_save_progress_is_coalesced(tmp_path, monkeypatch):
+    """Progress ticks inside the interval are skipped unless forced."""
+    monkeypatch.setattr(type(config), "PROGRESS_WRITE_INTERVAL", 60.0)
+    store = JobStore(tmp_path)
+    job = VideoJob(id="job_a", user_prompt="test")
+    store.save_job(job)
+
+    job.update_progress("Tick", 20.0)
+    assert not store.save_progress(job)
+
+    job.update_progress("Shot started", 30.0, "shot_1")
+    assert store.save_progress(job, force=True)
+
+
+def test_coalesced_progress_is_written_when_the_interval_ends(tmp_path, monkeypatch):
+    """The last tick inside the interval is not lost."""
+    monkeypatch.setattr(type(config), "PROGRESS_WRITE_INTERVAL", 0.1)
+    store = JobStore(tmp_path)
+    job = VideoJob(id="job_a", user_prompt="test")
+    store.save_job(job)
+
+    for percentage in (20.0, 25.0, 30.0):
+        job.update_progress("Generating shot 1/2", percentage, "shot_1")
+        assert not store.save_progress(job)
+
+    deadline = time.monotonic() + 5
+    while store.load_job("job_a").progress_percentage != 30.0:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_load_job_overlays_progress(tmp_path, monkeypatch):
+    """Progress written after the last snapshot is visible to readers."""
+    monkeypatch.setattr(type(config), "PROGRESS_WRITE_INTERVAL", 0.0)
+    store = JobStore(tmp_path)
+    job = VideoJob(id="job_a", user_prompt="test")
+    store.save_job(job)
+    snapshot = (tmp_path / "job_a.json").read_text()
+
+    job.update_progress("Generating shot 1/2", 40.0, "shot_1")
+    store.save_progress(job)
+
+    loaded = store.load_job("job_a")
+    assert (tmp_path / "job_a.json").read_text() == snapshot
+    assert loaded.current_step == "Generating shot 1/2"
+    assert loaded.progress_percentage == 40.0
+    assert loaded.current_shot_id == "shot_1"
+
+
+def test_save_job_leaves_no_temp_files(tmp_path):
+    """Snapshots are written via temp file and rename."""
+    store = JobStore(tmp_path)
+    store.save_job(VideoJob(id="job_a", user_prompt="test"))
+
+    assert not list(tmp_path.glob("*.tmp"))
+    assert store.load_job("job_a").id == "job_a"
@@ -0,0 +1,50 @@
+"""Tests for incremental storyboard JSON parsing."""
+
+import json
+
+from video_engine.llm.json_stream import SequenceBuffer, ShotStreamParser
+
+
+DOCUMENT = "```json\n" + json.dumps({
+    "title": "A [tricky] {title}",
+    "shots": [
+        {"sequence_number": 1, "text_prompt": "a \"quoted\" } brace", "tags": [1, 2]},
+        {"sequence_number": 2, "text_prompt": "second", "nested": {"shots": [{"x": 1}]}},
+    ],
+    "style": {"mood": "calm"},
+}) + "\n```"
+
+
+def test_items_are_emitted_as_they_close():
+    """Each shot is returned by the chunk that completes it."""
+    parser = ShotStreamParser()
+    emitted = []
+
+    for i, char in enumerate(DOCUMENT):
+        for item in parser.feed(char):
+            emitted.append((item["sequence_number"], i))
+
+    assert [seq for seq, _ in emitted] == [1, 2]
+    # The first shot is available long before the document ends
+    assert emitted[0][1] < DOCUMENT.index('"sequence_number": 2')
+    assert parser.text == DOCUMENT
+
+
+def test_large_chunks_emit_all_items():
+    """Several items completed by one chunk are returned together."""
+    parser = ShotStreamParser()
+
+    items = parser.feed(DOCUMENT[:len(DOCUMENT) // 2]) + parser.feed(DOCUMENT[len(DOCUMENT) // 2:])
+
+    assert [item["text_prompt"] for item in items] == ['a "quoted" } brace', "second"]
+
+
+def test_sequence_buffer_releases_in_sequence_order():
+    """Out-of-order items wait for their predecessors; gaps flush at the end."""
+    buffer = SequenceBuffer()
+
+    assert buffer.push(2, "b") == []
+    assert buffer.push(1, "a") == ["a", "b"]
+    assert buffer.push(5, "e") == []
+    assert buffer.push(3, "c") == ["c"]
+    assert buffer.flush() == ["e"]
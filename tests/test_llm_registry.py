@@ -0,0 +1,61 @@
+"""Tests for the shared LLM client registry."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from video_engine.llm.registry import LLMRegistry
+
+
+class FakeClient:
+    """LLM client stand-in counting constructions."""
+
+    created = 0
+
+    def __init__(self):
+        FakeClient.created += 1
+
+    def is_available(self) -> bool:
+        return True
+
+
+@pytest.fixture
+def llms():
+    FakeClient.created = 0
+    registry = LLMRegistry()
+    registry.register("fake", FakeClient)
+    return registry
+
+
+def test_clients_are_created_once_and_shared(llms):
+    """Concurrent callers all get the same lazily created client."""
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        clients = list(pool.map(lambda _: llms.get_client("fake"), range(32)))
+
+    assert FakeClient.created == 1
+    assert all(client is clients[0] for client in clients)
+
+
+def test_failed_clients_are_retried(llms):
+    """A client that cannot be created is not cached."""
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ValueError("API key not configured")
+        return FakeClient()
+
+    llms.register("flaky", flaky)
+
+    assert "flaky" not in llms.list_available()
+    assert "flaky" in llms.list_available()
+    assert "fake" in llms.list_available()
+    assert FakeClient.created == 2
+
+
+def test_unknown_llm(llms):
+    with pytest.raises(ValueError):
+        llms.get_client("nope")
+    with pytest.raises(NotImplementedError):
+        llms.get_client("openai")
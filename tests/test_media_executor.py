@@ -0,0 +1,152 @@
+"""Tests for the shared media process executor."""
+
+import sys
+import time
+import threading
+import subprocess
+import multiprocessing
+
+import pytest
+
+from video_engine.utils import media_executor as media_executor_module
+from video_engine.utils.media_executor import ENCODE, SHORT, MediaExecutor
+from video_engine.storage.media_slots import MediaSlotStore
+
+
+@pytest.fixture
+def processes(monkeypatch):
+    """Fake subprocess.run: each command blocks until its name is released."""
+    started = []
+    release = {}
+    lock = threading.Lock()
+
+    def fake_run(cmd, **kwargs):
+        name = cmd[-1]
+        with lock:
+            started.append(cmd)
+            event = release.setdefault(name, threading.Event())
+        event.wait(5)
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    def finish(name):
+        with lock:
+            release.setdefault(name, threading.Event()).set()
+
+    monkeypatch.setattr(media_executor_module.subprocess, "run", fake_run)
+    return started, finish
+
+
+def start(executor, name, kind):
+    thread = threading.Thread(target=executor.run, args=(["ffmpeg", "-i", "in.mp4", name], kind))
+    thread.start()
+    return thread
+
+
+def wait_until(condition):
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_encodes_split_the_cores(tmp_path, processes):
+    """Each encode gets -threads for its share of the cores."""
+    started, finish = processes
+    executor = MediaExecutor(cpu_count=8, max_encodes=2, max_processes=4, slots=MediaSlotStore(tmp_path / "media.db"))
+
+    threads = [start(executor, "a.mp4", ENCODE)]
+    wait_until(lambda: len(started) == 1)
+    threads.append(start(executor, "b.mp4", ENCODE))
+    wait_until(lambda: len(started) == 2)
+
+    assert started[0][-3:] == ["-threads", "8", "a.mp4"]
+    assert started[1][-3:] == ["-threads", "4", "b.mp4"]
+
+    for name in ("a.mp4", "b.mp4"):
+        finish(name)
+    for thread in threads:
+        thread.join()
+
+    stats = executor.stats()
+    assert stats[ENCODE]["completed"] == 2
+    assert stats[ENCODE]["running"] == 0
+
+
+def test_waiting_short_operations_go_before_encodes(tmp_path, processes):
+    """A freed slot goes to a probe even if an encode has waited longer."""
+    started, finish = processes
+    executor = MediaExecutor(cpu_count=4, max_encodes=2, max_processes=3, slots=MediaSlotStore(tmp_path / "media.db"))
+
+    threads = [
+        start(executor, "encode_1", ENCODE),
+        start(executor, "short_1", SHORT),
+        start(executor, "short_2", SHORT),
+    ]
+    wait_until(lambda: len(started) == 3)
+
+    threads.append(start(executor, "encode_2", ENCODE))
+    wait_until(lambda: executor.stats()[ENCODE]["waiting"] == 1)
+    threads.append(start(executor, "short_3", SHORT))
+    wait_until(lambda: executor.stats()[SHORT]["waiting"] == 1)
+
+    finish("short_1")
+    wait_until(lambda: len(started) == 4)
+    assert started[3][-1] == "short_3"
+
+    for name in ("encode_1", "short_2", "short_3", "encode_2"):
+        finish(name)
+    for thread in threads:
+        thread.join()
+
+    assert [cmd[-1] for cmd in started][-1] == "encode_2"
+    assert executor.stats()[SHORT]["completed"] == 3
+
+
+def _encode_in_worker(db_path, command, output):
+    """Worker-process body: one encode through its own executor instance."""
+    executor = MediaExecutor(cpu_count=4, max_encodes=1, max_processes=4, slots=MediaSlotStore(db_path))
+    executor.run([command, "-i", "in.mp4", output], ENCODE, check=True)
+
+
+def test_limits_hold_across_processes(tmp_path):
+    """Executors in different processes share one set of slots and metrics."""
+    log_path = tmp_path / "encodes.log"
+    command = tmp_path / "fake_ffmpeg"
+    command.write_text(
+        f"#!{sys.executable}\n"
+        "import sys, time\n"
+        f"log = open({str(log_path)!r}, 'a', buffering=1)\n"
+        "log.write(f'start {time.time()} {sys.argv[sys.argv.index(\"-threads\") + 1]}\\n')\n"
+        "time.sleep(0.3)\n"
+        "log.write(f'end {time.time()} 0\\n')\n"
+    )
+    command.chmod(0o755)
+
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(target=_encode_in_worker, args=(tmp_path / "media.db", str(command), f"out_{index}.mp4"))
+        for index in range(3)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(30)
+        assert worker.exitcode == 0
+
+    # Encodes never overlapped, and each used the whole core budget
+    events = sorted(
+        (float(stamp), name, threads)
+        for name, stamp, threads in (line.split() for line in log_path.read_text().splitlines())
+    )
+    running = peak = 0
+    for _, name, _ in events:
+        running += 1 if name == "start" else -1
+        peak = max(peak, running)
+    assert peak == 1
+    assert [threads for _, name, threads in events if name == "start"] == ["4", "4", "4"]
+
+    # Another process (the API) sees the workers' metrics
+    stats = MediaExecutor(cpu_count=4, max_encodes=1, max_processes=4, slots=MediaSlotStore(tmp_path / "media.db")).stats()
+    assert stats[ENCODE]["completed"] == 3
+    assert stats[ENCODE]["running"] == 0
+    assert stats[ENCODE]["queue_wait_max"] > 0
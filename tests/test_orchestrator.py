@@ -0,0 +1,220 @@
+"""Tests for the video orchestrator shot pipeline."""
+
+import time
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from video_engine.config import config
+from video_engine.core.orchestrator import VideoOrchestrator
+from video_engine.models.adapters.base import BaseModelAdapter
+from video_engine.models.registry import registry
+from video_engine.models.schemas import (
+    Shot,
+    Storyboard,
+    VideoJob,
+    ModelCapabilities,
+    MemoryRequirements,
+    VideoGenerationResult,
+)
+
+
+class FakeAdapter(BaseModelAdapter):
+    """Adapter that writes placeholder files instead of calling a model."""
+
+    def __init__(self, model_id: str = "fake:model", delays: dict = None):
+        super().__init__(model_id)
+        self.delays = delays or {}
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def is_available(self) -> bool:
+        return True
+
+    def get_capabilities(self) -> ModelCapabilities:
+        return ModelCapabilities(supports_text_to_video=True)
+
+    def generate_video(self, prompt, *, progress_callback=None, **kwargs) -> VideoGenerationResult:
+        with self._lock:
+            self.calls.append(prompt)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+        try:
+            if progress_callback:
+                progress_callback("Rendering", 50.0)
+            time.sleep(self.delays.get(prompt, 0.01))
+
+            output_path = config.TEMP_DIR / f"{prompt}.mp4"
+            output_path.write_text(prompt)
+            return VideoGenerationResult(
+                success=True,
+                output_path=str(output_path),
+                duration_seconds=kwargs.get("num_frames", 81) / kwargs.get("fps", 8),
+            )
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def estimate_time(self, shot: Shot) -> float:
+        return 0.0
+
+    def get_memory_requirements(self) -> MemoryRequirements:
+        return MemoryRequirements(vram_gb=0.0, ram_gb=0.0, disk_space_gb=0.0)
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    """Register a fake adapter for the duration of a test."""
+    fake = FakeAdapter(delays={"shot-1": 0.15, "shot-2": 0.05, "shot-3": 0.01})
+    monkeypatch.setitem(registry._adapters, fake.model_id, fake)
+    return fake
+
+
+def make_job(num_shots: int, model_id: str = "fake:model", **kwargs) -> VideoJob:
+    """Build a job with a ready-made storyboard."""
+    shots = [
+        Shot(
+            id=f"shot_{i}",
+            sequence_number=i,
+            duration_seconds=3.0,
+            description=f"Shot {i}",
+            text_prompt=f"shot-{i}",
+            model_id=model_id,
+        )
+        for i in range(1, num_shots + 1)
+    ]
+    storyboard = Storyboard(
+        id="storyboard_test",
+        title="Test",
+        user_prompt="test",
+        shots=shots,
+        total_duration_seconds=3.0 * num_shots,
+        shot_count=num_shots,
+        generated_at=datetime.now(),
+        generated_by="test",
+    )
+    return VideoJob(id="job_test", user_prompt="test", model_id=model_id, storyboard=storyboard, **kwargs)
+
+
+def test_generate_shots_concurrently_keeps_order(workspace, adapter):
+    """Shots render in parallel but come back in storyboard order."""
+    orchestrator = VideoOrchestrator()
+    job = make_job(3, shot_parallelism=3)
+
+    shot_videos = orchestrator._generate_shots(job)
+
+    assert [p.name for p in shot_videos] == ["shot_1.mp4", "shot_2.mp4", "shot_3.mp4"]
+    assert [Path(p).read_text() for p in shot_videos] == ["shot-1", "shot-2", "shot-3"]
+    assert job.intermediate_videos == [str(p) for p in shot_videos]
+    assert adapter.max_active > 1
+
+
+def test_generate_shots_respects_parallelism(workspace, adapter):
+    """A parallelism of one renders shots strictly one at a time."""
+    orchestrator = VideoOrchestrator()
+    job = make_job(3, shot_parallelism=1)
+
+    orchestrator._generate_shots(job)
+
+    assert adapter.max_active == 1
+
+
+def test_generate_shots_progress_is_monotonic(workspace, adapter):
+    """Combined progress never decreases and ends at the shot-stage ceiling."""
+    orchestrator = VideoOrchestrator()
+    job = make_job(3, shot_parallelism=3)
+    reported = []
+
+    orchestrator._generate_shots(job, lambda step, pct, shot_id: reported.append(pct))
+
+    assert reported == sorted(reported)
+    assert reported[-1] == pytest.approx(85.0)
+    assert job.progress_percentage == 85.0
+
+
+def test_identical_shots_reuse_cached_render(workspace, adapter):
+    """Re-running a storyboard is served from the render cache."""
+    orchestrator = VideoOrchestrator()
+    orchestrator._generate_shots(make_job(2))
+
+    rerun = make_job(2)
+    rerun.id = "job_rerun"
+    shot_videos = orchestrator._generate_shots(rerun)
+
+    assert sorted(adapter.calls) == ["shot-1", "shot-2"]
+    assert [Path(p).read_text() for p in shot_videos] == ["shot-1", "shot-2"]
+    assert orchestrator.render_cache.stats()["hits"] == 2
+
+
+def test_streamed_storyboard_overlaps_rendering(workspace, adapter, monkeypatch):
+    """The first shot renders while later shots are still being written."""
+    storyboard = make_job(3).storyboard
+    started_during_stream = []
+
+    class StreamingGenerator:
+        def __init__(self, llm, cache=None):
+            pass
+
+        def generate(self, user_prompt, max_shots, style_preferences=None, use_cache=True, on_shot=None):
+            for shot in storyboard.shots:
+                on_shot(shot)
+                time.sleep(0.05)
+            started_during_stream.extend(adapter.calls)
+            return storyboard
+
+    monkeypatch.setattr("video_engine.core.orchestrator.StoryboardGenerator", StreamingGenerator)
+    orchestrator = VideoOrchestrator()
+    job = make_job(0, shot_parallelism=3)
+    job.storyboard = None
+
+    shot_videos = orchestrator._stream_storyboard_and_shots(job)
+
+    assert "shot-1" in started_during_stream
+    assert [p.name for p in shot_videos] == ["shot_1.mp4", "shot_2.mp4", "shot_3.mp4"]
+    assert job.storyboard is storyboard
+    assert job.progress_percentage == 85.0
+
+
+def test_boundary_frames_of_different_shots_extract_concurrently(workspace, monkeypatch):
+    """Frame extraction is serialized per frame, not across the orchestrator."""
+    from video_engine.core import orchestrator as orchestrator_module
+
+    orchestrator = VideoOrchestrator()
+    job = make_job(2)
+    active = []
+    overlapped = threading.Event()
+    lock = threading.Lock()
+
+    def fake_extract(video_path, frame_path):
+        with lock:
+            active.append(frame_path)
+            if len(active) > 1:
+                overlapped.set()
+        overlapped.wait(1)
+        frame_path.parent.mkdir(parents=True, exist_ok=True)
+        frame_path.write_bytes(b"png")
+        with lock:
+            active.remove(frame_path)
+        return True
+
+    monkeypatch.setattr(orchestrator_module, "extract_last_frame", fake_extract)
+
+    threads = [
+        threading.Thread(
+            target=orchestrator._extract_boundary_frame,
+            args=(job, shot_id, Path(f"{shot_id}.mp4"), "last"),
+        )
+        for shot_id in ("shot_1", "shot_2")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert overlapped.is_set()
+    assert orchestrator._frame_locks == {}
@@ -0,0 +1,138 @@
+"""Tests for waiting on remote predictions."""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from video_engine.config import config
+from video_engine.models.adapters.predictions import PredictionWaiter
+from video_engine.storage.prediction_store import PredictionStore
+from video_api.routes import webhooks
+from video_api.routes.webhooks import verify_replicate_signature
+
+
+@pytest.fixture
+def fast_polling(monkeypatch):
+    """Shrink polling intervals so tests run quickly."""
+    monkeypatch.setattr(type(config), "PREDICTION_POLL_INITIAL", 0.01)
+    monkeypatch.setattr(type(config), "PREDICTION_POLL_MAX", 0.02)
+
+
+def test_polls_until_terminal(tmp_path, fast_polling):
+    """Without webhooks the provider is polled until the prediction ends."""
+    waiter = PredictionWaiter(PredictionStore(tmp_path / "predictions.db"))
+    states = iter(["starting", "processing", "succeeded"])
+    updates = []
+
+    async def reload():
+        return {"id": "p1", "status": next(states), "output": "https://example/video.mp4"}
+
+    result = asyncio.run(waiter.wait("p1", reload, on_update=updates.append))
+
+    assert result["status"] == "succeeded"
+    assert [u["status"] for u in updates] == ["starting", "processing"]
+
+
+def test_webhook_wakes_waiter(tmp_path, monkeypatch):
+    """A delivered webhook triggers an immediate fetch from the provider."""
+    monkeypatch.setattr(type(config), "PREDICTION_POLL_INITIAL", 60.0)
+    waiter = PredictionWaiter(PredictionStore(tmp_path / "predictions.db"))
+    polls = []
+
+    async def reload():
+        polls.append(1)
+        return {"id": "p1", "status": "succeeded", "output": "https://provider/video.mp4"}
+
+    async def scenario():
+        task = asyncio.create_task(waiter.wait("p1", reload, webhook=True))
+        await asyncio.sleep(0.05)
+        await asyncio.to_thread(waiter.deliver, {"id": "p1", "status": "succeeded"})
+        return await asyncio.wait_for(task, 5)
+
+    assert asyncio.run(scenario())["output"] == "https://provider/video.mp4"
+    assert polls == [1]
+
+
+def test_webhook_payload_is_not_trusted(tmp_path, monkeypatch):
+    """Status and output come from the provider, not from the delivery."""
+    monkeypatch.setattr(type(config), "PREDICTION_POLL_INITIAL", 0.05)
+    monkeypatch.setattr(type(config), "PREDICTION_POLL_MAX", 0.05)
+    waiter = PredictionWaiter(PredictionStore(tmp_path / "predictions.db"))
+    states = iter(["processing", "processing", "succeeded"])
+
+    async def reload():
+        return {"id": "p1", "status": next(states), "output": "https://provider/video.mp4"}
+
+    async def scenario():
+        task = asyncio.create_task(waiter.wait("p1", reload, webhook=True))
+        await asyncio.sleep(0.01)
+        await asyncio.to_thread(
+            waiter.deliver, {"id": "p1", "status": "succeeded", "output": "https://attacker/video.mp4"}
+        )
+        return await asyncio.wait_for(task, 5)
+
+    assert asyncio.run(scenario())["output"] == "https://provider/video.mp4"
+
+
+def test_webhook_from_other_process_is_seen(tmp_path, monkeypatch):
+    """Deliveries recorded by another process wake the waiter via the store."""
+    monkeypatch.setattr(type(config), "PREDICTION_POLL_INITIAL", 30.0)
+    store = PredictionStore(tmp_path / "predictions.db")
+    waiter = PredictionWaiter(store)
+    PredictionStore(tmp_path / "predictions.db").record({"id": "p1", "status": "failed", "error": "boom"})
+    states = iter(["failed"])
+
+    async def reload():
+        return {"id": "p1", "status": next(states), "error": "provider error"}
+
+    result = asyncio.run(asyncio.wait_for(waiter.wait("p1", reload, webhook=True), 5))
+
+    assert result["error"] == "provider error"
+
+
+def test_verify_replicate_signature():
+    """Signatures follow the standard-webhooks scheme."""
+    key = b"secret-key"
+    secret = "whsec_" + base64.b64encode(key).decode()
+    body = b'{"id": "p1"}'
+    timestamp = str(int(time.time()))
+    signature = base64.b64encode(
+        hmac.new(key, f"msg_1.{timestamp}.".encode() + body, hashlib.sha256).digest()
+    ).decode()
+    headers = {
+        "webhook-id": "msg_1",
+        "webhook-timestamp": timestamp,
+        "webhook-signature": f"v1,invalid v1,{signature}",
+    }
+
+    assert verify_replicate_signature(headers, body, secret)
+    assert not verify_replicate_signature(headers, b'{"id": "p2"}', secret)
+
+
+def test_webhook_endpoint_requires_a_secret(monkeypatch):
+    """Deliveries are refused unless they are signed with the configured secret."""
+    app = FastAPI()
+    app.include_router(webhooks.router)
+    client = TestClient(app)
+    body = b'{"id": "p1", "status": "succeeded"}'
+
+    monkeypatch.setattr(type(config), "REPLICATE_WEBHOOK_SECRET", "")
+    assert client.post("/webhooks/replicate", content=body).status_code == 404
+
+    monkeypatch.setattr(type(config), "REPLICATE_WEBHOOK_SECRET", "whsec_" + base64.b64encode(b"key").decode())
+    assert client.post("/webhooks/replicate", content=body).status_code == 401
+
+
+def test_webhook_url_without_secret_is_rejected(monkeypatch):
+    """Enabling webhooks without a signing secret fails the startup check."""
+    monkeypatch.setattr(type(config), "REPLICATE_WEBHOOK_URL", "https://example.com/api/v1/webhooks/replicate")
+    monkeypatch.setattr(type(config), "REPLICATE_WEBHOOK_SECRET", "")
+
+    with pytest.raises(ValueError):
+        config.validate_webhooks()
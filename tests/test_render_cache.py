@@ -0,0 +1,75 @@
+"""Tests for the shot render cache."""
+
+import os
+
+from video_engine.models.schemas import Shot
+from video_engine.storage.render_cache import RenderCache
+
+
+def make_shot(**kwargs) -> Shot:
+    """Build a shot with default generation settings."""
+    fields = dict(
+        id="shot_1",
+        sequence_number=1,
+        duration_seconds=3.0,
+        description="Shot",
+        text_prompt="a forest",
+    )
+    fields.update(kwargs)
+    return Shot(**fields)
+
+
+def test_key_depends_on_parameters_and_image_contents(tmp_path):
+    """Keys ignore shot identity and image paths but not settings or pixels."""
+    cache = RenderCache(tmp_path / "cache", max_bytes=1024)
+    image_a = tmp_path / "a.png"
+    image_b = tmp_path / "b.png"
+    image_a.write_bytes(b"frame")
+    image_b.write_bytes(b"frame")
+
+    key = cache.key_for_shot(make_shot(reference_image_path=str(image_a)))
+
+    assert key == cache.key_for_shot(make_shot(id="shot_9", reference_image_path=str(image_b)))
+    assert key != cache.key_for_shot(make_shot(reference_image_path=str(image_a), seed=7))
+
+    image_b.write_bytes(b"other frame")
+    assert key != cache.key_for_shot(make_shot(reference_image_path=str(image_b)))
+
+
+def test_store_and_fetch(tmp_path):
+    """Stored renders are materialized at the requested path."""
+    cache = RenderCache(tmp_path / "cache", max_bytes=1024)
+    render = tmp_path / "render.mp4"
+    render.write_bytes(b"video")
+    key = cache.key_for_shot(make_shot())
+
+    assert not cache.fetch(key, tmp_path / "out" / "miss.mp4")
+    cache.store(key, render)
+    assert cache.fetch(key, tmp_path / "out" / "hit.mp4")
+
+    assert (tmp_path / "out" / "hit.mp4").read_bytes() == b"video"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    """The cache is trimmed to its size bound, oldest access first."""
+    cache = RenderCache(tmp_path / "cache", max_bytes=100)
+    keys = []
+    for i in range(3):
+        render = tmp_path / f"render_{i}.mp4"
+        render.write_bytes(b"x" * 10)
+        key = cache.key_for_shot(make_shot(text_prompt=f"prompt {i}"))
+        cache.store(key, render)
+        entry = cache._entry_path(key)
+        os.utime(entry, (i, i))
+        keys.append(key)
+
+    # Reading the first entry makes the second one the oldest
+    cache.fetch(keys[0], tmp_path / "out.mp4")
+    cache.max_bytes = 20
+    assert cache.evict() == 1
+
+    assert cache.fetch(keys[0], tmp_path / "out.mp4")
+    assert not cache.fetch(keys[1], tmp_path / "out.mp4")
+    assert cache.stats()["entries"] == 2
@@ -0,0 +1,108 @@
+"""Tests for dependency-aware shot scheduling."""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from video_engine.core.shot_scheduler import (
+    ShotScheduler,
+    ShotDependencyError,
+    build_shot_dag,
+)
+from video_engine.models.schemas import Shot
+
+
+def make_shot(shot_id: str, sequence_number: int, first_from: str = None, last_from: str = None) -> Shot:
+    """Build a minimal shot."""
+    return Shot(
+        id=shot_id,
+        sequence_number=sequence_number,
+        duration_seconds=3.0,
+        description=shot_id,
+        text_prompt=shot_id,
+        first_frame_from_shot=first_from,
+        last_frame_from_shot=last_from,
+    )
+
+
+def test_build_shot_dag():
+    """Conditioning links become parent sets."""
+    dag = build_shot_dag([
+        make_shot("a", 1),
+        make_shot("b", 2, first_from="a"),
+        make_shot("c", 3, first_from="b", last_from="a"),
+    ])
+
+    assert dag == {"a": set(), "b": {"a"}, "c": {"a", "b"}}
+
+
+def test_build_shot_dag_rejects_unknown_parent():
+    """Links to shots outside the storyboard are rejected."""
+    with pytest.raises(ShotDependencyError):
+        build_shot_dag([make_shot("a", 1, first_from="missing")])
+
+
+def test_build_shot_dag_rejects_cycle():
+    """Cyclic conditioning links are rejected."""
+    with pytest.raises(ShotDependencyError):
+        build_shot_dag([
+            make_shot("a", 1, first_from="b"),
+            make_shot("b", 2, first_from="a"),
+        ])
+
+
+def test_scheduler_runs_children_after_parents():
+    """Dependent shots start after their parent; independent shots overlap."""
+    events = []
+    lock = threading.Lock()
+
+    def run_shot(shot, parent_outputs):
+        with lock:
+            events.append(("start", shot.id, sorted(parent_outputs)))
+        time.sleep(0.05)
+        with lock:
+            events.append(("end", shot.id))
+        return Path(f"{shot.id}.mp4")
+
+    shots = [
+        make_shot("a", 1),
+        make_shot("b", 2, first_from="a"),
+        make_shot("c", 3),
+    ]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        scheduler = ShotScheduler(executor, run_shot)
+        for shot in shots:
+            scheduler.add(shot)
+        scheduler.seal()
+        outputs = scheduler.wait()
+
+    assert outputs == {s.id: Path(f"{s.id}.mp4") for s in shots}
+    assert events.index(("end", "a")) < events.index(("start", "b", ["a"]))
+    # "c" has no parents, so it starts before "a" finishes
+    assert events.index(("start", "c", [])) < events.index(("end", "a"))
+
+
+def test_scheduler_propagates_failure():
+    """A failing shot fails the whole schedule and its children never run."""
+    started = []
+
+    def run_shot(shot, parent_outputs):
+        started.append(shot.id)
+        if shot.id == "a":
+            raise RuntimeError("render failed")
+        return Path(f"{shot.id}.mp4")
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        scheduler = ShotScheduler(executor, run_shot)
+        scheduler.add(make_shot("a", 1))
+        scheduler.add(make_shot("b", 2, first_from="a"))
+        scheduler.seal()
+
+        with pytest.raises(RuntimeError, match="render failed"):
+            scheduler.wait()
+
+    assert "b" not in started
@@ -0,0 +1,70 @@
+"""Tests for smart-render crossfade planning."""
+
+from video_engine.utils.smart_render import piece_duration, plan_crossfade
+
+
+def test_interiors_are_copied_between_keyframes():
+    """Only the ranges around each transition are encoded."""
+    pieces = plan_crossfade([4.0, 4.0], [[0.0, 1.0, 3.0], [0.0, 1.0, 3.0]], 0.5)
+
+    assert pieces == [
+        {"type": "copy", "clip": 0, "start": 0.0, "end": 3.0},
+        {"type": "encode", "clips": [(0, 3.0, 4.0), (1, 0.0, 1.0)]},
+        {"type": "copy", "clip": 1, "start": 1.0, "end": 3.0},
+        # The last clip's tail is only known to need no fade once it is last
+        {"type": "copy", "clip": 1, "start": 3.0, "end": 4.0},
+    ]
+    assert sum(piece_duration(p, 0.5) for p in pieces) == 7.5
+
+
+def test_clips_without_usable_keyframes_join_the_transition_window():
+    """A clip with a single keyframe is encoded whole with both of its fades."""
+    pieces = plan_crossfade(
+        [4.0, 2.0, 4.0],
+        [[0.0, 2.0], [0.0], [0.0, 1.0]],
+        0.5,
+    )
+
+    assert pieces == [
+        {"type": "copy", "clip": 0, "start": 0.0, "end": 2.0},
+        {"type": "encode", "clips": [(0, 2.0, 4.0), (1, 0.0, 2.0), (2, 0.0, 1.0)]},
+        {"type": "copy", "clip": 2, "start": 1.0, "end": 4.0},
+    ]
+    assert sum(piece_duration(p, 0.5) for p in pieces) == 9.0
+
+
+def test_nothing_is_copied_when_no_clip_has_spare_keyframes():
+    """Short single-GOP clips degrade to encoding the whole timeline."""
+    pieces = plan_crossfade([2.0, 2.0], [[0.0], [0.0]], 0.5)
+
+    assert [p["type"] for p in pieces] == ["encode"]
+    assert piece_duration(pieces[0], 0.5) == 3.5
+
+
+def test_long_transition_windows_are_split_outside_the_fades():
+    """Encodes spanning several whole clips stay within the segment limit."""
+    durations = [10.0, 10.0, 10.0, 10.0]
+    pieces = plan_crossfade(durations, [[0.0]] * 4, 0.5, max_encode_duration=10.0)
+
+    assert all(p["type"] == "encode" for p in pieces)
+    assert all(piece_duration(p, 0.5) <= 10.0 + 1e-9 for p in pieces)
+    assert sum(piece_duration(p, 0.5) for p in pieces) == 38.5
+    assert pieces[0] == {"type": "encode", "clips": [(0, 0.0, 10.0), (1, 0.0, 0.5)]}
+
+    # Cuts are never inside a fade: every range next to a fade covers it
+    for piece in pieces:
+        clips = piece["clips"]
+        for (_, start, end), (_, next_start, next_end) in zip(clips, clips[1:]):
+            assert end - start >= 0.5 and next_end - next_start >= 0.5
+
+
+def test_short_transition_windows_are_not_split():
+    """The limit only splits windows that exceed it."""
+    pieces = plan_crossfade(
+        [4.0, 2.0, 4.0],
+        [[0.0, 2.0], [0.0], [0.0, 1.0]],
+        0.5,
+        max_encode_duration=10.0,
+    )
+
+    assert [p["type"] for p in pieces] == ["copy", "encode", "copy"]
@@ -0,0 +1,103 @@
+"""Tests for storyboard memoization."""
+
+import time
+from datetime import datetime
+
+from video_engine.llm.base import BaseLLMClient
+from video_engine.llm.storyboard_generator import StoryboardGenerator
+from video_engine.models.schemas import Shot, Storyboard
+from video_engine.storage.storyboard_cache import StoryboardCache
+
+
+def make_storyboard(prompt: str = "A forest") -> Storyboard:
+    """Build a two-shot storyboard whose second shot continues the first."""
+    shots = [
+        Shot(id="shot_a", sequence_number=1, duration_seconds=3.0, description="One", text_prompt="one"),
+        Shot(
+            id="shot_b",
+            sequence_number=2,
+            duration_seconds=3.0,
+            description="Two",
+            text_prompt="two",
+            first_frame_from_shot="shot_a",
+        ),
+    ]
+    return Storyboard(
+        id="storyboard_a",
+        title="Forest",
+        user_prompt=prompt,
+        shots=shots,
+        total_duration_seconds=6.0,
+        shot_count=2,
+        generated_at=datetime.now(),
+        generated_by="test",
+    )
+
+
+class CountingClient(BaseLLMClient):
+    """LLM client that counts storyboard requests."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def is_available(self) -> bool:
+        return True
+
+    def generate_storyboard(self, user_prompt, max_shots=5, style_preferences=None, on_shot=None) -> Storyboard:
+        self.calls += 1
+        return make_storyboard(user_prompt)
+
+
+def make_generator(tmp_path, monkeypatch) -> StoryboardGenerator:
+    """Build a generator backed by a counting client and a temp cache."""
+    monkeypatch.setattr(StoryboardGenerator, "_get_client", lambda self, llm: CountingClient())
+    return StoryboardGenerator(cache=StoryboardCache(tmp_path / "storyboards.db"))
+
+
+def test_hit_returns_copy_with_fresh_ids(tmp_path):
+    """Cached storyboards get new IDs with shot links remapped."""
+    cache = StoryboardCache(tmp_path / "storyboards.db")
+    key = cache.make_key("A forest", 5)
+    cache.put(key, make_storyboard())
+
+    storyboard = cache.get(key, "a  FOREST")
+
+    assert storyboard.id != "storyboard_a"
+    assert storyboard.user_prompt == "a  FOREST"
+    first, second = storyboard.shots
+    assert first.id not in ("shot_a", "shot_b")
+    assert second.first_frame_from_shot == first.id
+
+
+def test_key_normalizes_prompt_but_not_parameters():
+    """Whitespace and case don't matter; shots and style do."""
+    key = StoryboardCache.make_key("A forest", 5, {"mood": "calm"})
+
+    assert key == StoryboardCache.make_key("  a   Forest ", 5, {"mood": "calm"})
+    assert key != StoryboardCache.make_key("A forest", 4, {"mood": "calm"})
+    assert key != StoryboardCache.make_key("A forest", 5, {"mood": "dark"})
+
+
+def test_entries_expire_and_are_bounded(tmp_path):
+    """TTL and entry count limits are enforced."""
+    cache = StoryboardCache(tmp_path / "storyboards.db", ttl=0.05, max_entries=2)
+    for prompt in ("one", "two", "three"):
+        cache.put(cache.make_key(prompt, 5), make_storyboard(prompt))
+
+    assert cache.stats()["entries"] == 2
+    assert cache.get(cache.make_key("one", 5), "one") is None
+
+    time.sleep(0.1)
+    assert cache.get(cache.make_key("three", 5), "three") is None
+
+
+def test_generator_uses_cache_unless_bypassed(tmp_path, monkeypatch):
+    """Repeated prompts skip the LLM; use_cache=False forces a new call."""
+    generator = make_generator(tmp_path, monkeypatch)
+
+    generator.generate("A forest")
+    generator.generate("a forest")
+    assert generator.client.calls == 1
+
+    generator.generate("A forest", use_cache=False)
+    assert generator.client.calls == 2
@@ -0,0 +1,62 @@
+"""Tests for in-memory image handoff to Replicate."""
+
+import io
+import asyncio
+from types import SimpleNamespace
+
+from PIL import Image
+
+from video_engine.models.adapters.uploads import UploadCache, encode_image
+
+
+class FakeFiles:
+    """Replicate files API stand-in recording uploads."""
+
+    def __init__(self):
+        self.uploads = []
+
+    async def async_create(self, file, **params):
+        self.uploads.append(file.read())
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(urls={"get": f"https://files.example/{len(self.uploads)}"}, expires_at=None)
+
+
+def test_acceptable_files_are_passed_through(tmp_path):
+    """RGB JPEGs are sent byte-for-byte; other images become PNG in memory."""
+    jpeg = tmp_path / "ref.jpg"
+    Image.new("RGB", (16, 16), "red").save(jpeg)
+    assert encode_image(jpeg) == (jpeg.read_bytes(), "image/jpeg")
+
+    rgba = tmp_path / "ref.png"
+    Image.new("RGBA", (16, 16)).save(rgba)
+    data, content_type = encode_image(rgba)
+    assert content_type == "image/png"
+    assert Image.open(io.BytesIO(data)).mode == "RGB"
+
+
+def test_small_images_are_inlined():
+    client = SimpleNamespace(files=FakeFiles())
+    cache = UploadCache(inline_max_bytes=1024 * 1024)
+
+    url = asyncio.run(cache.resolve(client, Image.new("RGB", (8, 8))))
+
+    assert url.startswith("data:image/png;base64,")
+    assert client.files.uploads == []
+
+
+def test_identical_images_are_uploaded_once(tmp_path):
+    """Concurrent and later requests for the same image reuse one upload."""
+    client = SimpleNamespace(files=FakeFiles())
+    cache = UploadCache(inline_max_bytes=0)
+    image = tmp_path / "ref.png"
+    Image.new("RGB", (32, 32), "blue").save(image)
+
+    async def scenario():
+        urls = await asyncio.gather(*(cache.resolve(client, image) for _ in range(4)))
+        urls.append(await cache.resolve(client, image))
+        return urls
+
+    urls = asyncio.run(scenario())
+
+    assert set(urls) == {"https://files.example/1"}
+    assert client.files.uploads == [image.read_bytes()]
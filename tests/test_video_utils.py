@@ -0,0 +1,121 @@
+"""Tests for the ffmpeg concatenation helpers."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from video_engine.utils import video_utils
+from video_engine.utils.media_executor import media_executor
+from video_engine.utils.video_utils import build_crossfade_filter, probe_inputs
+from video_engine.storage.media_slots import MediaSlotStore
+
+
+@pytest.fixture(autouse=True)
+def media_slots(tmp_path, monkeypatch):
+    """Keep the process-wide executor's slots out of the real workspace."""
+    monkeypatch.setattr(media_executor, "_slots", MediaSlotStore(tmp_path / "media.db"))
+
+
+def test_crossfade_offsets_accumulate_along_the_output_timeline():
+    """Each transition starts where the already-joined clips end, minus the fade."""
+    filter_complex, audio = build_crossfade_filter([2.0, 3.0, 4.0], 0.5)
+
+    assert not audio
+    assert filter_complex.split(";") == [
+        "[0:v][1:v]xfade=transition=fade:duration=0.5:offset=1.500[0v]",
+        "[0v][2:v]xfade=transition=fade:duration=0.5:offset=4.000[outv]",
+    ]
+
+
+def test_crossfade_pads_clips_without_audio_with_silence():
+    """Audio is crossfaded too; silent clips contribute silence of their length."""
+    filter_complex, audio = build_crossfade_filter([2.0, 3.0], 0.5, [True, False])
+
+    assert audio
+    parts = filter_complex.split(";")
+    assert parts[0] == f"{video_utils.SILENCE_SOURCE},atrim=duration=3.0[silence1]"
+    assert "[0:a][silence1]acrossfade=d=0.5[outa]" in parts
+
+
+def test_single_clip_passes_through_the_filter():
+    """A window split down to one clip range is encoded without a fade."""
+    filter_complex, audio = build_crossfade_filter([4.0], 0.5, [True])
+
+    assert audio
+    assert filter_complex.split(";") == ["[0:v]null[outv]", "[0:a]anull[outa]"]
+
+
+def test_probe_inputs_parses_all_inputs_from_one_process(monkeypatch):
+    """Durations and audio presence come from a single ffmpeg invocation."""
+    stderr = (
+        "Input #0, mov,mp4,m4a,3gp,3g2,mj2, from 'a.mp4':\n"
+        "  Duration: 00:00:01.75, start: 0.000000, bitrate: 512 kb/s\n"
+        "  Stream #0:0[0x1](und): Video: h264, yuv420p, 1024x576, 8 fps\n"
+        "Input #1, mov,mp4,m4a,3gp,3g2,mj2, from 'b.mp4':\n"
+        "  Duration: 00:01:02.50, start: 0.000000, bitrate: 640 kb/s\n"
+        "  Stream #1:0[0x1](und): Video: h264, yuv420p, 1024x576, 8 fps\n"
+        "  Stream #1:1[0x2](und): Audio: aac (LC), 48000 Hz, stereo\n"
+        "At least one output file must be specified\n"
+    )
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 1, stdout="", stderr=stderr)
+
+    monkeypatch.setattr(video_utils.subprocess, "run", fake_run)
+
+    info = probe_inputs([Path("a.mp4"), Path("b.mp4")])
+
+    assert len(calls) == 1
+    assert info == [
+        {"duration": 1.75, "has_audio": False, "video": ("h264", "yuv420p", 1024, 576, 8.0)},
+        {"duration": 62.5, "has_audio": True, "video": ("h264", "yuv420p", 1024, 576, 8.0)},
+    ]
+
+
+def test_probe_inputs_fails_when_an_input_is_unreadable(monkeypatch):
+    """A missing header is an error rather than a silently wrong timeline."""
+    def fake_run(cmd, **kwargs):
+        return subprocess.CompletedProcess(cmd, 1, stdout="", stderr="a.mp4: No such file or directory\n")
+
+    monkeypatch.setattr(video_utils.subprocess, "run", fake_run)
+
+    with pytest.raises(RuntimeError):
+        probe_inputs([Path("a.mp4")])
+
+
+def test_simple_concat_list_files_are_unique_per_call(monkeypatch, tmp_path):
+    """Concurrent jobs all write final_output.mp4 but never share a list file."""
+    monkeypatch.setattr(type(video_utils.config), "TEMP_DIR", tmp_path)
+    list_files = []
+
+    def fake_run(cmd, **kwargs):
+        list_files.append(cmd[cmd.index("-i") + 1])
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(video_utils.subprocess, "run", fake_run)
+
+    for job in ("job_a", "job_b"):
+        video_utils._concat_simple([Path("a.mp4")], tmp_path / job / "final_output.mp4")
+
+    assert len(set(list_files)) == 2
+    assert not list(tmp_path.glob("concat_list_*"))
+
+
+def test_last_frame_is_read_from_the_end_of_the_stream(monkeypatch, tmp_path):
+    """The last frame does not depend on an estimated frame count."""
+    commands = []
+
+    def fake_run(cmd, **kwargs):
+        commands.append(cmd)
+        Path(cmd[-1]).write_bytes(b"png")
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(video_utils.subprocess, "run", fake_run)
+
+    assert video_utils.extract_last_frame(Path("shot.mp4"), tmp_path / "last.png")
+    assert commands[0][:3] == ["ffmpeg", "-sseof", "-1"]
+    assert "select" not in " ".join(commands[0])
+    assert commands[0][commands[0].index("-update") + 1] == "1"
@@ -0,0 +1,78 @@
+"""
+Relay of queue worker events to WebSocket clients.
+"""
+import asyncio
+from starlette.concurrency import run_in_threadpool
+
+from video_engine.storage.job_queue import JobQueue
+from video_engine.models.adapters.predictions import prediction_waiter
+from video_api.websocket_manager import ConnectionManager
+
+
+async def relay_queue_events(
+    queue: JobQueue,
+    manager: ConnectionManager,
+    poll_interval: float = 0.5,
+    purge_interval: float = 600.0,
+):
+    """
+    Forward events published by worker processes to WebSocket clients.
+
+    Runs until cancelled. Only events published after startup are relayed.
+
+    Args:
+        queue: Job queue workers publish to
+        manager: WebSocket connection manager
+        poll_interval: Seconds between polls for new events
+        purge_interval: Seconds between purges of old events and webhook
+            deliveries
+    """
+    cursor = await run_in_threadpool(queue.last_event_id)
+    loop = asyncio.get_running_loop()
+    next_purge = loop.time() + purge_interval
+
+    while True:
+        events = []
+        try:
+            events = await run_in_threadpool(queue.read_events, cursor)
+
+            for event in events:
+                cursor = event["id"]
+                await dispatch_event(manager, event)
+
+            if loop.time() >= next_purge:
+                await run_in_threadpool(queue.purge_events)
+                await run_in_threadpool(prediction_waiter.store.purge)
+                next_purge = loop.time() + purge_interval
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Event relay error: {e}")
+
+        if not events:
+            await asyncio.sleep(poll_interval)
+
+
+async def dispatch_event(manager: ConnectionManager, event: dict):
+    """
+    Send a single queue event to the job's WebSocket clients.
+
+    Args:
+        manager: WebSocket connection manager
+        event: Event dict from JobQueue.read_events
+    """
+    job_id = event["job_id"]
+    payload = event["payload"]
+
+    if event["type"] == "progress":
+        await manager.send_progress_update(
+            job_id=job_id,
+            step=payload["step"],
+            progress=payload["progress"],
+            shot_id=payload.get("shot_id"),
+        )
+    elif event["type"] == "job_complete":
+        await manager.send_job_complete(job_id, payload["output_path"])
+    elif event["type"] == "error":
+        await manager.send_error(job_id, payload["error"])
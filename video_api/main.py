@@ -3,6 +3,8 @@ FastAPI application for AI video generation.
 
 This API provides REST endpoints and WebSocket support for video generation.
 """
+import asyncio
+import mimetypes
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -10,7 +12,10 @@ from fastapi.staticfiles import StaticFiles
 import uvicorn
 
 from video_engine.config import config
-from video_api.routes import jobs, models, upload, health, websocket_route
+from video_engine.core.worker import WorkerPool
+from video_api.routes import jobs, models, upload, health, webhooks, websocket_route
+from video_api.event_relay import relay_queue_events
+from video_api.websocket_manager import manager
 
 
 @asynccontextmanager
@@ -18,8 +23,23 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
     print("🚀 Starting AI Video Generation API...")
+    config.validate_webhooks()
     config.ensure_directories()
     print(f"✓ Workspace directories initialized")
+
+    worker_pool = None
+    relay_task = None
+
+    if config.JOB_EXECUTION_MODE == "queue":
+        relay_task = asyncio.create_task(relay_queue_events(jobs.job_queue, manager))
+
+        if config.QUEUE_EMBEDDED_WORKERS:
+            worker_pool = WorkerPool()
+            if worker_pool.start():
+                print(f"✓ Started {worker_pool.num_workers} worker process(es)")
+            else:
+                print("✓ Worker pool already running in another process")
+
     print(f"✓ API running on http://{config.API_HOST}:{config.API_PORT}")
 
     yield
@@ -27,6 +47,14 @@ async def lifespan(app: FastAPI):
     # Shutdown
     print("👋 Shutting down AI Video Generation API...")
 
+    if relay_task:
+        relay_task.cancel()
+
+    if worker_pool:
+        worker_pool.stop()
+
+    jobs.job_executor.shutdown(wait=False, cancel_futures=True)
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -55,10 +83,12 @@ app.include_router(health.router, prefix="/api/v1", tags=["Health"])
 app.include_router(jobs.router, prefix="/api/v1", tags=["Jobs"])
 app.include_router(models.router, prefix="/api/v1", tags=["Models"])
 app.include_router(upload.router, prefix="/api/v1", tags=["Upload"])
+app.include_router(webhooks.router, prefix="/api/v1", tags=["Webhooks"])
 app.include_router(websocket_route.router, tags=["WebSocket"])
 
 
-# Serve generated videos as static files
+# Serve generated videos as static files (including live HLS segments)
+mimetypes.add_type("video/mp2t", ".ts")
 try:
     app.mount(
         "/videos",
@@ -3,15 +3,36 @@ Health check endpoints.
 """
 from datetime import datetime
 from fastapi import APIRouter
+from starlette.concurrency import run_in_threadpool
 
 from video_engine.config import config
 from video_engine.models.registry import registry
+from video_engine.llm.registry import llm_registry
+from video_engine.utils.media_executor import media_executor
 from video_api.schemas.responses import HealthResponse
+from video_api.routes.jobs import orchestrator
 
 
 router = APIRouter()
 
 
+def collect_cache_stats() -> dict:
+    """
+    Gather cache counters.
+
+    The render cache walks its directory and the storyboard cache queries
+    SQLite, so call this off the event loop.
+    """
+    return {
+        "jobs": orchestrator.job_cache.stats(),
+        "renders": orchestrator.render_cache.stats(),
+        **(
+            {"storyboards": orchestrator.storyboard_cache.stats()}
+            if orchestrator.storyboard_cache else {}
+        ),
+    }
+
+
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
     """
@@ -22,6 +43,10 @@ async def health_check():
     - Version
     - API keys configuration
     - Available models count
+    - Available LLM providers
+    - Cache hit/miss counters
+    - ffmpeg process queue and run-time metrics of all processes,
+      worker processes included
     """
     # Check API keys
     api_keys = config.validate_api_keys()
@@ -36,4 +61,7 @@ async def health_check():
         timestamp=datetime.now(),
         api_keys_configured=api_keys,
         models_available=models_count,
+        llms_available=llm_registry.list_available(),
+        caches=await run_in_threadpool(collect_cache_stats),
+        media=await run_in_threadpool(media_executor.stats),
     )
@@ -2,29 +2,80 @@
 Job management endpoints.
 """
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional, List
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from urllib.parse import quote
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request, Response
 from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
 
 from video_engine.core.orchestrator import VideoOrchestrator
 from video_engine.models.schemas import JobStatus
+from video_engine.storage.job_queue import JobQueue
+from video_engine.storage.file_manager import FileManager
+from video_engine.storage.hls import PLAYLIST_NAME
+from video_engine.config import config
 from video_api.schemas.requests import CreateJobRequest, UpdateJobRequest
-from video_api.schemas.responses import JobResponse, JobListResponse
+from video_api.schemas.responses import JobResponse, JobSummaryResponse, JobListResponse
 from video_api.websocket_manager import manager
 
 
 router = APIRouter()
 orchestrator = VideoOrchestrator()
+job_queue = JobQueue()
+
+# Dedicated threads for in-process execution so renders never run on the event loop
+job_executor = ThreadPoolExecutor(
+    max_workers=config.MAX_CONCURRENT_JOBS,
+    thread_name_prefix="job-executor",
+)
+
+
+def get_output_video_url(job) -> Optional[str]:
+    """Get the public URL of a job's final video, if it has one."""
+    if not job.output_video_path:
+        return None
+
+    # Convert to relative URL
+    return f"/videos/{job.id}/final_output.mp4"
+
+
+def get_stream_url(job) -> Optional[str]:
+    """Get the public URL of a job's live HLS playlist, once it exists."""
+    playlist_path = FileManager.get_hls_dir(job.id) / PLAYLIST_NAME
+    if not playlist_path.exists():
+        return None
+
+    return f"/videos/{job.id}/hls/{PLAYLIST_NAME}"
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def convert_summary_to_response(summary) -> JobSummaryResponse:
+    """Convert JobSummary to JobSummaryResponse."""
+    return JobSummaryResponse(
+        id=summary.id,
+        status=summary.status,
+        created_at=summary.created_at,
+        updated_at=summary.updated_at,
+        user_prompt=summary.user_prompt,
+        model_id=summary.model_id,
+        current_step=summary.current_step,
+        progress_percentage=summary.progress_percentage,
+        output_video_url=get_output_video_url(summary),
+        error_message=summary.error_message,
+    )
 
 
 def convert_job_to_response(job) -> JobResponse:
     """Convert VideoJob to JobResponse."""
-    # Generate video URL if available
-    output_video_url = None
-    if job.output_video_path:
-        # Convert to relative URL
-        output_video_url = f"/videos/{job.id}/final_output.mp4"
+    output_video_url = get_output_video_url(job)
 
     return JobResponse(
         id=job.id,
@@ -38,6 +89,7 @@ def convert_job_to_response(job) -> JobResponse:
         progress_percentage=job.progress_percentage,
         current_shot_id=job.current_shot_id,
         output_video_url=output_video_url,
+        stream_url=get_stream_url(job),
         storyboard=job.storyboard,
         error_message=job.error_message,
     )
@@ -45,27 +97,36 @@ def convert_job_to_response(job) -> JobResponse:
 
 async def execute_job_async(job_id: str):
     """
-    Execute job in background with WebSocket progress updates.
+    Execute job on the job executor with WebSocket progress updates.
+
+    The orchestrator runs on a job_executor thread; progress callbacks fire
+    on that thread and are marshalled back onto the event loop.
 
     Args:
         job_id: Job identifier
     """
+    loop = asyncio.get_running_loop()
+
     def progress_callback(step: str, progress: float, shot_id: Optional[str] = None):
-        """Send progress updates via WebSocket."""
-        asyncio.create_task(
+        """Send progress updates via WebSocket (called from executor threads)."""
+        loop.call_soon_threadsafe(
+            loop.create_task,
             manager.send_progress_update(
                 job_id=job_id,
                 step=step,
                 progress=progress,
                 shot_id=shot_id,
-            )
+            ),
         )
 
     try:
-        # Execute job
-        job = orchestrator.execute_job(
-            job_id=job_id,
-            progress_callback=progress_callback,
+        # Execute job off the event loop
+        job = await loop.run_in_executor(
+            job_executor,
+            lambda: orchestrator.execute_job(
+                job_id=job_id,
+                progress_callback=progress_callback,
+            ),
         )
 
         # Send completion message
@@ -84,7 +145,8 @@ async def create_job(
     """
     Create a new video generation job.
 
-    The job will be queued and processed in the background.
+    The job is placed on the persistent job queue and processed by a worker
+    process (or on an API executor thread when JOB_EXECUTION_MODE=thread).
     Use WebSocket connection at /ws/jobs/{job_id} to receive real-time progress updates.
 
     Args:
@@ -95,14 +157,22 @@ async def create_job(
     """
     try:
         # Create job
-        job = orchestrator.create_job(
+        job = await run_in_threadpool(
+            orchestrator.create_job,
             prompt=request.user_prompt,
             model_id=request.model_id,
             max_shots=request.max_shots,
+            shot_parallelism=request.shot_parallelism,
+            style_preferences=request.style_preferences,
+            fresh_storyboard=request.fresh_storyboard,
+            reference_file_id=request.reference_file_id,
         )
 
-        # Queue background task
-        background_tasks.add_task(execute_job_async, job.id)
+        # Hand off to the worker pool (or an executor thread in thread mode)
+        if config.JOB_EXECUTION_MODE == "queue":
+            await run_in_threadpool(job_queue.enqueue, job.id)
+        else:
+            background_tasks.add_task(execute_job_async, job.id)
 
         return convert_job_to_response(job)
 
@@ -117,44 +187,58 @@ async def list_jobs(
     page: int = 1,
     page_size: int = 20,
     status: Optional[JobStatus] = None,
+    cursor: Optional[str] = None,
+    expand: Optional[str] = None,
 ):
     """
-    List all video generation jobs.
+    List all video generation jobs, newest first.
+
+    Jobs are returned as lightweight summaries read from the job index. Pass
+    ``expand=storyboard`` to get full job documents including storyboards.
+
+    Pass ``next_cursor`` from a previous response as ``cursor`` to fetch the
+    following page efficiently; ``page`` is ignored when a cursor is given.
 
     Args:
         page: Page number (1-indexed)
         page_size: Number of jobs per page
         status: Filter by job status
+        cursor: Keyset pagination cursor
+        expand: "storyboard" to include full job details
 
     Returns:
         Paginated list of jobs
     """
-    try:
-        # Get all jobs
-        all_jobs = orchestrator.list_jobs()
-
-        # Filter by status if specified
-        if status:
-            all_jobs = [j for j in all_jobs if j.status == status]
+    if expand not in (None, "storyboard"):
+        raise HTTPException(status_code=400, detail=f"Unsupported expand value: {expand}")
 
-        # Sort by created_at (newest first)
-        all_jobs.sort(key=lambda j: j.created_at, reverse=True)
+    try:
+        page_args = dict(
+            status=status,
+            limit=page_size,
+            cursor=cursor,
+            offset=(page - 1) * page_size,
+        )
 
-        # Paginate
-        start = (page - 1) * page_size
-        end = start + page_size
-        jobs_page = all_jobs[start:end]
+        if expand == "storyboard":
+            jobs_page, next_cursor = await run_in_threadpool(orchestrator.list_jobs, **page_args)
+            job_responses = [convert_job_to_response(j) for j in jobs_page]
+        else:
+            summaries, next_cursor = await run_in_threadpool(orchestrator.list_job_summaries, **page_args)
+            job_responses = [convert_summary_to_response(s) for s in summaries]
 
-        # Convert to response objects
-        job_responses = [convert_job_to_response(j) for j in jobs_page]
+        total = await run_in_threadpool(orchestrator.count_jobs, status)
 
         return JobListResponse(
             jobs=job_responses,
-            total=len(all_jobs),
+            total=total,
             page=page,
             page_size=page_size,
+            next_cursor=next_cursor,
         )
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list jobs: {str(e)}")
 
@@ -170,7 +254,7 @@ async def get_job(job_id: str):
     Returns:
         Job information including progress and storyboard
     """
-    job = orchestrator.get_job(job_id)
+    job = await run_in_threadpool(orchestrator.get_job, job_id)
 
     if job is None:
         raise HTTPException(
@@ -192,7 +276,7 @@ async def delete_job(job_id: str):
     Returns:
         Success message
     """
-    job = orchestrator.get_job(job_id)
+    job = await run_in_threadpool(orchestrator.get_job, job_id)
 
     if job is None:
         raise HTTPException(
@@ -201,7 +285,7 @@ async def delete_job(job_id: str):
         )
 
     # Delete job
-    success = orchestrator.delete_job(job_id)
+    success = await run_in_threadpool(orchestrator.delete_job, job_id)
 
     if not success:
         raise HTTPException(
@@ -212,18 +296,25 @@ async def delete_job(job_id: str):
     return {"message": f"Job {job_id} deleted successfully"}
 
 
-@router.get("/jobs/{job_id}/video")
-async def download_video(job_id: str):
+@router.api_route("/jobs/{job_id}/video", methods=["GET", "HEAD"])
+async def download_video(job_id: str, request: Request):
     """
     Download the generated video file.
 
+    Completed videos never change, so responses carry a strong ETag (the
+    video's SHA-256) and immutable caching; revalidations are answered with
+    304 without touching the file. Jobs completed before hashes were recorded
+    get neither, only Last-Modified. Byte ranges are supported for seeking.
+    With VIDEO_ACCEL_REDIRECT_PREFIX set, the file transfer is handed to
+    nginx via X-Accel-Redirect.
+
     Args:
         job_id: Job identifier
 
     Returns:
         Video file
     """
-    job = orchestrator.get_job(job_id)
+    job = await run_in_threadpool(orchestrator.get_job, job_id)
 
     if job is None:
         raise HTTPException(
@@ -243,17 +334,50 @@ async def download_video(job_id: str):
             detail="Video file not found"
         )
 
-    from pathlib import Path
     video_path = Path(job.output_video_path)
+    headers = {"Cache-Control": "no-cache"}
+
+    if job.output_video_sha256:
+        etag = f'"{job.output_video_sha256}"'
+        headers["Cache-Control"] = f"public, max-age={config.VIDEO_CACHE_MAX_AGE}, immutable"
+        headers["ETag"] = etag
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+
+    if config.VIDEO_ACCEL_REDIRECT_PREFIX:
+        try:
+            relative_path = video_path.relative_to(config.VIDEO_OUTPUT_DIR)
+        except ValueError:
+            relative_path = None
+
+        if relative_path is not None:
+            # nginx serves the file (ranges included) from its internal location
+            headers["X-Accel-Redirect"] = (
+                f"{config.VIDEO_ACCEL_REDIRECT_PREFIX.rstrip('/')}/{quote(relative_path.as_posix())}"
+            )
+            headers["Content-Disposition"] = f'attachment; filename="{job_id}.mp4"'
+            return Response(media_type="video/mp4", headers=headers)
 
-    if not video_path.exists():
+    try:
+        stat_result = await run_in_threadpool(video_path.stat)
+    except FileNotFoundError:
         raise HTTPException(
             status_code=404,
             detail="Video file not found on disk"
         )
 
-    return FileResponse(
+    response = FileResponse(
         path=str(video_path),
         media_type="video/mp4",
-        filename=f"{job_id}.mp4"
+        filename=f"{job_id}.mp4",
+        headers=headers,
+        stat_result=stat_result,
     )
+
+    if not job.output_video_sha256:
+        # Only content hashes are used as validators, never mtime/size
+        del response.headers["etag"]
+
+    return response
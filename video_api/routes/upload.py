@@ -1,71 +1,251 @@
 """
 File upload endpoints.
 """
-import uuid
 from datetime import datetime
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Request
+from starlette.concurrency import run_in_threadpool
 from pathlib import Path
+from PIL import Image
 
-from video_engine.storage.file_manager import FileManager
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ImportError:  # python-multipart < 0.0.13
+    from multipart.multipart import MultipartParser, parse_options_header
+
+from video_engine.storage.file_manager import UploadWriter, UploadTooLargeError
+from video_engine.models.registry import registry
+from video_engine.config import config
 from video_api.schemas.responses import UploadResponse
+from video_api.routes.jobs import orchestrator
 
 
 router = APIRouter()
 
+ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+
+# Allowance for multipart boundaries and part headers around the file
+MULTIPART_OVERHEAD_BYTES = 16 * 1024
+
+UPLOAD_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                    "required": ["file"],
+                }
+            }
+        },
+    }
+}
+
+
+class MultipartUpload:
+    """
+    Streams the ``file`` part of a multipart body into an UploadWriter.
+
+    Parser callbacks only collect slices of the current chunk; ``feed``
+    writes them out afterwards in a worker thread so disk I/O never blocks
+    the event loop.
+    """
+
+    def __init__(self, content_type: str):
+        """
+        Initialize parser.
+
+        Args:
+            content_type: Request Content-Type header
+        """
+        _, params = parse_options_header(content_type)
+        boundary = params.get(b"boundary")
+        if not boundary:
+            raise HTTPException(status_code=400, detail="Expected a multipart/form-data upload")
+
+        self.parser = MultipartParser(boundary, {
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        })
+        self.filename: Optional[str] = None
+        self.writer: Optional[UploadWriter] = None
+        self.complete = False
+
+        self._header_field = b""
+        self._header_value = b""
+        self._disposition = b""
+        self._in_file_part = False
+        self._pending: List[bytes] = []
+
+    def _on_header_field(self, data: bytes, start: int, end: int):
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int):
+        self._header_value += data[start:end]
+
+    def _on_header_end(self):
+        if self._header_field.lower() == b"content-disposition":
+            self._disposition = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self):
+        _, options = parse_options_header(self._disposition)
+        self._disposition = b""
+
+        self._in_file_part = (
+            self.writer is None
+            and options.get(b"name") == b"file"
+            and b"filename" in options
+        )
+        if not self._in_file_part:
+            return
+
+        self.filename = options[b"filename"].decode("utf-8", "replace")
+        file_ext = Path(self.filename).suffix.lower()
+        if file_ext not in ALLOWED_EXTENSIONS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid file type: {file_ext}. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
+            )
+        self.writer = UploadWriter(self.filename)
+
+    def _on_part_data(self, data: bytes, start: int, end: int):
+        if self._in_file_part:
+            self._pending.append(bytes(data[start:end]))
+
+    def _on_part_end(self):
+        if self._in_file_part:
+            self._in_file_part = False
+            self.complete = True
 
-@router.post("/upload", response_model=UploadResponse)
-async def upload_file(file: UploadFile = File(...)):
+    def _write_pending(self):
+        pending, self._pending = self._pending, []
+        for piece in pending:
+            self.writer.write(piece)
+
+    async def feed(self, chunk: bytes):
+        """
+        Parse the next chunk of the request body.
+
+        Args:
+            chunk: Raw body bytes
+        """
+        self.parser.write(chunk)
+        if self._pending:
+            await run_in_threadpool(self._write_pending)
+
+    def abort(self):
+        """Discard anything written so far."""
+        if self.writer:
+            self.writer.abort()
+
+
+@router.post("/upload", response_model=UploadResponse, openapi_extra=UPLOAD_REQUEST_BODY)
+async def upload_file(request: Request):
     """
     Upload a reference image for image-to-video generation.
 
     Supported formats: JPG, JPEG, PNG, WEBP
 
+    The multipart body is streamed to disk in chunks and hashed on the way,
+    so memory use does not grow with the file. Uploads over the size limit
+    are rejected as soon as the limit is crossed (or up front when the
+    request declares its length). Files are stored by content hash, so
+    identical uploads share one file and one stable file_id, which can be
+    passed to job creation as ``reference_file_id``.
+
+    The image is decoded once and stored resized for every registered
+    model, so shots using it skip per-shot image work.
+
     Returns:
         Upload information including file path and ID
     """
-    # Check file type
-    allowed_extensions = {".jpg", ".jpeg", ".png", ".webp"}
-    file_ext = Path(file.filename).suffix.lower()
+    max_size = config.MAX_UPLOAD_SIZE_BYTES
+    too_large = f"File too large. Maximum size: {max_size / 1024 / 1024:g}MB"
+
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_size + MULTIPART_OVERHEAD_BYTES:
+        raise HTTPException(status_code=413, detail=too_large)
+
+    upload = MultipartUpload(request.headers.get("content-type", ""))
 
-    if file_ext not in allowed_extensions:
+    try:
+        async for chunk in request.stream():
+            await upload.feed(chunk)
+        upload.parser.finalize()
+    except UploadTooLargeError:
+        raise HTTPException(status_code=413, detail=too_large)
+    except HTTPException:
+        upload.abort()
+        raise
+    except Exception as e:
+        upload.abort()
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid file type: {file_ext}. Allowed: {', '.join(allowed_extensions)}"
+            detail=f"Failed to read file: {str(e)}"
         )
 
-    # Read file data
+    if not upload.complete:
+        upload.abort()
+        raise HTTPException(status_code=400, detail="No file uploaded (expected form field 'file')")
+
+    # Store under the content hash (identical uploads share one file)
     try:
-        file_data = await file.read()
+        file_path, content_hash, deduplicated = await run_in_threadpool(upload.writer.finish)
     except Exception as e:
+        upload.abort()
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to read file: {str(e)}"
+            detail=f"Failed to save file: {str(e)}"
         )
 
-    # Check file size (limit to 10MB)
-    max_size = 10 * 1024 * 1024  # 10MB
-    if len(file_data) > max_size:
+    # Preprocess into model-ready variants
+    try:
+        metadata = await run_in_threadpool(
+            orchestrator.image_variants.process,
+            file_path,
+            registry.get_input_resolutions(),
+            content_hash,
+        )
+    except (OSError, Image.DecompressionBombError) as e:
+        # Undecodable files and images over PIL's pixel limit
+        if not deduplicated:
+            file_path.unlink(missing_ok=True)
         raise HTTPException(
             status_code=400,
-            detail=f"File too large. Maximum size: {max_size / 1024 / 1024}MB"
+            detail=f"Invalid image: {str(e)}"
         )
-
-    # Save file
-    try:
-        file_path = FileManager.save_uploaded_file(file_data, file.filename)
     except Exception as e:
+        if not deduplicated:
+            file_path.unlink(missing_ok=True)
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to save file: {str(e)}"
+            detail=f"Failed to process image: {str(e)}"
         )
 
-    # Generate file ID
-    file_id = f"upload_{uuid.uuid4().hex[:12]}"
+    record = await run_in_threadpool(
+        orchestrator.upload_store.register,
+        file_path,
+        content_hash,
+        upload.filename,
+        upload.writer.size,
+    )
 
     return UploadResponse(
-        file_id=file_id,
-        filename=file.filename,
+        file_id=record["id"],
+        filename=upload.filename,
         file_path=str(file_path),
-        file_size_bytes=len(file_data),
+        file_size_bytes=upload.writer.size,
         uploaded_at=datetime.now(),
+        content_hash=content_hash,
+        width=metadata["width"],
+        height=metadata["height"],
+        perceptual_hash=metadata["dhash"],
+        deduplicated=deduplicated,
     )
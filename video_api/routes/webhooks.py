@@ -0,0 +1,87 @@
+"""
+Webhook endpoints for remote model providers.
+"""
+import hmac
+import json
+import time
+import base64
+import hashlib
+from fastapi import APIRouter, HTTPException, Request
+from starlette.concurrency import run_in_threadpool
+
+from video_engine.models.adapters.predictions import prediction_waiter
+from video_engine.config import config
+
+
+router = APIRouter()
+
+# Reject signed deliveries older than this many seconds (replay protection)
+SIGNATURE_TOLERANCE_SECONDS = 300
+
+
+def verify_replicate_signature(headers, body: bytes, secret: str) -> bool:
+    """
+    Verify a Replicate webhook signature.
+
+    Args:
+        headers: Request headers
+        body: Raw request body
+        secret: Signing secret ("whsec_..." from Replicate)
+
+    Returns:
+        True if one of the signatures matches
+    """
+    webhook_id = headers.get("webhook-id")
+    timestamp = headers.get("webhook-timestamp")
+    signatures = headers.get("webhook-signature")
+
+    if not (webhook_id and timestamp and signatures):
+        return False
+
+    try:
+        if abs(time.time() - int(timestamp)) > SIGNATURE_TOLERANCE_SECONDS:
+            return False
+        key = base64.b64decode(secret.split("_", 1)[-1])
+    except ValueError:
+        return False
+
+    signed_content = f"{webhook_id}.{timestamp}.".encode() + body
+    expected = base64.b64encode(hmac.new(key, signed_content, hashlib.sha256).digest()).decode()
+
+    return any(
+        hmac.compare_digest(expected, signature.split(",", 1)[-1])
+        for signature in signatures.split()
+    )
+
+
+@router.post("/webhooks/replicate")
+async def replicate_webhook(request: Request):
+    """
+    Receive Replicate prediction updates.
+
+    Completed predictions wake the renderer waiting on them, whether it runs
+    in this process or in a worker process. Only signed deliveries are
+    accepted; without REPLICATE_WEBHOOK_SECRET the endpoint is disabled.
+
+    Returns:
+        Acknowledgement
+    """
+    if not config.REPLICATE_WEBHOOK_SECRET:
+        raise HTTPException(status_code=404, detail="Webhooks are not enabled")
+
+    body = await request.body()
+
+    if not verify_replicate_signature(request.headers, body, config.REPLICATE_WEBHOOK_SECRET):
+        raise HTTPException(status_code=401, detail="Invalid webhook signature")
+
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        payload = None
+
+    if not isinstance(payload, dict) or "id" not in payload:
+        raise HTTPException(status_code=400, detail="Invalid prediction payload")
+
+    await run_in_threadpool(prediction_waiter.deliver, payload)
+
+    return {"received": True}
@@ -10,8 +10,11 @@ class CreateJobRequest(BaseModel):
     user_prompt: str = Field(..., min_length=1, max_length=2000, description="Text description of desired video")
     model_id: Optional[str] = Field(None, description="Model to use (defaults to config)")
     max_shots: int = Field(5, ge=1, le=10, description="Maximum number of shots")
+    shot_parallelism: Optional[int] = Field(None, ge=1, le=10, description="Shots rendered concurrently (defaults to config)")
     reference_image_url: Optional[str] = Field(None, description="URL to reference image for I2V")
+    reference_file_id: Optional[str] = Field(None, description="file_id returned by /upload to use as the I2V reference image")
     style_preferences: Optional[Dict[str, Any]] = Field(None, description="Optional style guidance")
+    fresh_storyboard: bool = Field(False, description="Generate a new storyboard even if this prompt was seen before")
 
     class Config:
         json_schema_extra = {
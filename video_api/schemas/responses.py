@@ -1,7 +1,7 @@
 """
 Response schemas for API endpoints.
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -30,6 +30,7 @@ class JobResponse(BaseModel):
     current_shot_id: Optional[str] = None
 
     output_video_url: Optional[str] = None
+    stream_url: Optional[str] = Field(default=None, description="Live HLS playlist, available from the first shot")
     storyboard: Optional[Storyboard] = None
 
     error_message: Optional[str] = None
@@ -52,12 +53,30 @@ class JobResponse(BaseModel):
         }
 
 
+class JobSummaryResponse(BaseModel):
+    """Lightweight job information for list views."""
+    id: str
+    status: JobStatus
+    created_at: datetime
+    updated_at: datetime
+
+    user_prompt: str
+    model_id: str
+
+    current_step: str
+    progress_percentage: float
+
+    output_video_url: Optional[str] = None
+    error_message: Optional[str] = None
+
+
 class JobListResponse(BaseModel):
-    """Response containing list of jobs."""
-    jobs: List[JobResponse]
+    """Response containing list of jobs (full jobs only with expand=storyboard)."""
+    jobs: List[Union[JobResponse, JobSummaryResponse]]
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
 
     class Config:
         json_schema_extra = {
@@ -65,7 +84,8 @@ class JobListResponse(BaseModel):
                 "jobs": [],
                 "total": 10,
                 "page": 1,
-                "page_size": 20
+                "page_size": 20,
+                "next_cursor": "MTcwNTMxNDYwMC4wfGpvYl9hYmMxMjM"
             }
         }
 
@@ -96,6 +116,9 @@ class HealthResponse(BaseModel):
     timestamp: datetime
     api_keys_configured: Dict[str, bool]
     models_available: int
+    llms_available: List[str] = []
+    caches: Dict[str, Dict[str, Union[int, float]]] = {}
+    media: Dict[str, Dict[str, Union[int, float]]] = {}
 
 
 class UploadResponse(BaseModel):
@@ -105,15 +128,25 @@ class UploadResponse(BaseModel):
     file_path: str
     file_size_bytes: int
     uploaded_at: datetime
+    content_hash: Optional[str] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    perceptual_hash: Optional[str] = None
+    deduplicated: bool = False
 
     class Config:
         json_schema_extra = {
             "example": {
-                "file_id": "upload_abc123",
+                "file_id": "upload_9f86d081884c7d65",
                 "filename": "reference.jpg",
-                "file_path": "/workspace/uploads/20240115_103000_reference.jpg",
+                "file_path": "/workspace/uploads/9f/86/9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08.jpg",
                 "file_size_bytes": 1048576,
-                "uploaded_at": "2024-01-15T10:30:00Z"
+                "uploaded_at": "2024-01-15T10:30:00Z",
+                "content_hash": "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08",
+                "width": 1920,
+                "height": 1080,
+                "perceptual_hash": "f0e4c2d7a1b3958e",
+                "deduplicated": False
             }
         }
 
@@ -2,6 +2,7 @@
 Command-line interface for video generation.
 """
 import sys
+import time
 import argparse
 from pathlib import Path
 from typing import Optional
@@ -58,6 +59,8 @@ def cmd_generate(args):
             model_id=args.model,
             reference_image_path=args.reference_image,
             max_shots=args.max_shots,
+            shot_parallelism=args.shot_parallelism,
+            fresh_storyboard=args.fresh_storyboard,
         )
 
         print(f"Job created: {job.id}")
@@ -117,6 +120,7 @@ def cmd_storyboard(args):
         storyboard = generator.generate(
             user_prompt=args.prompt,
             max_shots=args.max_shots,
+            use_cache=not args.fresh,
         )
 
         print("✓ Storyboard generated")
@@ -183,7 +187,7 @@ def cmd_list_models(args):
 def cmd_list_jobs(args):
     """List all jobs."""
     orchestrator = VideoOrchestrator()
-    jobs = orchestrator.list_jobs()
+    jobs, _ = orchestrator.list_jobs()
 
     if not jobs:
         print("No jobs found.")
@@ -241,6 +245,41 @@ def cmd_get_job(args):
     return 0
 
 
+def cmd_reindex_jobs(args):
+    """Rebuild the job index from JSON job files."""
+    from video_engine.storage.job_store import JobStore
+
+    store = JobStore()
+    count = store.rebuild_index()
+    print(f"✓ Indexed {count} job(s) from {store.storage_dir}")
+    return 0
+
+
+def cmd_worker(args):
+    """Run queue worker processes."""
+    from video_engine.core.worker import WorkerPool
+
+    pool = WorkerPool(num_workers=args.workers)
+
+    print("=" * 60)
+    print(f"Starting {pool.num_workers} queue worker(s)")
+    print("=" * 60)
+
+    if not pool.start():
+        print("✗ Error: a worker pool is already running for this workspace")
+        return 1
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print()
+        print("Stopping workers...")
+        pool.stop()
+
+    return 0
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -267,6 +306,17 @@ def main():
         default=5,
         help="Maximum number of shots (default: 5)",
     )
+    generate_parser.add_argument(
+        "--shot-parallelism",
+        type=int,
+        default=None,
+        help=f"Shots rendered concurrently (default: {config.MAX_CONCURRENT_SHOTS})",
+    )
+    generate_parser.add_argument(
+        "--fresh-storyboard",
+        action="store_true",
+        help="Generate a new storyboard even if this prompt was seen before",
+    )
     generate_parser.add_argument(
         "--reference-image",
         help="Path to reference image for I2V",
@@ -289,6 +339,11 @@ def main():
         default=5,
         help="Maximum shots (default: 5)",
     )
+    storyboard_parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Bypass the storyboard cache",
+    )
     storyboard_parser.add_argument(
         "--output",
         "-o",
@@ -314,6 +369,24 @@ def main():
     )
     get_job_parser.add_argument("job_id", help="Job ID")
 
+    # Reindex jobs command
+    subparsers.add_parser(
+        "reindex-jobs",
+        help="Import existing job JSON files into the job index",
+    )
+
+    # Worker command
+    worker_parser = subparsers.add_parser(
+        "worker",
+        help="Run queue worker processes",
+    )
+    worker_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=f"Number of worker processes (default: {config.MAX_CONCURRENT_JOBS})",
+    )
+
     args = parser.parse_args()
 
     if not args.command:
@@ -327,6 +400,8 @@ def main():
         "list-models": cmd_list_models,
         "list-jobs": cmd_list_jobs,
         "get-job": cmd_get_job,
+        "reindex-jobs": cmd_reindex_jobs,
+        "worker": cmd_worker,
     }
 
     handler = handlers.get(args.command)
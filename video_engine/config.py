@@ -16,6 +16,13 @@ class VideoEngineConfig:
     ANTHROPIC_API_KEY: str = os.getenv("ANTHROPIC_API_KEY", "")
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     REPLICATE_API_TOKEN: str = os.getenv("REPLICATE_API_TOKEN", "")
+    # Public URL of POST /api/v1/webhooks/replicate (predictions are polled when unset)
+    REPLICATE_WEBHOOK_URL: str = os.getenv("REPLICATE_WEBHOOK_URL", "")
+    REPLICATE_WEBHOOK_SECRET: str = os.getenv("REPLICATE_WEBHOOK_SECRET", "")
+    # Input images up to this size are sent inline as data URIs; larger ones
+    # are uploaded once per content hash and the file URL is reused
+    REPLICATE_INLINE_IMAGE_MAX_BYTES: int = int(os.getenv("REPLICATE_INLINE_IMAGE_MAX_BYTES", str(1024 * 1024)))
+    REPLICATE_UPLOAD_CACHE_TTL: float = float(os.getenv("REPLICATE_UPLOAD_CACHE_TTL_HOURS", "12")) * 3600
     HUGGINGFACE_TOKEN: str = os.getenv("HUGGINGFACE_TOKEN", "")
 
     # Paths
@@ -25,10 +32,16 @@ class VideoEngineConfig:
     VIDEO_UPLOAD_DIR: Path = WORKSPACE_DIR / "uploads"
     JOBS_DIR: Path = WORKSPACE_DIR / "jobs"
     TEMP_DIR: Path = WORKSPACE_DIR / "temp"
+    RENDER_CACHE_DIR: Path = WORKSPACE_DIR / "cache" / "renders"
+    STORYBOARD_CACHE_PATH: Path = WORKSPACE_DIR / "cache" / "storyboards.db"
+    IMAGE_VARIANTS_DIR: Path = WORKSPACE_DIR / "cache" / "images"
 
     # Video Generation Limits
     MAX_VIDEO_DURATION: int = int(os.getenv("MAX_VIDEO_DURATION", "60"))
     MAX_SHOTS_PER_VIDEO: int = int(os.getenv("MAX_SHOTS_PER_VIDEO", "10"))
+    MAX_UPLOAD_SIZE_BYTES: int = int(float(os.getenv("MAX_UPLOAD_SIZE_MB", "10")) * 1024 * 1024)
+    # Uploads are streamed to disk (and hashed) in chunks of this size
+    UPLOAD_CHUNK_SIZE: int = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
     DEFAULT_SHOT_DURATION: float = 3.0
     DEFAULT_FPS: int = 8
     DEFAULT_NUM_FRAMES: int = 81
@@ -51,10 +64,93 @@ class VideoEngineConfig:
     ENABLE_CORS: bool = os.getenv("ENABLE_CORS", "true").lower() == "true"
     MAX_CONCURRENT_JOBS: int = int(os.getenv("MAX_CONCURRENT_JOBS", "3"))
 
+    # Job Execution
+    # "queue": persistent queue drained by worker processes
+    # "thread": run on executor threads inside the API process
+    JOB_EXECUTION_MODE: str = os.getenv("JOB_EXECUTION_MODE", "queue")
+    QUEUE_DB_PATH: Path = WORKSPACE_DIR / "queue.db"
+    PREDICTIONS_DB_PATH: Path = WORKSPACE_DIR / "predictions.db"
+    # ffmpeg slots shared by the API and worker processes on this host
+    MEDIA_SLOTS_DB_PATH: Path = WORKSPACE_DIR / "media.db"
+    UPLOADS_DB_PATH: Path = WORKSPACE_DIR / "uploads.db"
+    # Held by the one process on this host that runs the worker pool
+    WORKER_POOL_LOCK_PATH: Path = WORKSPACE_DIR / "workers.lock"
+    QUEUE_VISIBILITY_TIMEOUT: float = float(os.getenv("QUEUE_VISIBILITY_TIMEOUT", "300"))
+    QUEUE_POLL_INTERVAL: float = float(os.getenv("QUEUE_POLL_INTERVAL", "1.0"))
+    # Seconds without progress after which a worker stops renewing a job's lease
+    QUEUE_STALL_TIMEOUT: float = float(os.getenv("QUEUE_STALL_TIMEOUT", "900"))
+    # Start MAX_CONCURRENT_JOBS worker processes alongside the API
+    QUEUE_EMBEDDED_WORKERS: bool = os.getenv("QUEUE_EMBEDDED_WORKERS", "true").lower() == "true"
+
+    # Minimum seconds between persisted progress updates for a job
+    PROGRESS_WRITE_INTERVAL: float = float(os.getenv("PROGRESS_WRITE_INTERVAL", "1.0"))
+
+    # In-memory cache of loaded jobs
+    JOB_CACHE_SIZE: int = int(os.getenv("JOB_CACHE_SIZE", "256"))
+    # Seconds a cached job is served before its version is re-checked
+    JOB_CACHE_REVALIDATE_INTERVAL: float = float(os.getenv("JOB_CACHE_REVALIDATE_INTERVAL", "1.0"))
+
+    # Content-addressed cache of rendered shots
+    RENDER_CACHE_ENABLED: bool = os.getenv("RENDER_CACHE_ENABLED", "true").lower() == "true"
+    RENDER_CACHE_MAX_BYTES: int = int(float(os.getenv("RENDER_CACHE_MAX_GB", "10")) * 1024**3)
+
+    # Storyboards memoized by normalized prompt, max_shots and style
+    STORYBOARD_CACHE_ENABLED: bool = os.getenv("STORYBOARD_CACHE_ENABLED", "true").lower() == "true"
+    STORYBOARD_CACHE_TTL: float = float(os.getenv("STORYBOARD_CACHE_TTL_HOURS", "168")) * 3600
+    STORYBOARD_CACHE_MAX_ENTRIES: int = int(os.getenv("STORYBOARD_CACHE_MAX_ENTRIES", "1000"))
+
+    # Remote prediction polling (seconds; backoff doubles up to the max)
+    PREDICTION_POLL_INITIAL: float = float(os.getenv("PREDICTION_POLL_INITIAL", "1.0"))
+    PREDICTION_POLL_MAX: float = float(os.getenv("PREDICTION_POLL_MAX", "15.0"))
+
+    # Streaming downloads of generated videos
+    DOWNLOAD_CHUNK_SIZE: int = int(os.getenv("DOWNLOAD_CHUNK_SIZE", str(1024 * 1024)))
+    DOWNLOAD_MAX_ATTEMPTS: int = int(os.getenv("DOWNLOAD_MAX_ATTEMPTS", "5"))
+
+    # Shared HTTP connection pool (model providers, LLM APIs, downloads)
+    HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "20"))
+    HTTP_KEEPALIVE_EXPIRY: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30.0"))
+    HTTP_CONNECT_TIMEOUT: float = float(os.getenv("HTTP_CONNECT_TIMEOUT", "10.0"))
+    HTTP_READ_TIMEOUT: float = float(os.getenv("HTTP_READ_TIMEOUT", "60.0"))
+    HTTP_POOL_TIMEOUT: float = float(os.getenv("HTTP_POOL_TIMEOUT", "30.0"))
+    HTTP2_ENABLED: bool = os.getenv("HTTP2_ENABLED", "true").lower() == "true"
+
+    # Stream the storyboard and start rendering each shot as soon as it is written
+    STORYBOARD_STREAMING: bool = os.getenv("STORYBOARD_STREAMING", "true").lower() == "true"
+
+    # Shot Generation
+    # Number of shots rendered in parallel per job (jobs may override this)
+    MAX_CONCURRENT_SHOTS: int = int(
+        os.getenv("MAX_CONCURRENT_SHOTS", os.getenv("MAX_CONCURRENT_JOBS", "3"))
+    )
+
+    # Video Delivery
+    # Cache lifetime of completed job videos (their content never changes)
+    VIDEO_CACHE_MAX_AGE: int = int(os.getenv("VIDEO_CACHE_MAX_AGE", "31536000"))
+    # Internal location prefix for nginx X-Accel-Redirect offload (empty = serve directly)
+    VIDEO_ACCEL_REDIRECT_PREFIX: str = os.getenv("VIDEO_ACCEL_REDIRECT_PREFIX", "")
+
+    # Media Processing
+    # Cores available to ffmpeg encodes (0 = all)
+    MEDIA_CPU_COUNT: int = int(os.getenv("MEDIA_CPU_COUNT", "0"))
+    # Concurrent ffmpeg encodes across all jobs and worker processes (0 = one per 4 cores)
+    MAX_CONCURRENT_ENCODES: int = int(os.getenv("MAX_CONCURRENT_ENCODES", "0"))
+    # Concurrent ffmpeg/ffprobe processes of any kind, host-wide (0 = encodes + cores)
+    MAX_MEDIA_PROCESSES: int = int(os.getenv("MAX_MEDIA_PROCESSES", "0"))
+
     # Video Processing
     VIDEO_CODEC: str = "libx264"
     VIDEO_PIXEL_FORMAT: str = "yuv420p"
     VIDEO_CRF: int = 23  # Quality (lower = better, 18-28 is good range)
+    # Crossfades re-encode only the transition windows and stream-copy the rest
+    SMART_CROSSFADE: bool = os.getenv("SMART_CROSSFADE", "true").lower() == "true"
+    # Append each shot to the final video as soon as it (and all earlier shots) finish
+    INCREMENTAL_ASSEMBLY: bool = os.getenv("INCREMENTAL_ASSEMBLY", "true").lower() == "true"
+    # Publish assembled shots as a live HLS playlist (needs incremental assembly)
+    HLS_ENABLED: bool = os.getenv("HLS_ENABLED", "true").lower() == "true"
+    # Announced maximum segment length; crossfade encodes are split to fit (shots are at most 10s)
+    HLS_TARGET_DURATION: int = int(os.getenv("HLS_TARGET_DURATION", "10"))
 
     @classmethod
     def ensure_directories(cls):
@@ -65,9 +161,25 @@ class VideoEngineConfig:
             cls.VIDEO_UPLOAD_DIR,
             cls.JOBS_DIR,
             cls.TEMP_DIR,
+            cls.RENDER_CACHE_DIR,
+            cls.IMAGE_VARIANTS_DIR,
         ]:
             directory.mkdir(parents=True, exist_ok=True)
 
+    @classmethod
+    def validate_webhooks(cls):
+        """
+        Check the webhook settings.
+
+        Raises:
+            ValueError: If webhooks are requested without a signing secret
+        """
+        if cls.REPLICATE_WEBHOOK_URL and not cls.REPLICATE_WEBHOOK_SECRET:
+            raise ValueError(
+                "REPLICATE_WEBHOOK_URL is set but REPLICATE_WEBHOOK_SECRET is not; "
+                "unsigned webhook deliveries cannot be accepted"
+            )
+
     @classmethod
     def validate_api_keys(cls) -> dict:
         """Check which API keys are configured."""
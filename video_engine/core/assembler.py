@@ -0,0 +1,232 @@
+"""
+Incremental assembly of the final video.
+
+Shots finish rendering in any order. The assembler appends each one to a
+growing MPEG-TS stream as soon as it and every earlier shot are done, so
+when the last shot lands the final MP4 is a single remux away instead of a
+full concatenation pass. Hard cuts are stream-copied whole; with crossfades
+only the transition windows are encoded (see smart_render). Each appended
+segment can also be published to a live HLS playlist.
+"""
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from video_engine.models.schemas import Shot
+from video_engine.storage.hls import HLSPlaylist
+from video_engine.utils.smart_render import CrossfadePlanner, piece_duration
+from video_engine.utils.video_utils import (
+    can_smart_render,
+    get_keyframe_times,
+    probe_inputs,
+    remux_to_mp4,
+    remux_to_ts,
+    render_crossfade_piece,
+)
+from video_engine.config import config
+
+
+class ShotAssembler:
+    """
+    Appends rendered shots to the final video in storyboard order.
+
+    Appends run on a single background thread so render workers never wait
+    for them. If a shot cannot be appended (a failed remux, or crossfaded
+    clips that cannot be smart-rendered), ``finish`` returns False and the
+    caller joins the shots itself. The live playlist is ended only when the
+    assembled video is the final one; on every other outcome (fallback join,
+    failure, cancellation) it is removed so no stream is left half-written.
+    """
+
+    def __init__(
+        self,
+        output_path: Path,
+        work_dir: Path,
+        playlist: Optional[HLSPlaylist] = None,
+    ):
+        """
+        Initialize assembler.
+
+        Args:
+            output_path: Final video path
+            work_dir: Directory for the growing stream (removed by close)
+            playlist: Optional live playlist receiving every appended segment
+        """
+        self.output_path = Path(output_path)
+        self.work_dir = Path(work_dir)
+        self.playlist = playlist
+        self.stream_path = self.work_dir / "assembly.ts"
+
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="assembler")
+        self._ready: Dict[int, Tuple[Shot, Path]] = {}
+        self._next_index = 0
+        self._active = True
+
+        # Only touched by the assembler thread
+        self._offset = 0.0
+        self._segments = 0
+        self._appended: List[Path] = []
+        self._transition_duration = 0.0
+        self._planner: Optional[CrossfadePlanner] = None
+        self._clip_format: Optional[tuple] = None
+
+    def add(self, index: int, shot: Shot, video_path: Path):
+        """
+        Hand over a rendered shot.
+
+        Args:
+            index: Position of the shot in the storyboard
+            shot: Shot specification (its duration spares probing the clip)
+            video_path: Rendered shot video
+        """
+        with self._lock:
+            self._ready[index] = (shot, Path(video_path))
+        self._executor.submit(self._drain)
+
+    def _drain(self):
+        """Append every shot whose predecessors have all been appended."""
+        while True:
+            with self._lock:
+                if not self._active or self._next_index not in self._ready:
+                    return
+                index = self._next_index
+                shot, video_path = self._ready.pop(index)
+                self._next_index += 1
+
+            if index == 0:
+                # The first shot's transition applies to the whole video
+                self._transition_duration = shot.transition_duration
+                if self._transition_duration > 0 and not config.SMART_CROSSFADE:
+                    self._active = False
+                    return
+
+            try:
+                self.work_dir.mkdir(parents=True, exist_ok=True)
+                if self._transition_duration > 0:
+                    self._append_crossfaded(video_path)
+                else:
+                    self._append_cut(shot, video_path)
+            except Exception as e:
+                print(f"Incremental assembly stopped at shot {shot.id}: {e}")
+                self._active = False
+                return
+
+    def _next_segment_path(self) -> Path:
+        """Path for the next TS segment before it is appended."""
+        self._segments += 1
+        return self.work_dir / f"segment_{self._segments:04d}.ts"
+
+    def _append_cut(self, shot: Shot, video_path: Path):
+        """Remux one shot to TS at its timeline position and append it."""
+        duration = shot.output_duration_seconds
+        if duration is None:
+            duration = probe_inputs([video_path])[0]["duration"]
+
+        segment_path = self._next_segment_path()
+        self._append_segment(
+            segment_path, remux_to_ts(video_path, segment_path, self._offset), duration
+        )
+
+        self._offset += duration
+        self._appended.append(video_path)
+
+    def _append_crossfaded(self, video_path: Path):
+        """Append the pieces of the crossfaded timeline this shot completes."""
+        info = probe_inputs([video_path])[0]
+        clip_format = (info["video"], info["has_audio"])
+
+        if self._clip_format is None:
+            if not can_smart_render([info]):
+                raise ValueError("clip format cannot be stream-copied")
+            self._clip_format = clip_format
+            # Playlist segments may not exceed the announced target duration
+            self._planner = CrossfadePlanner(
+                self._transition_duration,
+                self.playlist.target_duration if self.playlist else None,
+            )
+        elif clip_format != self._clip_format:
+            raise ValueError("clip formats differ")
+
+        self._appended.append(video_path)
+        for piece in self._planner.add(info["duration"], get_keyframe_times(video_path)):
+            self._append_piece(piece)
+
+    def _append_piece(self, piece: dict):
+        """Render a smart-render piece and append it."""
+        duration = piece_duration(piece, self._transition_duration)
+        segment_path = self._next_segment_path()
+        self._append_segment(segment_path, render_crossfade_piece(
+            piece,
+            self._appended,
+            segment_path,
+            self._offset,
+            self._transition_duration,
+            self._clip_format[1],
+        ), duration)
+
+        self._offset += duration
+
+    def _append_segment(self, segment_path: Path, rendered: bool, duration: float):
+        """Add a rendered TS segment to the stream and the live playlist."""
+        try:
+            if not rendered:
+                raise RuntimeError(f"Failed to render {segment_path.name}")
+
+            with open(segment_path, "rb") as segment, open(self.stream_path, "ab") as stream:
+                shutil.copyfileobj(segment, stream)
+
+            if self.playlist:
+                self.playlist.publish(segment_path, duration)
+        finally:
+            segment_path.unlink(missing_ok=True)
+
+    def finish(self, video_paths: List[Path]) -> bool:
+        """
+        Wait for pending appends and write the final video.
+
+        Args:
+            video_paths: All shot videos in storyboard order
+
+        Returns:
+            True if the final video was written, False if the caller has to
+            join the shots itself
+        """
+        self._executor.shutdown(wait=True)
+
+        if not self._active or self._appended != [Path(path) for path in video_paths]:
+            self._discard_playlist()
+            return False
+
+        try:
+            if self._planner:
+                for piece in self._planner.finish():
+                    self._append_piece(piece)
+        except Exception as e:
+            print(f"Incremental assembly failed to close the timeline: {e}")
+            self._discard_playlist()
+            return False
+
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        if not remux_to_mp4(self.stream_path, self.output_path):
+            self._discard_playlist()
+            return False
+
+        if self.playlist:
+            self.playlist.end()
+        return True
+
+    def _discard_playlist(self):
+        """Remove a live playlist that will not be completed."""
+        if self.playlist and not self.playlist.ended:
+            self.playlist.reset()
+
+    def close(self):
+        """Stop assembling, drop an unfinished playlist and remove intermediate files."""
+        with self._lock:
+            self._active = False
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._discard_playlist()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
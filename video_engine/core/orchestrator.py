@@ -3,6 +3,8 @@ Video generation orchestrator - coordinates the full pipeline.
 """
 import uuid
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Callable
 from datetime import datetime
@@ -10,6 +12,7 @@ from datetime import datetime
 from video_engine.models.schemas import (
     VideoJob,
     JobStatus,
+    JobSummary,
     GenerationMode,
     Storyboard,
     Shot,
@@ -17,11 +20,139 @@ from video_engine.models.schemas import (
 from video_engine.llm.storyboard_generator import StoryboardGenerator
 from video_engine.models.registry import registry
 from video_engine.storage.job_store import JobStore
+from video_engine.storage.job_cache import JobCache
+from video_engine.storage.render_cache import RenderCache, hash_file
+from video_engine.storage.storyboard_cache import StoryboardCache
+from video_engine.storage.image_variants import ImageVariantStore
+from video_engine.storage.upload_store import UploadStore
 from video_engine.storage.file_manager import FileManager
-from video_engine.utils.video_utils import concatenate_videos
+from video_engine.storage.hls import HLSPlaylist
+from video_engine.core.shot_scheduler import ShotScheduler, build_shot_dag
+from video_engine.core.assembler import ShotAssembler
+from video_engine.utils.video_utils import concatenate_videos, extract_frame, extract_last_frame
 from video_engine.config import config
 
 
+class ShotProgressTracker:
+    """
+    Aggregates progress from concurrently rendering shots.
+
+    Each shot reports a fraction (0.0-1.0) of its own work; the tracker maps
+    the sum of all fractions onto the job's progress range and never lets the
+    reported percentage go backwards, so callbacks stay monotonic regardless
+    of the order in which worker threads report.
+    """
+
+    def __init__(
+        self,
+        job: VideoJob,
+        job_store: JobStore,
+        num_shots: int,
+        progress_callback: Optional[Callable[[str, float, Optional[str]], None]] = None,
+        start: float = 10.0,
+        span: float = 75.0,
+    ):
+        """
+        Initialize tracker.
+
+        Args:
+            job: Job being executed (mutated under the tracker lock)
+            job_store: Store used to persist progress
+            num_shots: Total number of shots in the job
+            progress_callback: Optional callback(step, progress, shot_id)
+            start: Job progress percentage when no shot has started
+            span: Percentage range covered by all shots together
+        """
+        self.job = job
+        self.job_store = job_store
+        self.num_shots = max(1, num_shots)
+        self.progress_callback = progress_callback
+        self.start = start
+        self.span = span
+
+        self._lock = threading.Lock()
+        self._fractions: dict[str, float] = {}
+        self._last_progress = start
+
+    def update(
+        self,
+        shot: Shot,
+        step: str,
+        fraction: float,
+        message: Optional[str] = None,
+        persist: bool = False,
+    ) -> float:
+        """
+        Record progress for a shot and report the combined job progress.
+
+        Args:
+            shot: Shot reporting progress
+            step: Step description stored on the job
+            fraction: Completed fraction of this shot (0.0-1.0)
+            message: Optional callback message (defaults to step)
+            persist: Write progress immediately (ticks are otherwise coalesced)
+
+        Returns:
+            Combined job progress percentage
+        """
+        with self._lock:
+            fraction = min(1.0, max(0.0, fraction))
+            self._fractions[shot.id] = max(self._fractions.get(shot.id, 0.0), fraction)
+
+            progress = self.start + self.span * sum(self._fractions.values()) / self.num_shots
+            progress = max(self._last_progress, progress)
+            self._last_progress = progress
+
+            self.job.update_progress(step, progress, shot.id)
+            self.job_store.save_progress(self.job, force=persist)
+
+            if self.progress_callback:
+                self.progress_callback(message or step, progress, shot.id)
+
+            return progress
+
+    def set_num_shots(self, num_shots: int):
+        """
+        Set the final shot count once a streamed storyboard is complete.
+
+        Args:
+            num_shots: Total number of shots in the job
+        """
+        with self._lock:
+            self.num_shots = max(1, num_shots)
+
+    def snapshot(self, step: str):
+        """
+        Record a job-level step and write a full job snapshot.
+
+        Runs under the tracker lock so the snapshot never interleaves with
+        shot updates; the reported percentage is left unchanged.
+
+        Args:
+            step: Step description
+        """
+        with self._lock:
+            self.job.update_progress(step, self._last_progress)
+            self.job_store.save_job(self.job)
+
+            if self.progress_callback:
+                self.progress_callback(step, self._last_progress, None)
+
+    def complete(self, shot: Shot, video_path: Path, step: str):
+        """
+        Mark a shot as rendered and record its output on the job.
+
+        Args:
+            shot: Completed shot
+            video_path: Rendered video path
+            step: Step description
+        """
+        with self._lock:
+            shot.output_video_path = str(video_path)
+
+        self.update(shot, step, 1.0, persist=True)
+
+
 class VideoOrchestrator:
     """Orchestrates end-to-end video generation pipeline."""
 
@@ -29,7 +160,17 @@ class VideoOrchestrator:
         """Initialize orchestrator."""
         config.ensure_directories()
         self.job_store = JobStore()
+        self.job_cache = JobCache(self.job_store)
+        self.render_cache = RenderCache()
+        self.storyboard_cache = StoryboardCache() if config.STORYBOARD_CACHE_ENABLED else None
+        self.image_variants = ImageVariantStore()
+        self.upload_store = UploadStore()
         self.file_manager = FileManager()
+        # Per frame path: [lock, number of threads holding or waiting for it]
+        self._frame_locks: dict[Path, list] = {}
+        self._frame_locks_guard = threading.Lock()
+        self._storyboard_generator: Optional[StoryboardGenerator] = None
+        self._generator_lock = threading.Lock()
 
     def create_job(
         self,
@@ -38,6 +179,10 @@ class VideoOrchestrator:
         reference_image_path: Optional[str] = None,
         max_shots: int = 5,
         llm: str = "claude",
+        shot_parallelism: Optional[int] = None,
+        style_preferences: Optional[dict] = None,
+        fresh_storyboard: bool = False,
+        reference_file_id: Optional[str] = None,
     ) -> VideoJob:
         """
         Create a new video generation job.
@@ -48,6 +193,11 @@ class VideoOrchestrator:
             reference_image_path: Optional reference image
             max_shots: Maximum number of shots
             llm: LLM to use for storyboard generation
+            shot_parallelism: Shots rendered concurrently (defaults to config)
+            style_preferences: Optional style guidance for the storyboard
+            fresh_storyboard: Generate a new storyboard even if one is cached
+            reference_file_id: Uploaded reference image (file_id from the
+                upload store; takes precedence over reference_image_path)
 
         Returns:
             VideoJob object
@@ -59,6 +209,10 @@ class VideoOrchestrator:
         if not registry.is_model_available(model_id):
             raise ValueError(f"Model not available: {model_id}")
 
+        # Resolve the uploaded reference image and keep it alive for this job
+        if reference_file_id:
+            reference_image_path = str(self.upload_store.acquire(reference_file_id, job_id))
+
         # Determine generation mode
         generation_mode = GenerationMode.TEXT_TO_VIDEO
         if reference_image_path:
@@ -70,6 +224,11 @@ class VideoOrchestrator:
             model_id=model_id,
             generation_mode=generation_mode,
             reference_image_path=reference_image_path,
+            reference_file_id=reference_file_id,
+            shot_parallelism=shot_parallelism,
+            max_shots=max_shots,
+            style_preferences=style_preferences,
+            fresh_storyboard=fresh_storyboard,
             status=JobStatus.QUEUED,
         )
 
@@ -98,6 +257,20 @@ class VideoOrchestrator:
         if not job:
             raise ValueError(f"Job not found: {job_id}")
 
+        # Shots are appended to the final video as they finish
+        assembler = None
+        if config.INCREMENTAL_ASSEMBLY:
+            playlist = None
+            if config.HLS_ENABLED:
+                playlist = HLSPlaylist(self.file_manager.get_hls_dir(job.id))
+                playlist.reset()
+
+            assembler = ShotAssembler(
+                output_path=self.file_manager.get_final_output_path(job.id),
+                work_dir=self.file_manager.get_job_output_dir(job.id) / "assembly",
+                playlist=playlist,
+            )
+
         try:
             # Update status
             job.status = JobStatus.PROCESSING
@@ -109,34 +282,40 @@ class VideoOrchestrator:
 
             # Step 1: Generate storyboard (10% of progress)
             job.update_progress("Generating storyboard", 5.0)
-            self.job_store.save_job(job)
+            self.job_store.save_progress(job, force=True)
 
             if progress_callback:
                 progress_callback("Generating storyboard", 5.0, None)
 
-            storyboard = self._generate_storyboard(job)
-            job.storyboard = storyboard
-            job.update_progress("Storyboard generated", 10.0)
-            self.job_store.save_job(job)
+            if config.STORYBOARD_STREAMING:
+                # Steps 1+2 overlapped: shots render while the storyboard streams
+                shot_videos = self._stream_storyboard_and_shots(job, progress_callback, assembler)
+            else:
+                storyboard = self._generate_storyboard(job)
+                job.storyboard = storyboard
+                job.update_progress("Storyboard generated", 10.0)
+                self.job_store.save_job(job)
 
-            if progress_callback:
-                progress_callback("Storyboard generated", 10.0, None)
+                if progress_callback:
+                    progress_callback("Storyboard generated", 10.0, None)
 
-            # Step 2: Generate individual shots (10% -> 85%)
-            shot_videos = self._generate_shots(job, progress_callback)
+                # Step 2: Generate individual shots (10% -> 85%)
+                shot_videos = self._generate_shots(job, progress_callback, assembler)
 
             # Step 3: Concatenate videos (85% -> 95%)
             job.update_progress("Combining videos", 85.0)
-            self.job_store.save_job(job)
+            self.job_store.save_progress(job, force=True)
 
             if progress_callback:
                 progress_callback("Combining videos", 85.0, None)
 
-            final_video_path = self._concatenate_shots(job, shot_videos)
+            final_video_path = self._concatenate_shots(job, shot_videos, assembler)
 
             # Step 4: Finalize (95% -> 100%)
             job.update_progress("Finalizing", 95.0)
-            job.mark_completed(str(final_video_path))
+
+            # The content hash backs download ETags
+            job.mark_completed(str(final_video_path), sha256=hash_file(final_video_path))
             self.job_store.save_job(job)
 
             if progress_callback:
@@ -154,138 +333,400 @@ class VideoOrchestrator:
 
             raise
 
-    def _generate_storyboard(self, job: VideoJob) -> Storyboard:
-        """Generate storyboard from job prompt."""
-        generator = StoryboardGenerator(llm=config.DEFAULT_LLM)
+        finally:
+            if assembler:
+                assembler.close()
 
-        # Calculate max shots based on duration limit
-        max_shots = min(
-            config.MAX_SHOTS_PER_VIDEO,
-            int(config.MAX_VIDEO_DURATION / config.DEFAULT_SHOT_DURATION),
-        )
+    def _generate_storyboard(
+        self,
+        job: VideoJob,
+        on_shot: Optional[Callable[[Shot], None]] = None,
+    ) -> Storyboard:
+        """
+        Generate storyboard from job prompt.
+
+        Args:
+            job: Job being executed
+            on_shot: Optional callback receiving each prepared shot as soon as
+                the LLM has produced it
 
-        storyboard = generator.generate(
+        Returns:
+            Storyboard object
+        """
+        storyboard = self._get_storyboard_generator().generate(
             user_prompt=job.user_prompt,
-            max_shots=max_shots,
+            max_shots=self._get_max_shots(job),
+            style_preferences=job.style_preferences,
+            use_cache=not job.fresh_storyboard,
+            on_shot=(lambda shot: on_shot(self._prepare_shot(job, shot))) if on_shot else None,
         )
 
-        # Update shots with job's model and reference image
         for shot in storyboard.shots:
-            shot.model_id = job.model_id
-
-            # If job has a reference image, use it for first shot
-            if job.reference_image_path and shot.sequence_number == 1:
-                shot.reference_image_path = job.reference_image_path
+            self._prepare_shot(job, shot)
 
         # Save storyboard
         self.job_store.save_storyboard(storyboard)
 
         return storyboard
 
+    def _get_storyboard_generator(self) -> StoryboardGenerator:
+        """Get the storyboard generator shared by all jobs, creating it on first use."""
+        with self._generator_lock:
+            if self._storyboard_generator is None:
+                self._storyboard_generator = StoryboardGenerator(
+                    llm=config.DEFAULT_LLM,
+                    cache=self.storyboard_cache,
+                )
+            return self._storyboard_generator
+
+    def _get_max_shots(self, job: VideoJob) -> int:
+        """Get the storyboard shot limit for a job."""
+        # Calculate max shots based on duration limit
+        max_shots = min(
+            config.MAX_SHOTS_PER_VIDEO,
+            int(config.MAX_VIDEO_DURATION / config.DEFAULT_SHOT_DURATION),
+        )
+        if job.max_shots:
+            max_shots = min(max_shots, job.max_shots)
+        return max_shots
+
+    def _prepare_shot(self, job: VideoJob, shot: Shot) -> Shot:
+        """Apply the job's model and reference image to a storyboard shot."""
+        shot.model_id = job.model_id
+
+        # If job has a reference image, use it for first shot
+        if job.reference_image_path and shot.sequence_number == 1:
+            shot.reference_image_path = job.reference_image_path
+
+        return shot
+
     def _generate_shots(
         self,
         job: VideoJob,
         progress_callback: Optional[Callable[[str, float, Optional[str]], None]] = None,
+        assembler: Optional[ShotAssembler] = None,
     ) -> list[Path]:
-        """Generate individual shot videos."""
+        """
+        Generate individual shot videos.
+
+        Shots are rendered on a bounded thread pool. Shots conditioned on a
+        neighbour's frames wait for that neighbour; everything else runs in
+        parallel. The returned paths are always in storyboard order.
+        """
         if not job.storyboard:
             raise ValueError("Job has no storyboard")
 
-        shot_videos = []
         shots = job.storyboard.shots
-        num_shots = len(shots)
 
-        # Progress range: 10% -> 85% (75% total for all shots)
-        progress_per_shot = 75.0 / num_shots
-
-        for i, shot in enumerate(shots):
-            # Update progress
-            base_progress = 10.0 + (i * progress_per_shot)
-            job.update_progress(
-                f"Generating shot {i+1}/{num_shots}",
-                base_progress,
-                shot.id,
-            )
-            self.job_store.save_job(job)
+        # Validate conditioning links up front so bad storyboards fail fast
+        build_shot_dag(shots)
 
-            if progress_callback:
-                progress_callback(
-                    f"Generating shot {i+1}/{num_shots}: {shot.description}",
-                    base_progress,
-                    shot.id,
-                )
+        def produce_shots(on_shot, tracker):
+            for shot in shots:
+                on_shot(shot)
+            return shots
 
-            # Generate video for shot
-            video_path = self._generate_single_shot(
-                job=job,
-                shot=shot,
-                progress_callback=lambda msg, pct: (
-                    progress_callback(
-                        msg,
-                        base_progress + (pct / 100.0 * progress_per_shot * 0.9),  # 90% of shot progress
-                        shot.id,
-                    ) if progress_callback else None
-                ),
-            )
+        shot_videos = self._run_shot_pipeline(
+            job, produce_shots, len(shots), progress_callback, assembler=assembler
+        )
 
-            shot_videos.append(video_path)
-            job.intermediate_videos.append(str(video_path))
+        job.intermediate_videos.extend(str(path) for path in shot_videos)
+        job.update_progress("All shots generated", 85.0)
+        self.job_store.save_job(job)
 
-            # Update shot with output path
-            shot.output_video_path = str(video_path)
+        return shot_videos
+
+    def _stream_storyboard_and_shots(
+        self,
+        job: VideoJob,
+        progress_callback: Optional[Callable[[str, float, Optional[str]], None]] = None,
+        assembler: Optional[ShotAssembler] = None,
+    ) -> list[Path]:
+        """
+        Generate the storyboard and render shots as the storyboard streams in.
+
+        Each shot is dispatched as soon as the LLM has finished writing it, so
+        the first renders overlap the rest of storyboard generation.
+        """
+        def produce_shots(on_shot, tracker):
+            storyboard = self._generate_storyboard(job, on_shot=on_shot)
+            tracker.set_num_shots(len(storyboard.shots))
+            job.storyboard = storyboard
+            tracker.snapshot("Storyboard generated")
+            return storyboard.shots
+
+        shot_videos = self._run_shot_pipeline(
+            job,
+            produce_shots,
+            self._get_max_shots(job),
+            progress_callback,
+            estimated=True,
+            assembler=assembler,
+        )
 
+        job.intermediate_videos.extend(str(path) for path in shot_videos)
         job.update_progress("All shots generated", 85.0)
         self.job_store.save_job(job)
 
         return shot_videos
 
+    def _run_shot_pipeline(
+        self,
+        job: VideoJob,
+        produce_shots: Callable[[Callable[[Shot], None], ShotProgressTracker], list[Shot]],
+        num_shots: int,
+        progress_callback: Optional[Callable[[str, float, Optional[str]], None]] = None,
+        estimated: bool = False,
+        assembler: Optional[ShotAssembler] = None,
+    ) -> list[Path]:
+        """
+        Render shots on a bounded thread pool as they are produced.
+
+        Shots conditioned on a neighbour's frames wait for that neighbour;
+        everything else runs in parallel.
+
+        Args:
+            job: Job being executed
+            produce_shots: Callable(on_shot, tracker) that passes every shot to
+                on_shot and returns the final, ordered shot list
+            num_shots: Expected number of shots (an upper bound when streaming)
+            progress_callback: Optional callback(step, progress, shot_id)
+            estimated: Whether num_shots is only an upper bound
+            assembler: Optional assembler receiving each shot once rendered
+
+        Returns:
+            Rendered video paths in the order returned by produce_shots
+        """
+        # Progress range: 10% -> 85% (75% total for all shots)
+        tracker = ShotProgressTracker(
+            job=job,
+            job_store=self.job_store,
+            num_shots=num_shots,
+            progress_callback=progress_callback,
+        )
+
+        positions: dict[str, int] = {}
+        # Shot count shown in step labels, unknown until a stream completes
+        label_total = {"value": None if estimated else num_shots}
+        executor = ThreadPoolExecutor(
+            max_workers=self._get_shot_parallelism(job, num_shots),
+            thread_name_prefix=f"{job.id}-shot",
+        )
+
+        try:
+            def render(shot: Shot, parent_outputs: dict[str, Path]) -> Path:
+                video_path = self._render_shot(
+                    job, shot, positions[shot.id], label_total["value"], tracker, parent_outputs
+                )
+                if assembler:
+                    assembler.add(positions[shot.id], shot, video_path)
+                return video_path
+
+            scheduler = ShotScheduler(executor, render)
+
+            def on_shot(shot: Shot):
+                positions[shot.id] = len(positions)
+                scheduler.add(shot)
+
+            shots = produce_shots(on_shot, tracker)
+            label_total["value"] = len(shots)
+
+            # Clients that could not stream deliver nothing until they return
+            for shot in shots:
+                if shot.id not in positions:
+                    on_shot(shot)
+            scheduler.seal()
+
+            outputs = scheduler.wait()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return [outputs[shot.id] for shot in shots]
+
+    def _get_shot_parallelism(self, job: VideoJob, num_shots: int) -> int:
+        """Get number of shots to render concurrently for a job."""
+        parallelism = job.shot_parallelism or config.MAX_CONCURRENT_SHOTS
+        return max(1, min(parallelism, num_shots))
+
+    def _render_shot(
+        self,
+        job: VideoJob,
+        shot: Shot,
+        index: int,
+        num_shots: Optional[int],
+        tracker: ShotProgressTracker,
+        parent_outputs: Optional[dict[str, Path]] = None,
+    ) -> Path:
+        """Render one shot, reporting progress through the shared tracker."""
+        self._resolve_conditioning_frames(job, shot, parent_outputs or {})
+
+        step = f"Generating shot {index+1}/{num_shots}" if num_shots else f"Generating shot {index+1}"
+        tracker.update(
+            shot,
+            step,
+            0.0,
+            message=f"{step}: {shot.description}",
+            persist=True,
+        )
+
+        video_path = self._generate_single_shot(
+            job=job,
+            shot=shot,
+            progress_callback=lambda msg, pct: tracker.update(
+                shot,
+                step,
+                pct / 100.0 * 0.9,  # 90% of shot progress
+                message=msg,
+            ),
+        )
+
+        done = f"Shot {index+1}/{num_shots} complete" if num_shots else f"Shot {index+1} complete"
+        tracker.complete(shot, video_path, done)
+
+        return video_path
+
+    def _resolve_conditioning_frames(
+        self,
+        job: VideoJob,
+        shot: Shot,
+        parent_outputs: dict[str, Path],
+    ):
+        """Point a shot's frame conditioning at its parents' boundary frames."""
+        if shot.first_frame_from_shot:
+            shot.first_frame_path = str(self._extract_boundary_frame(
+                job, shot.first_frame_from_shot, parent_outputs[shot.first_frame_from_shot], "last"
+            ))
+
+        if shot.last_frame_from_shot:
+            shot.last_frame_path = str(self._extract_boundary_frame(
+                job, shot.last_frame_from_shot, parent_outputs[shot.last_frame_from_shot], "first"
+            ))
+
+    def _extract_boundary_frame(
+        self,
+        job: VideoJob,
+        shot_id: str,
+        video_path: Path,
+        boundary: str,
+    ) -> Path:
+        """Extract (once) the first or last frame of a rendered shot."""
+        frame_path = self.file_manager.get_frame_path(job.id, shot_id, boundary)
+
+        # Only extractions of the same frame wait for each other
+        with self._frame_locks_guard:
+            entry = self._frame_locks.setdefault(frame_path, [threading.Lock(), 0])
+            entry[1] += 1
+
+        try:
+            with entry[0]:
+                if not frame_path.exists():
+                    if boundary == "last":
+                        extracted = extract_last_frame(video_path, frame_path)
+                    else:
+                        extracted = extract_frame(video_path, frame_path, 0)
+
+                    if not extracted:
+                        raise RuntimeError(f"Failed to extract {boundary} frame of shot {shot_id}")
+        finally:
+            with self._frame_locks_guard:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._frame_locks[frame_path]
+
+        return frame_path
+
     def _generate_single_shot(
         self,
         job: VideoJob,
         shot: Shot,
         progress_callback: Optional[Callable[[str, float], None]] = None,
     ) -> Path:
-        """Generate video for a single shot."""
+        """Generate video for a single shot, reusing an identical cached render."""
         # Get model adapter
         adapter = registry.get_adapter(shot.model_id)
         if not adapter:
             raise ValueError(f"Model not found: {shot.model_id}")
 
-        # Generate video
+        output_path = self.file_manager.get_shot_output_path(job.id, shot.id)
+
+        cache_key = self.render_cache.key_for_shot(shot)
+        if self.render_cache.fetch(cache_key, output_path):
+            if progress_callback:
+                progress_callback("Served from render cache", 100.0)
+            shot.generation_time_seconds = 0.0
+            shot.output_duration_seconds = None
+            return output_path
+
+        # Render from the preprocessed, model-ready copy of the reference image
+        render_shot = shot
+        if shot.reference_image_path:
+            variant_path = self.image_variants.variant_for(
+                shot.reference_image_path,
+                shot.model_id,
+                adapter.get_capabilities().input_resolution,
+            )
+            render_shot = shot.model_copy(update={"reference_image_path": str(variant_path)})
+
+        # Generate video (adapters that support it write straight to output_path)
         result = adapter.generate_from_shot(
-            shot=shot,
+            shot=render_shot,
             progress_callback=progress_callback,
+            output_path=output_path,
         )
 
         if not result.success:
             raise RuntimeError(f"Shot generation failed: {result.error_message}")
 
-        # Move to job output directory
-        output_path = self.file_manager.get_shot_output_path(job.id, shot.id)
+        # Move to job output directory if the adapter used a temp file
         temp_path = Path(result.output_path)
 
         if temp_path != output_path:
             output_path.parent.mkdir(parents=True, exist_ok=True)
             temp_path.rename(output_path)
 
+        self.render_cache.store(cache_key, output_path)
+
         # Update shot metadata
         shot.generation_time_seconds = result.generation_time_seconds
+        shot.output_duration_seconds = result.duration_seconds
 
         return output_path
 
-    def _concatenate_shots(self, job: VideoJob, shot_videos: list[Path]) -> Path:
+    def _concatenate_shots(
+        self,
+        job: VideoJob,
+        shot_videos: list[Path],
+        assembler: Optional[ShotAssembler] = None,
+    ) -> Path:
         """Concatenate shot videos into final output."""
         output_path = self.file_manager.get_final_output_path(job.id)
 
+        # Shots already appended as they finished only need the final remux
+        if assembler and assembler.finish(shot_videos):
+            return output_path
+
         # Get transition duration from first shot (if any)
         transition_duration = 0.0
+        durations = None
+        has_audio = None
         if job.storyboard and job.storyboard.shots:
-            transition_duration = job.storyboard.shots[0].transition_duration
+            shots = job.storyboard.shots
+            transition_duration = shots[0].transition_duration
+
+            # Durations reported at generation time spare probing each clip
+            if len(shots) == len(shot_videos):
+                durations = [shot.output_duration_seconds for shot in shots]
+
+            adapters = [registry.get_adapter(shot.model_id) for shot in shots]
+            if all(adapters) and not any(a.get_capabilities().generates_audio for a in adapters):
+                has_audio = False
 
         success = concatenate_videos(
             input_paths=shot_videos,
             output_path=output_path,
             transition_duration=transition_duration,
+            durations=durations,
+            has_audio=has_audio,
         )
 
         if not success:
@@ -294,19 +735,83 @@ class VideoOrchestrator:
         return output_path
 
     def get_job(self, job_id: str) -> Optional[VideoJob]:
-        """Get job by ID."""
-        return self.job_store.load_job(job_id)
+        """
+        Get job by ID.
+
+        Served from the job cache; the returned job is shared and must not be
+        modified.
+        """
+        return self.job_cache.get(job_id)
+
+    def list_jobs(
+        self,
+        status: Optional[JobStatus] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+    ) -> tuple[list[VideoJob], Optional[str]]:
+        """
+        List jobs newest first.
+
+        Args:
+            status: Only return jobs with this status
+            limit: Maximum number of jobs (all when None)
+            cursor: Keyset cursor from a previous call
+            offset: Jobs to skip when no cursor is given
+
+        Returns:
+            Tuple of (jobs, cursor for the next page or None)
+        """
+        if limit is None:
+            limit = self.job_store.count_jobs(status)
+
+        job_ids, next_cursor = self.job_store.query_jobs(
+            status=status,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+        )
 
-    def list_jobs(self) -> list[VideoJob]:
-        """List all jobs."""
         jobs = []
-        for job_id in self.job_store.list_jobs():
+        for job_id in job_ids:
             job = self.job_store.load_job(job_id)
             if job:
                 jobs.append(job)
-        return jobs
+        return jobs, next_cursor
+
+    def list_job_summaries(
+        self,
+        status: Optional[JobStatus] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+    ) -> tuple[list[JobSummary], Optional[str]]:
+        """
+        List lightweight job summaries newest first.
+
+        Args:
+            status: Only return jobs with this status
+            limit: Maximum number of summaries
+            cursor: Keyset cursor from a previous call
+            offset: Jobs to skip when no cursor is given
+
+        Returns:
+            Tuple of (summaries, cursor for the next page or None)
+        """
+        return self.job_store.query_job_summaries(
+            status=status,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+        )
+
+    def count_jobs(self, status: Optional[JobStatus] = None) -> int:
+        """Count jobs, optionally filtered by status."""
+        return self.job_store.count_jobs(status)
 
     def delete_job(self, job_id: str) -> bool:
         """Delete job and its files."""
         self.file_manager.cleanup_job(job_id)
+        self.upload_store.release_job(job_id)
+        self.job_cache.invalidate(job_id)
         return self.job_store.delete_job(job_id)
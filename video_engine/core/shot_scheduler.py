@@ -0,0 +1,216 @@
+"""
+Dependency-aware shot scheduling.
+
+Shots conditioned on a neighbour's rendered output (via ``first_frame_from_shot``
+or ``last_frame_from_shot``) form a DAG. The scheduler dispatches every shot to
+an executor as soon as all of its parents have rendered, so independent
+branches of a storyboard run in parallel.
+"""
+import threading
+from concurrent.futures import Executor, Future
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from video_engine.models.schemas import Shot
+
+
+class ShotDependencyError(ValueError):
+    """Raised when shot conditioning links cannot be scheduled."""
+
+
+def get_shot_dependencies(shot: Shot) -> Set[str]:
+    """
+    Get IDs of shots whose output this shot is conditioned on.
+
+    Args:
+        shot: Shot specification
+
+    Returns:
+        Set of parent shot IDs
+    """
+    parents = {
+        parent_id
+        for parent_id in (shot.first_frame_from_shot, shot.last_frame_from_shot)
+        if parent_id
+    }
+
+    if shot.id in parents:
+        raise ShotDependencyError(f"Shot {shot.id} is conditioned on itself")
+
+    return parents
+
+
+def build_shot_dag(shots: Iterable[Shot]) -> Dict[str, Set[str]]:
+    """
+    Build and validate the dependency graph for a set of shots.
+
+    Args:
+        shots: Shots to schedule
+
+    Returns:
+        Mapping of shot ID -> parent shot IDs
+
+    Raises:
+        ShotDependencyError: On duplicate IDs, unknown parents or cycles
+    """
+    dag: Dict[str, Set[str]] = {}
+
+    for shot in shots:
+        if shot.id in dag:
+            raise ShotDependencyError(f"Duplicate shot id: {shot.id}")
+        dag[shot.id] = get_shot_dependencies(shot)
+
+    for shot_id, parents in dag.items():
+        unknown = parents - dag.keys()
+        if unknown:
+            raise ShotDependencyError(
+                f"Shot {shot_id} depends on unknown shots: {', '.join(sorted(unknown))}"
+            )
+
+    # Kahn's algorithm - anything left unvisited is part of a cycle
+    remaining = {shot_id: set(parents) for shot_id, parents in dag.items()}
+    ready = [shot_id for shot_id, parents in remaining.items() if not parents]
+
+    while ready:
+        done = ready.pop()
+        del remaining[done]
+        for shot_id, parents in remaining.items():
+            if done in parents:
+                parents.discard(done)
+                if not parents:
+                    ready.append(shot_id)
+
+    if remaining:
+        raise ShotDependencyError(
+            f"Cyclic shot dependencies: {', '.join(sorted(remaining))}"
+        )
+
+    return dag
+
+
+class ShotScheduler:
+    """
+    Runs shots on an executor in dependency order.
+
+    Shots can be added incrementally; each is dispatched as soon as all of its
+    parents have completed. Call ``seal()`` once no more shots will be added,
+    then ``wait()`` for the results.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        run_shot: Callable[[Shot, Dict[str, Path]], Path],
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            executor: Executor that renders shots
+            run_shot: Callable(shot, parent_outputs) returning the rendered path
+        """
+        self._executor = executor
+        self._run_shot = run_shot
+
+        self._cond = threading.Condition()
+        self._shots: Dict[str, Shot] = {}
+        self._parents: Dict[str, Set[str]] = {}
+        self._waiting: List[str] = []
+        self._futures: Dict[str, Future] = {}
+        self._outputs: Dict[str, Path] = {}
+        self._error: Optional[BaseException] = None
+        self._sealed = False
+
+    def add(self, shot: Shot):
+        """
+        Add a shot, dispatching it immediately if its parents are done.
+
+        Args:
+            shot: Shot to schedule
+        """
+        with self._cond:
+            if self._sealed:
+                raise RuntimeError("Cannot add shots to a sealed scheduler")
+            if shot.id in self._shots:
+                raise ShotDependencyError(f"Duplicate shot id: {shot.id}")
+
+            self._shots[shot.id] = shot
+            self._parents[shot.id] = get_shot_dependencies(shot)
+            self._waiting.append(shot.id)
+            self._dispatch_ready()
+
+    def seal(self):
+        """Mark the shot set as complete and validate its dependencies."""
+        with self._cond:
+            self._sealed = True
+            try:
+                build_shot_dag(self._shots.values())
+            except ShotDependencyError as e:
+                self._fail(e)
+            self._cond.notify_all()
+
+    def wait(self) -> Dict[str, Path]:
+        """
+        Block until every shot has rendered.
+
+        Returns:
+            Mapping of shot ID -> rendered video path
+
+        Raises:
+            The first exception raised by any shot
+        """
+        with self._cond:
+            while True:
+                if self._error is not None:
+                    raise self._error
+                if self._sealed and len(self._outputs) == len(self._shots):
+                    return dict(self._outputs)
+                self._cond.wait()
+
+    def _dispatch_ready(self):
+        """Submit waiting shots whose parents have all rendered."""
+        if self._error is not None:
+            return
+
+        ready = [
+            shot_id for shot_id in self._waiting
+            if self._parents[shot_id] <= self._outputs.keys()
+        ]
+        # Update before submitting: done callbacks may re-enter this method
+        self._waiting = [shot_id for shot_id in self._waiting if shot_id not in ready]
+
+        for shot_id in ready:
+            parent_outputs = {
+                parent_id: self._outputs[parent_id]
+                for parent_id in self._parents[shot_id]
+            }
+            future = self._executor.submit(
+                self._run_shot, self._shots[shot_id], parent_outputs
+            )
+            self._futures[shot_id] = future
+            future.add_done_callback(
+                lambda f, shot_id=shot_id: self._on_done(shot_id, f)
+            )
+
+    def _on_done(self, shot_id: str, future: Future):
+        """Record a finished shot and release its children."""
+        with self._cond:
+            if future.cancelled():
+                return
+
+            error = future.exception()
+            if error is not None:
+                self._fail(error)
+            else:
+                self._outputs[shot_id] = future.result()
+                self._dispatch_ready()
+
+            self._cond.notify_all()
+
+    def _fail(self, error: BaseException):
+        """Record the first failure and cancel shots that have not started."""
+        if self._error is None:
+            self._error = error
+
+        for future in self._futures.values():
+            future.cancel()
@@ -0,0 +1,303 @@
+"""
+Queue worker processes.
+
+Workers lease jobs from the persistent JobQueue and run them through the
+orchestrator outside the API process. Progress is published back through the
+queue's event table.
+"""
+import os
+import fcntl
+import socket
+import threading
+import time
+import multiprocessing
+from typing import Optional, List
+
+from video_engine.models.schemas import JobStatus
+from video_engine.storage.job_queue import JobQueue
+from video_engine.storage.job_store import JobStore
+from video_engine.config import config
+
+
+def get_worker_id(index: int) -> str:
+    """Build a worker identifier unique across hosts and processes."""
+    return f"{socket.gethostname()}:{os.getpid()}:{index}"
+
+
+class QueueWorker:
+    """Executes jobs leased from the queue, one at a time."""
+
+    def __init__(self, worker_id: str, queue: Optional[JobQueue] = None):
+        """
+        Initialize worker.
+
+        Args:
+            worker_id: Unique worker identifier
+            queue: Job queue (defaults to the configured queue)
+        """
+        # Imported here so spawned processes only build an orchestrator when working
+        from video_engine.core.orchestrator import VideoOrchestrator
+
+        self.worker_id = worker_id
+        self.queue = queue or JobQueue()
+        self.orchestrator = VideoOrchestrator()
+        # Monotonic time of the running job's latest progress event
+        self._last_activity = time.monotonic()
+
+    def run(self, stop_event: Optional[threading.Event] = None):
+        """
+        Process jobs until stop_event is set.
+
+        Args:
+            stop_event: Event that requests shutdown between jobs
+        """
+        while stop_event is None or not stop_event.is_set():
+            if not self.run_once():
+                time.sleep(config.QUEUE_POLL_INTERVAL)
+
+    def run_once(self) -> bool:
+        """
+        Lease and execute a single job.
+
+        Returns:
+            True if a job was processed
+        """
+        lease = self.queue.claim(self.worker_id)
+        if lease is None:
+            return False
+
+        job_id = lease["job_id"]
+        job = self.orchestrator.job_store.load_job(job_id)
+
+        if job is None:
+            self.queue.fail(job_id, self.worker_id, "Job not found")
+            return True
+
+        # A previous worker may have finished the job but died before acknowledging
+        if job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
+            self.queue.complete(job_id, self.worker_id)
+            return True
+
+        if lease["attempts"] > job.max_retries + 1:
+            error = f"Job abandoned after {lease['attempts'] - 1} attempts"
+            job.mark_failed(error)
+            self.orchestrator.job_store.save_job(job)
+            self.queue.fail(job_id, self.worker_id, error)
+            self.queue.publish_event(job_id, "error", {"error": error})
+            return True
+
+        if lease["attempts"] > 1:
+            job.retry_count = lease["attempts"] - 1
+            self.orchestrator.job_store.save_job(job)
+
+        self._execute(job_id)
+        return True
+
+    def _execute(self, job_id: str):
+        """Run a leased job while keeping its lease alive."""
+        done = threading.Event()
+        self._last_activity = time.monotonic()
+        heartbeat = threading.Thread(
+            target=self._heartbeat,
+            args=(job_id, done),
+            name=f"{job_id}-heartbeat",
+            daemon=True,
+        )
+        heartbeat.start()
+
+        def progress_callback(step: str, progress: float, shot_id: Optional[str] = None):
+            self._last_activity = time.monotonic()
+            self.queue.publish_event(
+                job_id,
+                "progress",
+                {"step": step, "progress": progress, "shot_id": shot_id},
+            )
+
+        try:
+            job = self.orchestrator.execute_job(
+                job_id=job_id,
+                progress_callback=progress_callback,
+            )
+            self.queue.complete(job_id, self.worker_id)
+            self.queue.publish_event(
+                job_id,
+                "job_complete",
+                {"output_path": job.output_video_path},
+            )
+
+        except Exception as e:
+            # execute_job has already marked the job as failed
+            self.queue.fail(job_id, self.worker_id, str(e))
+            self.queue.publish_event(job_id, "error", {"error": str(e)})
+
+        finally:
+            done.set()
+            heartbeat.join()
+
+    def _heartbeat(self, job_id: str, done: threading.Event):
+        """
+        Extend the lease periodically while the job makes progress.
+
+        A job that reports no progress for QUEUE_STALL_TIMEOUT seconds is
+        considered hung: its lease is left to expire so another worker can
+        retry it, instead of being held forever.
+        """
+        interval = max(1.0, config.QUEUE_VISIBILITY_TIMEOUT / 3)
+
+        while not done.wait(interval):
+            idle = time.monotonic() - self._last_activity
+            if idle > config.QUEUE_STALL_TIMEOUT:
+                print(f"Worker {self.worker_id}: no progress on {job_id} for {idle:.0f}s, releasing lease")
+                return
+            if not self.queue.heartbeat(job_id, self.worker_id):
+                print(f"Worker {self.worker_id} lost lease on {job_id}")
+                return
+
+
+def _worker_main(index: int, stop_event):
+    """Entry point for a worker process."""
+    worker = QueueWorker(get_worker_id(index))
+    try:
+        worker.run(stop_event)
+    except KeyboardInterrupt:
+        pass
+
+
+def recover_orphaned_jobs(queue: JobQueue, job_store: Optional[JobStore] = None) -> List[str]:
+    """
+    Re-enqueue unfinished jobs that the queue has no record of.
+
+    Jobs left in QUEUED or PROCESSING by an API process that crashed (or that
+    predate the queue) would otherwise never run.
+
+    Args:
+        queue: Job queue
+        job_store: Job store (defaults to a new JobStore)
+
+    Returns:
+        List of re-enqueued job IDs
+    """
+    job_store = job_store or JobStore()
+    recovered = []
+
+    for status in (JobStatus.QUEUED, JobStatus.PROCESSING):
+        job_ids, _ = job_store.query_jobs(status=status, limit=job_store.count_jobs(status))
+
+        for job_id in job_ids:
+            if not queue.is_pending(job_id):
+                queue.enqueue(job_id)
+                recovered.append(job_id)
+
+    return recovered
+
+
+class WorkerPool:
+    """Supervises a fixed number of worker processes."""
+
+    def __init__(self, num_workers: Optional[int] = None):
+        """
+        Initialize worker pool.
+
+        Args:
+            num_workers: Number of worker processes (defaults to config.MAX_CONCURRENT_JOBS)
+        """
+        self.num_workers = num_workers or config.MAX_CONCURRENT_JOBS
+        self._context = multiprocessing.get_context("spawn")
+        self._stop_event = self._context.Event()
+        self._processes: List[Optional[multiprocessing.process.BaseProcess]] = [None] * self.num_workers
+        self._supervisor: Optional[threading.Thread] = None
+        self._running = threading.Event()
+        self._lock_file = None
+
+    def start(self) -> bool:
+        """
+        Recover orphaned jobs and start worker processes.
+
+        Only one pool runs per workspace. When several processes try to start
+        one (e.g. uvicorn with --workers N, each embedding a pool), the first
+        takes the pool lock and the others run without workers, so no more
+        than MAX_CONCURRENT_JOBS jobs execute at once.
+
+        Returns:
+            True if the pool started, False if another process runs it
+        """
+        if not self._acquire_lock():
+            return False
+
+        recovered = recover_orphaned_jobs(JobQueue())
+        if recovered:
+            print(f"✓ Re-enqueued {len(recovered)} unfinished job(s)")
+
+        self._stop_event.clear()
+        self._running.set()
+
+        for index in range(self.num_workers):
+            self._start_worker(index)
+
+        self._supervisor = threading.Thread(
+            target=self._supervise,
+            name="worker-pool-supervisor",
+            daemon=True,
+        )
+        self._supervisor.start()
+        return True
+
+    def stop(self, timeout: float = 10.0):
+        """
+        Stop worker processes.
+
+        Workers finish their current poll and exit; workers still busy after
+        the timeout are terminated and their jobs recovered via lease expiry.
+
+        Args:
+            timeout: Seconds to wait for workers to exit
+        """
+        self._running.clear()
+        self._stop_event.set()
+
+        deadline = time.time() + timeout
+        for process in self._processes:
+            if process is not None:
+                process.join(max(0.0, deadline - time.time()))
+
+        for process in self._processes:
+            if process is not None and process.is_alive():
+                process.terminate()
+                process.join()
+
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def _acquire_lock(self) -> bool:
+        """Take the workspace's pool lock without waiting."""
+        config.WORKER_POOL_LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(config.WORKER_POOL_LOCK_PATH, "a")
+
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            return False
+
+        self._lock_file = lock_file
+        return True
+
+    def _start_worker(self, index: int):
+        """Start (or restart) a worker process."""
+        process = self._context.Process(
+            target=_worker_main,
+            args=(index, self._stop_event),
+            name=f"video-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        self._processes[index] = process
+
+    def _supervise(self):
+        """Restart worker processes that die unexpectedly."""
+        while not self._stop_event.wait(5.0):
+            for index, process in enumerate(self._processes):
+                if process is not None and not process.is_alive() and self._running.is_set():
+                    print(f"Worker {index} exited with code {process.exitcode}, restarting")
+                    self._start_worker(index)
@@ -2,8 +2,8 @@
 Base LLM client interface.
 """
 from abc import ABC, abstractmethod
-from typing import Optional
-from video_engine.models.schemas import Storyboard
+from typing import Optional, Callable
+from video_engine.models.schemas import Storyboard, Shot
 
 
 class BaseLLMClient(ABC):
@@ -15,6 +15,7 @@ class BaseLLMClient(ABC):
         user_prompt: str,
         max_shots: int = 5,
         style_preferences: Optional[dict] = None,
+        on_shot: Optional[Callable[[Shot], None]] = None,
     ) -> Storyboard:
         """
         Generate a storyboard from user prompt.
@@ -23,6 +24,9 @@ class BaseLLMClient(ABC):
             user_prompt: User's description of desired video
             max_shots: Maximum number of shots to generate
             style_preferences: Optional style guidance
+            on_shot: Optional callback invoked with each shot as soon as it
+                is available (streaming clients call it before returning;
+                the returned storyboard must contain the same Shot objects)
 
         Returns:
             Storyboard object with shots
@@ -3,15 +3,54 @@ Claude LLM client for storyboard generation.
 """
 import json
 import uuid
+import threading
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Callable, List
+import anthropic
 from anthropic import Anthropic
 
 from video_engine.llm.base import BaseLLMClient
+from video_engine.llm.json_stream import SequenceBuffer, ShotStreamParser
 from video_engine.models.schemas import Storyboard, Shot
+from video_engine.utils.http import http2_enabled
 from video_engine.config import config
 
 
+_http_client_lock = threading.Lock()
+_http_client: Optional[anthropic.DefaultHttpxClient] = None
+
+
+def get_http_client() -> anthropic.DefaultHttpxClient:
+    """
+    Get the keep-alive HTTP client shared by all Anthropic clients.
+
+    The SDK pins its own httpx build, so it cannot use the generic pooled
+    transport; it gets a dedicated pool sized like one host of it instead.
+
+    Returns:
+        HTTP client to pass as ``http_client`` to ``Anthropic``
+    """
+    global _http_client
+
+    with _http_client_lock:
+        if _http_client is None or _http_client.is_closed:
+            limits = type(anthropic.DEFAULT_CONNECTION_LIMITS)(
+                max_connections=config.HTTP_MAX_CONNECTIONS_PER_HOST,
+                max_keepalive_connections=config.HTTP_MAX_CONNECTIONS_PER_HOST,
+                keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY,
+            )
+            _http_client = anthropic.DefaultHttpxClient(
+                limits=limits,
+                timeout=anthropic.Timeout(
+                    config.HTTP_READ_TIMEOUT,
+                    connect=config.HTTP_CONNECT_TIMEOUT,
+                    pool=config.HTTP_POOL_TIMEOUT,
+                ),
+                http2=http2_enabled(),
+            )
+        return _http_client
+
+
 STORYBOARD_SYSTEM_PROMPT = """You are a professional film director and cinematographer. Your task is to create detailed storyboards for AI video generation.
 
 Given a user's video description, you will:
@@ -29,6 +68,7 @@ Guidelines:
 - Use descriptive, visual language in prompts
 - Specify camera movements (pan, zoom, dolly, static)
 - Consider continuity between shots
+- Set continues_previous_shot to true only when a shot must start exactly where the previous shot ends
 - Optimize prompts for AI (avoid complex compositions)
 
 Output ONLY valid JSON in this exact format:
@@ -42,7 +82,8 @@ Output ONLY valid JSON in this exact format:
       "text_prompt": "Detailed prompt for AI video generation, cinematic, high quality",
       "camera_movement": "static/pan/zoom/dolly",
       "camera_angle": "eye_level/low_angle/high_angle/birds_eye",
-      "motion_intensity": 0.5
+      "motion_intensity": 0.5,
+      "continues_previous_shot": false
     }
   ],
   "style": {
@@ -60,7 +101,7 @@ class ClaudeClient(BaseLLMClient):
         """Initialize Claude client."""
         if not config.ANTHROPIC_API_KEY:
             raise ValueError("ANTHROPIC_API_KEY not configured")
-        self.client = Anthropic(api_key=config.ANTHROPIC_API_KEY)
+        self.client = Anthropic(api_key=config.ANTHROPIC_API_KEY, http_client=get_http_client())
         self.model = config.LLM_MODEL_CLAUDE
 
     def is_available(self) -> bool:
@@ -72,51 +113,72 @@ class ClaudeClient(BaseLLMClient):
         user_prompt: str,
         max_shots: int = 5,
         style_preferences: Optional[dict] = None,
+        on_shot: Optional[Callable[[Shot], None]] = None,
     ) -> Storyboard:
         """
         Generate storyboard using Claude.
 
+        When ``on_shot`` is given the response is streamed and each shot is
+        handed to the callback as soon as its JSON object and those of all
+        earlier sequence numbers are complete, so rendering can start before
+        Claude has finished the storyboard. Continuations are linked by
+        sequence order, exactly as in the non-streaming path. The returned
+        storyboard contains the same Shot objects.
+
         Args:
             user_prompt: User's video description
             max_shots: Maximum shots to generate
             style_preferences: Optional style guidance
+            on_shot: Optional callback receiving each shot as it is parsed
 
         Returns:
             Storyboard object
         """
-        # Build user message
-        user_message = f"""Create a storyboard for this video concept:
-
-"{user_prompt}"
-
-Requirements:
-- Generate between 3 and {max_shots} shots
-- Each shot should be 2-4 seconds long
-- Total video duration should be under {config.MAX_VIDEO_DURATION} seconds
-"""
-
-        if style_preferences:
-            user_message += f"\nStyle preferences: {json.dumps(style_preferences, indent=2)}"
+        user_message = self._build_user_message(user_prompt, max_shots, style_preferences)
+        request = dict(
+            model=self.model,
+            max_tokens=config.LLM_MAX_TOKENS,
+            temperature=config.LLM_TEMPERATURE,
+            system=STORYBOARD_SYSTEM_PROMPT,
+            messages=[
+                {
+                    "role": "user",
+                    "content": user_message,
+                }
+            ],
+        )
 
-        user_message += "\n\nProvide ONLY the JSON output, no additional text."
+        response_text = ""
+        streamed_shots = None
 
         # Call Claude API
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=config.LLM_MAX_TOKENS,
-                temperature=config.LLM_TEMPERATURE,
-                system=STORYBOARD_SYSTEM_PROMPT,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": user_message,
-                    }
-                ],
-            )
+            if on_shot:
+                parser = ShotStreamParser()
+                sequencer = SequenceBuffer()
+                streamed_shots = []
+                arrived = 0
 
-            # Extract JSON from response
-            response_text = response.content[0].text.strip()
+                def release(ready):
+                    for shot, continues in ready:
+                        if continues and streamed_shots:
+                            shot.first_frame_from_shot = streamed_shots[-1].id
+                        streamed_shots.append(shot)
+                        on_shot(shot)
+
+                with self.client.messages.stream(**request) as stream:
+                    for text in stream.text_stream:
+                        for shot_data in parser.feed(text):
+                            arrived += 1
+                            shot = self._parse_shot(shot_data, arrived)
+                            continues = bool(shot_data.get("continues_previous_shot"))
+                            release(sequencer.push(shot.sequence_number, (shot, continues)))
+
+                release(sequencer.flush())
+                response_text = parser.text.strip()
+            else:
+                response = self.client.messages.create(**request)
+                response_text = response.content[0].text.strip()
 
             # Try to extract JSON if wrapped in markdown code blocks
             if response_text.startswith("```"):
@@ -131,6 +193,7 @@ Requirements:
             return self._parse_storyboard(
                 storyboard_data=storyboard_data,
                 user_prompt=user_prompt,
+                shots=streamed_shots,
             )
 
         except json.JSONDecodeError as e:
@@ -138,32 +201,81 @@ Requirements:
         except Exception as e:
             raise RuntimeError(f"Failed to generate storyboard with Claude: {e}")
 
-    def _parse_storyboard(self, storyboard_data: dict, user_prompt: str) -> Storyboard:
-        """Parse storyboard data into Storyboard object."""
+    def _build_user_message(
+        self,
+        user_prompt: str,
+        max_shots: int,
+        style_preferences: Optional[dict],
+    ) -> str:
+        """Build the storyboard request message."""
+        user_message = f"""Create a storyboard for this video concept:
+
+"{user_prompt}"
+
+Requirements:
+- Generate between 3 and {max_shots} shots
+- Each shot should be 2-4 seconds long
+- Total video duration should be under {config.MAX_VIDEO_DURATION} seconds
+"""
+
+        if style_preferences:
+            user_message += f"\nStyle preferences: {json.dumps(style_preferences, indent=2)}"
+
+        user_message += "\n\nProvide ONLY the JSON output, no additional text."
+        return user_message
+
+    def _parse_shot(self, shot_data: dict, default_sequence: int) -> Shot:
+        """Parse one shot object from Claude's response."""
+        return Shot(
+            id=f"shot_{uuid.uuid4().hex[:8]}",
+            sequence_number=shot_data.get("sequence_number", default_sequence),
+            duration_seconds=shot_data.get("duration_seconds", config.DEFAULT_SHOT_DURATION),
+            description=shot_data.get("description", ""),
+            text_prompt=shot_data.get("text_prompt", shot_data.get("description", "")),
+            camera_movement=shot_data.get("camera_movement", "static"),
+            camera_angle=shot_data.get("camera_angle", "eye_level"),
+            motion_intensity=shot_data.get("motion_intensity", 0.5),
+            model_id=config.DEFAULT_VIDEO_MODEL,
+            num_frames=config.DEFAULT_NUM_FRAMES,
+            fps=config.DEFAULT_FPS,
+        )
+
+    def _parse_storyboard(
+        self,
+        storyboard_data: dict,
+        user_prompt: str,
+        shots: Optional[List[Shot]] = None,
+    ) -> Storyboard:
+        """
+        Parse storyboard data into Storyboard object.
+
+        Args:
+            storyboard_data: Decoded JSON response
+            user_prompt: User's video description
+            shots: Shots already parsed while streaming (parsed from
+                storyboard_data when None)
+        """
         storyboard_id = f"storyboard_{uuid.uuid4().hex[:8]}"
 
-        # Parse shots
-        shots = []
-        for shot_data in storyboard_data.get("shots", []):
-            shot_id = f"shot_{uuid.uuid4().hex[:8]}"
-
-            shot = Shot(
-                id=shot_id,
-                sequence_number=shot_data.get("sequence_number", len(shots) + 1),
-                duration_seconds=shot_data.get("duration_seconds", config.DEFAULT_SHOT_DURATION),
-                description=shot_data.get("description", ""),
-                text_prompt=shot_data.get("text_prompt", shot_data.get("description", "")),
-                camera_movement=shot_data.get("camera_movement", "static"),
-                camera_angle=shot_data.get("camera_angle", "eye_level"),
-                motion_intensity=shot_data.get("motion_intensity", 0.5),
-                model_id=config.DEFAULT_VIDEO_MODEL,
-                num_frames=config.DEFAULT_NUM_FRAMES,
-                fps=config.DEFAULT_FPS,
-            )
-            shots.append(shot)
+        if shots is None:
+            # Parse shots
+            shots = []
+            continuation_shot_ids = set()
+            for shot_data in storyboard_data.get("shots", []):
+                shot = self._parse_shot(shot_data, len(shots) + 1)
+                if shot_data.get("continues_previous_shot"):
+                    continuation_shot_ids.add(shot.id)
+                shots.append(shot)
+
+            # Sort by sequence number
+            shots.sort(key=lambda s: s.sequence_number)
 
-        # Sort by sequence number
-        shots.sort(key=lambda s: s.sequence_number)
+            # Link continuation shots to the last frame of their predecessor
+            for previous, shot in zip(shots, shots[1:]):
+                if shot.id in continuation_shot_ids:
+                    shot.first_frame_from_shot = previous.id
+        else:
+            shots = sorted(shots, key=lambda s: s.sequence_number)
 
         # Calculate total duration
         total_duration = sum(s.duration_seconds for s in shots)
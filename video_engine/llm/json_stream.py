@@ -0,0 +1,151 @@
+"""
+Incremental parsing of streamed storyboard JSON.
+"""
+import json
+from typing import List
+
+
+class ShotStreamParser:
+    """
+    Extracts objects from a top-level JSON array while the document streams in.
+
+    Text is fed in arbitrary chunks as the LLM produces it. Each object in
+    the array named ``array_key`` of the outermost JSON object is returned
+    from ``feed`` as soon as its closing brace arrives; the rest of the
+    document is only tracked for nesting. Anything before the outermost
+    ``{`` (such as a markdown code fence) is ignored.
+    """
+
+    def __init__(self, array_key: str = "shots"):
+        """
+        Initialize parser.
+
+        Args:
+            array_key: Key of the array whose items should be emitted
+        """
+        self.array_key = array_key
+        self.text = ""
+
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_key = None
+        self._in_array = False
+        self._array_done = False
+        self._item_start = None
+
+    def feed(self, chunk: str) -> List[dict]:
+        """
+        Consume a chunk of streamed text.
+
+        Args:
+            chunk: Next piece of the response
+
+        Returns:
+            Array items completed by this chunk, in order
+        """
+        self.text += chunk
+        text = self.text
+        items = []
+
+        for i in range(self._pos, len(text)):
+            char = text[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_key = text[self._string_start + 1:i]
+                continue
+
+            if self._depth == 0:
+                if char == "{":
+                    self._depth = 1
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char in "{[":
+                self._depth += 1
+                if (
+                    char == "["
+                    and self._depth == 2
+                    and self._last_key == self.array_key
+                    and not self._array_done
+                ):
+                    self._in_array = True
+                elif char == "{" and self._in_array and self._depth == 3:
+                    self._item_start = i
+            elif char in "}]":
+                if char == "}" and self._in_array and self._depth == 3 and self._item_start is not None:
+                    try:
+                        items.append(json.loads(text[self._item_start:i + 1]))
+                    except json.JSONDecodeError:
+                        pass
+                    self._item_start = None
+                elif char == "]" and self._in_array and self._depth == 2:
+                    self._in_array = False
+                    self._array_done = True
+                self._depth -= 1
+
+        self._pos = len(text)
+        return items
+
+
+class SequenceBuffer:
+    """
+    Releases streamed items in sequence-number order.
+
+    Items may arrive in any order. Each is held until every lower sequence
+    number (counting from ``start``) has been released, so consumers see the
+    same order as sorting the finished list. ``flush`` releases whatever is
+    left once the stream ends (items after a gap in the numbering).
+    """
+
+    def __init__(self, start: int = 1):
+        """
+        Initialize buffer.
+
+        Args:
+            start: First expected sequence number
+        """
+        self._next = start
+        self._pending = {}
+        self._arrival = 0
+
+    def push(self, sequence_number: int, item) -> list:
+        """
+        Add an item.
+
+        Args:
+            sequence_number: The item's position
+            item: Item to release in order
+
+        Returns:
+            Items now ready, in sequence order
+        """
+        self._pending.setdefault(sequence_number, []).append((self._arrival, item))
+        self._arrival += 1
+
+        ready = []
+        while self._next in self._pending:
+            ready.extend(item for _, item in self._pending.pop(self._next))
+            self._next += 1
+        return ready
+
+    def flush(self) -> list:
+        """
+        Release all held items.
+
+        Returns:
+            Remaining items in sequence order (ties in arrival order)
+        """
+        pending, self._pending = self._pending, {}
+        return [item for _, entries in sorted(pending.items()) for _, item in entries]
@@ -0,0 +1,99 @@
+"""
+LLM registry - shared, lazily created LLM clients.
+"""
+import threading
+from typing import Callable, Dict, List
+
+from video_engine.llm.base import BaseLLMClient
+from video_engine.llm.claude_client import ClaudeClient
+
+
+class LLMRegistry:
+    """
+    Registry of long-lived LLM clients.
+
+    Each client is created on first use and then shared by every job and
+    health check, so SDK setup happens once and connection pools stay warm.
+    Clients that fail to initialize (e.g. missing API key) are not cached
+    and are retried on the next request.
+    """
+
+    def __init__(self):
+        """Initialize LLM registry."""
+        self._factories: Dict[str, Callable[[], BaseLLMClient]] = {}
+        self._clients: Dict[str, BaseLLMClient] = {}
+        self._lock = threading.Lock()
+        self._register_default_llms()
+
+    def _register_default_llms(self):
+        """Register default LLM providers."""
+        self.register("claude", ClaudeClient)
+
+    def register(self, name: str, factory: Callable[[], BaseLLMClient]):
+        """
+        Register an LLM provider.
+
+        Args:
+            name: Provider name (e.g., "claude")
+            factory: Callable creating the client
+        """
+        with self._lock:
+            self._factories[name] = factory
+            self._clients.pop(name, None)
+
+    def get_client(self, name: str) -> BaseLLMClient:
+        """
+        Get the shared client for a provider, creating it on first use.
+
+        Args:
+            name: Provider name
+
+        Returns:
+            LLM client
+
+        Raises:
+            NotImplementedError: For providers that are not implemented yet
+            ValueError: For unknown providers or missing configuration
+        """
+        with self._lock:
+            client = self._clients.get(name)
+            if client is not None:
+                return client
+
+            factory = self._factories.get(name)
+            if factory is None:
+                if name == "openai":
+                    # Will implement OpenAI later
+                    raise NotImplementedError("OpenAI client not yet implemented")
+                raise ValueError(f"Unknown LLM: {name}")
+
+            client = factory()
+            self._clients[name] = client
+            return client
+
+    def list_available(self) -> List[str]:
+        """
+        List providers whose clients can be used.
+
+        Returns:
+            Names of available providers
+        """
+        available = []
+
+        for name in list(self._factories):
+            try:
+                if self.get_client(name).is_available():
+                    available.append(name)
+            except Exception:
+                pass
+
+        return available
+
+    def reset(self):
+        """Drop cached clients (e.g. after API keys change)."""
+        with self._lock:
+            self._clients.clear()
+
+
+# Global registry instance
+llm_registry = LLMRegistry()
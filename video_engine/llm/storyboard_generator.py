@@ -1,49 +1,59 @@
 """
 Storyboard generator - manages LLM clients.
 """
-from typing import Optional
+from typing import Optional, Callable
 from video_engine.llm.base import BaseLLMClient
-from video_engine.llm.claude_client import ClaudeClient
-from video_engine.models.schemas import Storyboard
+from video_engine.llm.registry import llm_registry
+from video_engine.models.schemas import Storyboard, Shot
+from video_engine.storage.storyboard_cache import StoryboardCache
 from video_engine.config import config
 
 
 class StoryboardGenerator:
     """Manages storyboard generation using available LLMs."""
 
-    def __init__(self, llm: str = "claude"):
+    def __init__(self, llm: str = "claude", cache: Optional[StoryboardCache] = None):
         """
         Initialize storyboard generator.
 
         Args:
             llm: LLM to use ("claude" or "openai")
+            cache: Storyboard cache (a default one is opened when
+                config.STORYBOARD_CACHE_ENABLED and none is given)
         """
         self.llm_name = llm
         self.client = self._get_client(llm)
 
+        if cache is None and config.STORYBOARD_CACHE_ENABLED:
+            cache = StoryboardCache()
+        self.cache = cache
+
     def _get_client(self, llm: str) -> BaseLLMClient:
-        """Get LLM client."""
-        if llm == "claude":
-            return ClaudeClient()
-        elif llm == "openai":
-            # Will implement OpenAI later
-            raise NotImplementedError("OpenAI client not yet implemented")
-        else:
-            raise ValueError(f"Unknown LLM: {llm}")
+        """Get the shared LLM client."""
+        return llm_registry.get_client(llm)
 
     def generate(
         self,
         user_prompt: str,
         max_shots: int = 5,
         style_preferences: Optional[dict] = None,
+        use_cache: bool = True,
+        on_shot: Optional[Callable[[Shot], None]] = None,
     ) -> Storyboard:
         """
         Generate storyboard from user prompt.
 
+        Identical requests (same normalized prompt, max_shots and style) are
+        answered from the storyboard cache unless ``use_cache`` is False; a
+        fresh storyboard still replaces the cached one.
+
         Args:
             user_prompt: User's video description
             max_shots: Maximum number of shots
             style_preferences: Optional style guidance
+            use_cache: Whether a cached storyboard may be returned
+            on_shot: Optional callback receiving each shot as soon as it is
+                available (streamed from the LLM, or all at once on a cache hit)
 
         Returns:
             Storyboard object
@@ -51,23 +61,36 @@ class StoryboardGenerator:
         if not self.client.is_available():
             raise RuntimeError(f"{self.llm_name} client not available (check API key)")
 
-        return self.client.generate_storyboard(
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(
+                user_prompt,
+                max_shots,
+                style_preferences,
+                llm=self.llm_name,
+                model=getattr(self.client, "model", None),
+            )
+            if use_cache:
+                storyboard = self.cache.get(cache_key, user_prompt)
+                if storyboard:
+                    if on_shot:
+                        for shot in storyboard.shots:
+                            on_shot(shot)
+                    return storyboard
+
+        storyboard = self.client.generate_storyboard(
             user_prompt=user_prompt,
             max_shots=max_shots,
             style_preferences=style_preferences,
+            on_shot=on_shot,
         )
 
+        if cache_key:
+            self.cache.put(cache_key, storyboard)
+
+        return storyboard
+
     @staticmethod
     def get_available_llms() -> list:
         """Get list of available LLM providers."""
-        available = []
-
-        # Check Claude
-        try:
-            claude = ClaudeClient()
-            if claude.is_available():
-                available.append("claude")
-        except:
-            pass
-
-        return available
+        return llm_registry.list_available()
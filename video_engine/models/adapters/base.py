@@ -1,8 +1,10 @@
 """
 Base model adapter interface.
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional, Callable
+from pathlib import Path
+from typing import Optional, Callable, Union
 from PIL import Image
 
 from video_engine.models.schemas import (
@@ -13,9 +15,17 @@ from video_engine.models.schemas import (
 )
 
 
+# A decoded image, or the path of an image file not decoded yet
+ImageInput = Union[Image.Image, Path]
+
+
 class BaseModelAdapter(ABC):
     """Base class for video generation model adapters."""
 
+    # Adapters that can use image files as-is receive Paths instead of
+    # decoded images from generate_from_shot
+    ACCEPTS_IMAGE_PATHS: bool = False
+
     def __init__(self, model_id: str):
         """
         Initialize adapter.
@@ -75,13 +85,57 @@ class BaseModelAdapter(ABC):
             num_inference_steps: Number of inference steps
             seed: Random seed for reproducibility
             progress_callback: Optional callback(message, progress) for progress updates
-            **kwargs: Additional model-specific parameters
+            **kwargs: Additional model-specific parameters. ``output_path``
+                asks the adapter to write the video directly to that path;
+                adapters that ignore it return a temporary path instead.
 
         Returns:
             VideoGenerationResult object
         """
         pass
 
+    async def agenerate_video(
+        self,
+        prompt: str,
+        *,
+        reference_image: Optional[Image.Image] = None,
+        first_frame: Optional[Image.Image] = None,
+        last_frame: Optional[Image.Image] = None,
+        num_frames: int = 81,
+        fps: int = 8,
+        guidance_scale: float = 6.0,
+        num_inference_steps: int = 25,
+        seed: Optional[int] = None,
+        progress_callback: Optional[Callable[[str, float], None]] = None,
+        **kwargs,
+    ) -> VideoGenerationResult:
+        """
+        Generate video without blocking the event loop.
+
+        Takes the same parameters as ``generate_video``. Adapters backed by
+        remote APIs should override this with a native implementation; the
+        default runs ``generate_video`` on a worker thread. Native
+        implementations call ``progress_callback`` on the event loop, so it
+        must not block.
+
+        Returns:
+            VideoGenerationResult object
+        """
+        return await asyncio.to_thread(
+            self.generate_video,
+            prompt,
+            reference_image=reference_image,
+            first_frame=first_frame,
+            last_frame=last_frame,
+            num_frames=num_frames,
+            fps=fps,
+            guidance_scale=guidance_scale,
+            num_inference_steps=num_inference_steps,
+            seed=seed,
+            progress_callback=progress_callback,
+            **kwargs,
+        )
+
     @abstractmethod
     def estimate_time(self, shot: Shot) -> float:
         """
@@ -109,6 +163,7 @@ class BaseModelAdapter(ABC):
         self,
         shot: Shot,
         progress_callback: Optional[Callable[[str, float], None]] = None,
+        output_path: Optional[Path] = None,
     ) -> VideoGenerationResult:
         """
         Convenience method to generate video from Shot object.
@@ -116,29 +171,55 @@ class BaseModelAdapter(ABC):
         Args:
             shot: Shot specification
             progress_callback: Optional progress callback
+            output_path: Preferred output location (see generate_video)
 
         Returns:
             VideoGenerationResult
         """
-        # Load images if paths provided
-        reference_image = None
-        first_frame = None
-        last_frame = None
-
-        if shot.reference_image_path:
-            reference_image = Image.open(shot.reference_image_path).convert("RGB")
+        return self.generate_video(**self._shot_params(shot, progress_callback, output_path))
 
-        if shot.first_frame_path:
-            first_frame = Image.open(shot.first_frame_path).convert("RGB")
+    async def agenerate_from_shot(
+        self,
+        shot: Shot,
+        progress_callback: Optional[Callable[[str, float], None]] = None,
+        output_path: Optional[Path] = None,
+    ) -> VideoGenerationResult:
+        """
+        Async counterpart of ``generate_from_shot``.
 
-        if shot.last_frame_path:
-            last_frame = Image.open(shot.last_frame_path).convert("RGB")
+        Args:
+            shot: Shot specification
+            progress_callback: Optional progress callback
+            output_path: Preferred output location (see generate_video)
 
-        return self.generate_video(
+        Returns:
+            VideoGenerationResult
+        """
+        params = await asyncio.to_thread(self._shot_params, shot, progress_callback, output_path)
+        return await self.agenerate_video(**params)
+
+    @classmethod
+    def _load_image(cls, path: Optional[str]) -> Optional[ImageInput]:
+        """Decode an image file, or pass its path through when accepted."""
+        if not path:
+            return None
+        if cls.ACCEPTS_IMAGE_PATHS:
+            return Path(path)
+        return Image.open(path).convert("RGB")
+
+    @classmethod
+    def _shot_params(
+        cls,
+        shot: Shot,
+        progress_callback: Optional[Callable[[str, float], None]],
+        output_path: Optional[Path] = None,
+    ) -> dict:
+        """Load a shot's images and map it to generate_video parameters."""
+        params = dict(
             prompt=shot.text_prompt,
-            reference_image=reference_image,
-            first_frame=first_frame,
-            last_frame=last_frame,
+            reference_image=cls._load_image(shot.reference_image_path),
+            first_frame=cls._load_image(shot.first_frame_path),
+            last_frame=cls._load_image(shot.last_frame_path),
             num_frames=shot.num_frames,
             fps=shot.fps,
             guidance_scale=shot.guidance_scale,
@@ -146,3 +227,8 @@ class BaseModelAdapter(ABC):
             seed=shot.seed,
             progress_callback=progress_callback,
         )
+
+        if output_path is not None:
+            params["output_path"] = output_path
+
+        return params
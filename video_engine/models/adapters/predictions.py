@@ -0,0 +1,141 @@
+"""
+Waiting on remote predictions via webhooks with polling fallback.
+"""
+import asyncio
+import threading
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from video_engine.storage.prediction_store import PredictionStore
+from video_engine.config import config
+
+
+TERMINAL_STATUSES = {"succeeded", "failed", "canceled"}
+
+
+class PredictionWaiter:
+    """
+    Waits for remote predictions to reach a terminal state.
+
+    A webhook delivered for the prediction (in this process directly, or in
+    another process via the prediction store) wakes the waiter, which then
+    fetches the prediction from the provider; the delivered payload itself is
+    never trusted for status or output. Until a delivery arrives the provider
+    is polled with exponential backoff; when webhooks are enabled the polling
+    is only a slow safety net.
+    """
+
+    def __init__(self, store: Optional[PredictionStore] = None):
+        """
+        Initialize waiter.
+
+        Args:
+            store: Shared webhook delivery store (opened lazily by default)
+        """
+        self._store = store
+        self._lock = threading.Lock()
+        # prediction_id -> (loop, wake-up event) of in-process waiters
+        self._waiters: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = {}
+
+    @property
+    def store(self) -> PredictionStore:
+        """Prediction store, opened on first use."""
+        with self._lock:
+            if self._store is None:
+                self._store = PredictionStore()
+            return self._store
+
+    def deliver(self, payload: dict) -> bool:
+        """
+        Handle a webhook payload.
+
+        Args:
+            payload: Prediction object sent by the provider
+
+        Returns:
+            True if a waiter in this process was woken
+        """
+        # Only the ID and status are used, to decide whom to wake
+        self.store.record(payload)
+
+        if payload.get("status") not in TERMINAL_STATUSES:
+            return False
+
+        with self._lock:
+            waiter = self._waiters.get(payload["id"])
+
+        if waiter is None:
+            return False
+
+        loop, woken = waiter
+        loop.call_soon_threadsafe(woken.set)
+        return True
+
+    async def wait(
+        self,
+        prediction_id: str,
+        reload: Callable[[], Awaitable[dict]],
+        on_update: Optional[Callable[[dict], None]] = None,
+        webhook: bool = False,
+    ) -> dict:
+        """
+        Wait for a prediction to finish.
+
+        Args:
+            prediction_id: Provider prediction ID
+            reload: Coroutine function fetching the prediction from the provider
+            on_update: Optional callback for every polled (non-final) state
+            webhook: Whether a webhook was registered for the prediction
+
+        Returns:
+            Final prediction payload, as fetched from the provider
+        """
+        loop = asyncio.get_running_loop()
+        woken = asyncio.Event()
+
+        with self._lock:
+            self._waiters[prediction_id] = (loop, woken)
+
+        delay = config.PREDICTION_POLL_INITIAL
+        max_delay = config.PREDICTION_POLL_MAX * (4 if webhook else 1)
+        next_poll = loop.time() + delay
+        seen_delivery = None
+
+        try:
+            while True:
+                if webhook:
+                    # Each delivery wakes the waiter once, wherever it arrived
+                    delivered = await asyncio.to_thread(self.store.get, prediction_id)
+                    if (
+                        delivered
+                        and delivered.get("status") in TERMINAL_STATUSES
+                        and delivered != seen_delivery
+                    ):
+                        seen_delivery = delivered
+                        woken.set()
+
+                if woken.is_set() or loop.time() >= next_poll:
+                    woken.clear()
+                    payload = await reload()
+                    if payload.get("status") in TERMINAL_STATUSES:
+                        return payload
+                    if on_update:
+                        on_update(payload)
+
+                    delay = min(delay * 2, max_delay)
+                    next_poll = loop.time() + delay
+
+                timeout = max(0.0, next_poll - loop.time())
+                if webhook:
+                    # Also look for deliveries received by other processes
+                    timeout = min(timeout, config.PREDICTION_POLL_INITIAL)
+
+                try:
+                    await asyncio.wait_for(woken.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            with self._lock:
+                self._waiters.pop(prediction_id, None)
+
+
+prediction_waiter = PredictionWaiter()
@@ -2,24 +2,32 @@
 Replicate API adapter for video generation models.
 """
 import time
+import uuid
 from typing import Optional, Callable
 from pathlib import Path
 import replicate
-from PIL import Image
+from replicate.prediction import Prediction
 
-from video_engine.models.adapters.base import BaseModelAdapter
+from video_engine.models.adapters.base import BaseModelAdapter, ImageInput
+from video_engine.models.adapters.predictions import prediction_waiter
+from video_engine.models.adapters.uploads import upload_cache
 from video_engine.models.schemas import (
     Shot,
     ModelCapabilities,
     MemoryRequirements,
     VideoGenerationResult,
 )
+from video_engine.utils.async_runner import CallbackRelay, run_async
+from video_engine.utils.http import download_file, get_transport, http_timeout
 from video_engine.config import config
 
 
 class ReplicateAdapter(BaseModelAdapter):
     """Adapter for Replicate cloud models."""
 
+    # Image files are uploaded as-is, without decoding
+    ACCEPTS_IMAGE_PATHS = True
+
     # Model configurations
     MODELS = {
         "replicate:svd": {
@@ -50,8 +58,12 @@ class ReplicateAdapter(BaseModelAdapter):
         if not config.REPLICATE_API_TOKEN:
             raise ValueError("REPLICATE_API_TOKEN not configured")
 
-        # Set API token
-        self.client = replicate.Client(api_token=config.REPLICATE_API_TOKEN)
+        # Sync and async API calls share the process-wide connection pool
+        self.client = replicate.Client(
+            api_token=config.REPLICATE_API_TOKEN,
+            timeout=http_timeout(),
+            transport=get_transport(),
+        )
 
         # Get model config
         if model_id not in self.MODELS:
@@ -74,6 +86,7 @@ class ReplicateAdapter(BaseModelAdapter):
             max_frames=self.model_config["max_frames"],
             max_duration_seconds=10.0,
             recommended_fps=8,
+            input_resolution=(1024, 576),  # SVD's native resolution
             requires_gpu=False,  # Cloud model
             estimated_vram_gb=0.0,  # Cloud handles this
         )
@@ -82,9 +95,9 @@ class ReplicateAdapter(BaseModelAdapter):
         self,
         prompt: str,
         *,
-        reference_image: Optional[Image.Image] = None,
-        first_frame: Optional[Image.Image] = None,
-        last_frame: Optional[Image.Image] = None,
+        reference_image: Optional[ImageInput] = None,
+        first_frame: Optional[ImageInput] = None,
+        last_frame: Optional[ImageInput] = None,
         num_frames: int = 81,
         fps: int = 8,
         guidance_scale: float = 6.0,
@@ -96,10 +109,14 @@ class ReplicateAdapter(BaseModelAdapter):
         """
         Generate video using Replicate API.
 
+        Runs ``agenerate_video`` on the shared event loop, so the wait for
+        the prediction costs no thread of its own beyond the caller. Progress
+        callbacks run on the calling thread, never on the shared loop.
+
         Args:
             prompt: Text prompt (note: SVD doesn't use text, only for I2V)
-            reference_image: Input image for I2V
-            first_frame: First frame conditioning
+            reference_image: Input image (or image file) for I2V
+            first_frame: First frame conditioning (image or image file)
             num_frames: Number of frames to generate
             fps: Frames per second
             guidance_scale: Motion bucket ID (higher = more motion)
@@ -108,6 +125,51 @@ class ReplicateAdapter(BaseModelAdapter):
             progress_callback: Progress callback
             **kwargs: Additional parameters
 
+        Returns:
+            VideoGenerationResult
+        """
+        relay = CallbackRelay(progress_callback) if progress_callback else None
+
+        return run_async(self.agenerate_video(
+            prompt,
+            reference_image=reference_image,
+            first_frame=first_frame,
+            last_frame=last_frame,
+            num_frames=num_frames,
+            fps=fps,
+            guidance_scale=guidance_scale,
+            num_inference_steps=num_inference_steps,
+            seed=seed,
+            progress_callback=relay,
+            **kwargs,
+        ), relay)
+
+    async def agenerate_video(
+        self,
+        prompt: str,
+        *,
+        reference_image: Optional[ImageInput] = None,
+        first_frame: Optional[ImageInput] = None,
+        last_frame: Optional[ImageInput] = None,
+        num_frames: int = 81,
+        fps: int = 8,
+        guidance_scale: float = 6.0,
+        num_inference_steps: int = 25,
+        seed: Optional[int] = None,
+        progress_callback: Optional[Callable[[str, float], None]] = None,
+        **kwargs,
+    ) -> VideoGenerationResult:
+        """
+        Generate video using a non-blocking Replicate prediction.
+
+        The prediction is created without waiting, then awaited by polling
+        with exponential backoff. When REPLICATE_WEBHOOK_URL and
+        REPLICATE_WEBHOOK_SECRET are set, a webhook delivery triggers an
+        immediate poll; the result always comes from the provider.
+
+        Args:
+            Same as ``generate_video``
+
         Returns:
             VideoGenerationResult
         """
@@ -123,17 +185,16 @@ class ReplicateAdapter(BaseModelAdapter):
                     error_message="SVD requires an input image (reference_image or first_frame)",
                 )
 
-            # Save image to temporary file
-            temp_image_path = config.TEMP_DIR / f"temp_input_{int(time.time())}.png"
-            input_image.save(temp_image_path)
-
             if progress_callback:
                 progress_callback("Uploading image to Replicate", 10.0)
 
+            # SVD renders a fixed number of frames
+            output_frames = 14 if num_frames <= 25 else 25
+
             # Prepare inputs for Replicate
             inputs = {
-                "input_image": open(temp_image_path, "rb"),
-                "video_length": "14_frames_with_svd" if num_frames <= 25 else "25_frames_with_svd_xt",
+                "input_image": await upload_cache.resolve(self.client, input_image),
+                "video_length": "14_frames_with_svd" if output_frames == 14 else "25_frames_with_svd_xt",
                 "sizing_strategy": "maintain_aspect_ratio",
                 "frames_per_second": fps,
                 "motion_bucket_id": int(guidance_scale * 20),  # Convert to motion bucket (0-255)
@@ -143,22 +204,53 @@ class ReplicateAdapter(BaseModelAdapter):
             if seed is not None:
                 inputs["seed"] = seed
 
+            webhook_params = {}
+            if config.REPLICATE_WEBHOOK_URL and config.REPLICATE_WEBHOOK_SECRET:
+                webhook_params = {
+                    "webhook": config.REPLICATE_WEBHOOK_URL,
+                    "webhook_events_filter": ["completed"],
+                }
+
+            # Create prediction (returns immediately)
+            prediction = await self.client.predictions.async_create(
+                version=self.model_config["version"].split(":", 1)[-1],
+                input=inputs,
+                **webhook_params,
+            )
+
             if progress_callback:
                 progress_callback("Starting video generation on Replicate", 20.0)
 
-            # Run prediction
-            output = self.client.run(
-                self.model_config["version"],
-                input=inputs,
+            async def reload() -> dict:
+                await prediction.async_reload()
+                return prediction.dict()
+
+            def on_update(payload: dict):
+                if not progress_callback:
+                    return
+                progress = Prediction.Progress.parse(payload.get("logs") or "")
+                if progress:
+                    progress_callback("Generating on Replicate", 20.0 + 65.0 * progress.percentage)
+
+            result = await prediction_waiter.wait(
+                prediction.id,
+                reload,
+                on_update=on_update,
+                webhook=bool(webhook_params),
             )
 
-            # Clean up temp image
-            temp_image_path.unlink(missing_ok=True)
+            if result.get("status") != "succeeded":
+                return VideoGenerationResult(
+                    success=False,
+                    error_message=f"Replicate prediction {result.get('status')}: {result.get('error')}",
+                    generation_time_seconds=time.time() - start_time,
+                )
 
             if progress_callback:
                 progress_callback("Downloading generated video", 90.0)
 
             # Output is a URL to the video file
+            output = result.get("output")
             if isinstance(output, str):
                 video_url = output
             elif isinstance(output, list) and len(output) > 0:
@@ -169,14 +261,12 @@ class ReplicateAdapter(BaseModelAdapter):
                     error_message=f"Unexpected output format from Replicate: {type(output)}",
                 )
 
-            # Download video
-            import requests
-            response = requests.get(video_url)
-            response.raise_for_status()
-
-            # Save to output file
-            output_path = config.TEMP_DIR / f"replicate_output_{int(time.time())}.mp4"
-            output_path.write_bytes(response.content)
+            # Stream the video straight to its final location
+            output_path = Path(
+                kwargs.get("output_path")
+                or config.TEMP_DIR / f"replicate_output_{uuid.uuid4().hex}.mp4"
+            )
+            await download_file(video_url, output_path)
 
             generation_time = time.time() - start_time
 
@@ -186,12 +276,13 @@ class ReplicateAdapter(BaseModelAdapter):
             return VideoGenerationResult(
                 success=True,
                 output_path=str(output_path),
-                duration_seconds=num_frames / fps,
-                num_frames=num_frames,
+                duration_seconds=output_frames / fps,
+                num_frames=output_frames,
                 generation_time_seconds=generation_time,
                 metadata={
                     "model": self.model_id,
                     "provider": "replicate",
+                    "prediction_id": prediction.id,
                 },
             )
 
@@ -0,0 +1,171 @@
+"""
+In-memory image handoff to remote model providers.
+"""
+import io
+import time
+import base64
+import asyncio
+import hashlib
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from PIL import Image
+
+from video_engine.models.adapters.base import ImageInput
+from video_engine.config import config
+
+
+# Formats providers accept as-is, with their MIME types
+PASSTHROUGH_FORMATS = {
+    "PNG": "image/png",
+    "JPEG": "image/jpeg",
+    "WEBP": "image/webp",
+}
+
+# Re-upload slightly before the provider expires a file
+EXPIRY_MARGIN_SECONDS = 300
+
+
+def encode_image(image: ImageInput) -> Tuple[bytes, str]:
+    """
+    Get upload bytes for an image without touching disk.
+
+    Image files that are already RGB in a format providers accept are sent
+    byte-for-byte (only their header is read); anything else is converted
+    to RGB and encoded as PNG in memory.
+
+    Args:
+        image: Decoded image or image file path
+
+    Returns:
+        Tuple of (bytes, MIME type)
+    """
+    if isinstance(image, Path):
+        with Image.open(image) as source:
+            if source.format in PASSTHROUGH_FORMATS and source.mode == "RGB":
+                return image.read_bytes(), PASSTHROUGH_FORMATS[source.format]
+            image = source.convert("RGB")
+
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue(), "image/png"
+
+
+def data_uri(data: bytes, content_type: str) -> str:
+    """Encode bytes as a data URI."""
+    return f"data:{content_type};base64,{base64.b64encode(data).decode()}"
+
+
+class UploadCache:
+    """
+    Uploaded input files, keyed by content hash.
+
+    Small images are passed inline as data URIs. Larger ones are uploaded
+    to the provider's file API once and the returned URL is reused until the
+    file expires; concurrent shots sharing an image wait for one upload.
+    """
+
+    def __init__(self, ttl: Optional[float] = None, inline_max_bytes: Optional[int] = None):
+        """
+        Initialize upload cache.
+
+        Args:
+            ttl: Seconds an uploaded URL is reused when the provider gives no
+                expiry (defaults to config.REPLICATE_UPLOAD_CACHE_TTL)
+            inline_max_bytes: Largest image sent as a data URI (defaults to
+                config.REPLICATE_INLINE_IMAGE_MAX_BYTES)
+        """
+        self.ttl = config.REPLICATE_UPLOAD_CACHE_TTL if ttl is None else ttl
+        self.inline_max_bytes = (
+            config.REPLICATE_INLINE_IMAGE_MAX_BYTES if inline_max_bytes is None else inline_max_bytes
+        )
+        self._lock = threading.Lock()
+        # digest -> (url, expires_at)
+        self._urls: Dict[str, Tuple[str, float]] = {}
+        # digest -> (loop, future) of uploads in flight
+        self._pending: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = {}
+        self.hits = 0
+        self.uploads = 0
+
+    def _expires_at(self, file) -> float:
+        """Local expiry time for an uploaded file."""
+        expires_at = time.time() + self.ttl
+        if getattr(file, "expires_at", None):
+            try:
+                provider_expiry = datetime.fromisoformat(file.expires_at.replace("Z", "+00:00")).timestamp()
+                expires_at = min(expires_at, provider_expiry - EXPIRY_MARGIN_SECONDS)
+            except ValueError:
+                pass
+        return expires_at
+
+    async def resolve(self, client, image: ImageInput) -> str:
+        """
+        Get a URL a prediction can read the image from.
+
+        Args:
+            client: replicate.Client used for uploads
+            image: Decoded image or image file path
+
+        Returns:
+            Data URI or uploaded file URL
+        """
+        data, content_type = await asyncio.to_thread(encode_image, image)
+
+        if len(data) <= self.inline_max_bytes:
+            return data_uri(data, content_type)
+
+        digest = hashlib.sha256(data).hexdigest()
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            cached = self._urls.get(digest)
+            if cached and cached[1] > time.time():
+                self.hits += 1
+                return cached[0]
+
+            pending = self._pending.get(digest)
+            owner = pending is None or pending[0] is not loop
+            if owner:
+                future = loop.create_future()
+                self._pending[digest] = (loop, future)
+            else:
+                future = pending[1]
+                self.hits += 1
+
+        if not owner:
+            return await asyncio.shield(future)
+
+        try:
+            file = await client.files.async_create(
+                io.BytesIO(data),
+                filename=f"{digest[:16]}.{content_type.split('/')[-1]}",
+                content_type=content_type,
+            )
+            url = file.urls["get"]
+
+            with self._lock:
+                self._urls[digest] = (url, self._expires_at(file))
+                self.uploads += 1
+            future.set_result(url)
+            return url
+        finally:
+            with self._lock:
+                if self._pending.get(digest, (None, None))[1] is future:
+                    del self._pending[digest]
+            if not future.done():
+                # Upload failed or was cancelled - let waiters fail too
+                future.set_exception(IOError(f"Upload of image {digest[:16]} failed"))
+                future.exception()
+
+    def clear(self):
+        """Forget uploaded URLs."""
+        with self._lock:
+            self._urls.clear()
+
+
+# Uploads shared by all Replicate adapters
+upload_cache = UploadCache()
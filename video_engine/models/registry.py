@@ -1,7 +1,7 @@
 """
 Model registry - manages available video generation models.
 """
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from video_engine.models.adapters.base import BaseModelAdapter
 from video_engine.models.adapters.replicate_adapter import ReplicateAdapter
 from video_engine.models.schemas import ModelInfo
@@ -105,6 +105,19 @@ class ModelRegistry:
 
         return None
 
+    def get_input_resolutions(self) -> Dict[str, Optional[Tuple[int, int]]]:
+        """
+        Get the input image resolution of every registered model.
+
+        Returns:
+            Mapping of model ID to (width, height), or None for models that
+            take images at any size
+        """
+        return {
+            model_id: adapter.get_capabilities().input_resolution
+            for model_id, adapter in self._adapters.items()
+        }
+
     def is_model_available(self, model_id: str) -> bool:
         """
         Check if a model is available.
@@ -3,7 +3,7 @@ Core data models for video generation system.
 """
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from pydantic import BaseModel, Field
 
 
@@ -44,6 +44,10 @@ class Shot(BaseModel):
     first_frame_path: Optional[str] = None
     last_frame_path: Optional[str] = None
 
+    # Conditioning links to neighbouring shots (resolved to frame paths at render time)
+    first_frame_from_shot: Optional[str] = Field(default=None, description="Shot whose last frame starts this shot")
+    last_frame_from_shot: Optional[str] = Field(default=None, description="Shot whose first frame ends this shot")
+
     # Generation parameters
     camera_movement: Optional[str] = Field(default="static", description="Camera movement type")
     camera_angle: Optional[str] = Field(default="eye_level", description="Camera angle")
@@ -63,6 +67,7 @@ class Shot(BaseModel):
 
     # Output
     output_video_path: Optional[str] = None
+    output_duration_seconds: Optional[float] = None
     generation_time_seconds: Optional[float] = None
 
 
@@ -99,6 +104,11 @@ class VideoJob(BaseModel):
     generation_mode: GenerationMode = Field(default=GenerationMode.TEXT_TO_VIDEO)
     model_id: str = Field(default="replicate:svd-xt")
     reference_image_path: Optional[str] = None
+    reference_file_id: Optional[str] = Field(default=None, description="Upload store ID of the reference image")
+    shot_parallelism: Optional[int] = Field(default=None, ge=1, description="Shots rendered concurrently")
+    max_shots: Optional[int] = Field(default=None, ge=1, description="Maximum number of storyboard shots")
+    style_preferences: Optional[Dict[str, Any]] = None
+    fresh_storyboard: bool = Field(default=False, description="Bypass the storyboard cache")
 
     # Storyboard
     storyboard: Optional[Storyboard] = None
@@ -110,6 +120,7 @@ class VideoJob(BaseModel):
 
     # Output
     output_video_path: Optional[str] = None
+    output_video_sha256: Optional[str] = None
     intermediate_videos: List[str] = Field(default_factory=list)
 
     # Error handling
@@ -130,14 +141,29 @@ class VideoJob(BaseModel):
         self.error_message = error
         self.updated_at = datetime.now()
 
-    def mark_completed(self, output_path: str):
+    def mark_completed(self, output_path: str, sha256: Optional[str] = None):
         """Mark job as completed."""
         self.status = JobStatus.COMPLETED
         self.output_video_path = output_path
+        self.output_video_sha256 = sha256
         self.progress_percentage = 100.0
         self.updated_at = datetime.now()
 
 
+class JobSummary(BaseModel):
+    """Lightweight job projection for listings (no storyboard)."""
+    id: str
+    status: JobStatus
+    created_at: datetime
+    updated_at: datetime
+    user_prompt: str
+    model_id: str
+    current_step: str
+    progress_percentage: float
+    output_video_path: Optional[str] = None
+    error_message: Optional[str] = None
+
+
 class ModelCapabilities(BaseModel):
     """Model capabilities specification."""
     supports_text_to_video: bool = False
@@ -149,6 +175,10 @@ class ModelCapabilities(BaseModel):
     max_frames: int = 81
     max_duration_seconds: float = 10.0
     recommended_fps: int = 8
+    # Input images are resized to fit (width, height) before upload
+    input_resolution: Optional[Tuple[int, int]] = None
+    # Whether generated clips carry an audio track
+    generates_audio: bool = False
 
     requires_gpu: bool = True
     estimated_vram_gb: float = 8.0
@@ -1,14 +1,97 @@
 """
 File management utilities.
 """
+import os
+import uuid
 import shutil
+import hashlib
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 from datetime import datetime, timedelta
 
+from video_engine.storage.upload_store import UploadStore, upload_path_for
 from video_engine.config import config
 
 
+class UploadTooLargeError(ValueError):
+    """Raised when an upload exceeds the size limit."""
+
+
+class UploadWriter:
+    """
+    Writes an upload to disk chunk by chunk, hashing it on the way.
+
+    Memory use is one chunk regardless of upload size. The file is stored
+    at its content-addressed path, so uploading identical content again
+    reuses the existing file.
+    """
+
+    def __init__(self, filename: str, max_bytes: Optional[int] = None):
+        """
+        Start an upload.
+
+        Args:
+            filename: Original filename (its extension is kept)
+            max_bytes: Size limit (defaults to config.MAX_UPLOAD_SIZE_BYTES)
+        """
+        self.extension = Path(filename).suffix.lower()
+        self.max_bytes = max_bytes or config.MAX_UPLOAD_SIZE_BYTES
+        self.size = 0
+        self._digest = hashlib.sha256()
+
+        config.VIDEO_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+        self._temp_path = config.VIDEO_UPLOAD_DIR / f".upload_{uuid.uuid4().hex}.partial"
+        self._file = open(self._temp_path, "wb")
+
+    def write(self, chunk: bytes):
+        """
+        Append a chunk.
+
+        Args:
+            chunk: Next bytes of the upload
+
+        Raises:
+            UploadTooLargeError: If the upload exceeds the size limit (the
+                partial file is removed)
+        """
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            self.abort()
+            raise UploadTooLargeError(
+                f"File too large. Maximum size: {self.max_bytes / 1024 / 1024:g}MB"
+            )
+
+        self._digest.update(chunk)
+        self._file.write(chunk)
+
+    def finish(self) -> Tuple[Path, str, bool]:
+        """
+        Complete the upload.
+
+        Returns:
+            Tuple of (stored path, SHA-256 hex digest, whether identical
+            content was already stored)
+        """
+        self._file.close()
+        digest = self._digest.hexdigest()
+        output_path = upload_path_for(digest, self.extension)
+
+        # The same bytes may already be stored under another extension (.jpg/.jpeg)
+        existing = next(output_path.parent.glob(f"{digest}.*"), None) if output_path.parent.exists() else None
+        if existing is not None:
+            self._temp_path.unlink(missing_ok=True)
+            return existing, digest, True
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(self._temp_path, output_path)
+        return output_path, digest, False
+
+    def abort(self):
+        """Discard the upload."""
+        self._file.close()
+        self._temp_path.unlink(missing_ok=True)
+
+
 class FileManager:
     """Manages file storage and cleanup."""
 
@@ -42,6 +125,23 @@ class FileManager:
         job_dir = FileManager.get_job_output_dir(job_id)
         return job_dir / f"{shot_id}.mp4"
 
+    @staticmethod
+    def get_frame_path(job_id: str, shot_id: str, boundary: str) -> Path:
+        """
+        Get path for a boundary frame extracted from a shot video.
+
+        Args:
+            job_id: Job identifier
+            shot_id: Shot identifier
+            boundary: "first" or "last"
+
+        Returns:
+            Path to frame image
+        """
+        frames_dir = FileManager.get_job_output_dir(job_id) / "frames"
+        frames_dir.mkdir(parents=True, exist_ok=True)
+        return frames_dir / f"{shot_id}_{boundary}.png"
+
     @staticmethod
     def get_final_output_path(job_id: str) -> Path:
         """
@@ -56,27 +156,39 @@ class FileManager:
         job_dir = FileManager.get_job_output_dir(job_id)
         return job_dir / "final_output.mp4"
 
+    @staticmethod
+    def get_hls_dir(job_id: str) -> Path:
+        """
+        Get directory of a job's live HLS playlist.
+
+        The directory is not created here; the playlist creates it when it
+        publishes its first segment, so its existence can be checked.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Path to HLS directory (served under /videos/<job_id>/hls/)
+        """
+        return config.VIDEO_OUTPUT_DIR / job_id / "hls"
+
     @staticmethod
     def save_uploaded_file(file_data: bytes, filename: str) -> Path:
         """
-        Save uploaded file.
+        Save uploaded file in the content-addressed upload store.
 
         Args:
             file_data: File data
             filename: Original filename
 
         Returns:
-            Path to saved file
+            Path to saved file (shared with identical earlier uploads)
         """
-        # Generate unique filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_filename = Path(filename).stem[:50]  # Limit length
-        extension = Path(filename).suffix
-
-        output_path = config.VIDEO_UPLOAD_DIR / f"{timestamp}_{safe_filename}{extension}"
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        writer = UploadWriter(filename, max_bytes=max(len(file_data), 1))
+        writer.write(file_data)
+        output_path, digest, _ = writer.finish()
 
-        output_path.write_bytes(file_data)
+        UploadStore().register(output_path, digest, filename, len(file_data))
         return output_path
 
     @staticmethod
@@ -102,14 +214,20 @@ class FileManager:
         """
         cutoff_date = datetime.now() - timedelta(days=days)
 
-        # Clean up videos
+        upload_store = UploadStore()
+
+        # Clean up videos, dropping the expired jobs' upload references
         for job_dir in config.VIDEO_OUTPUT_DIR.iterdir():
             if job_dir.is_dir():
                 mtime = datetime.fromtimestamp(job_dir.stat().st_mtime)
                 if mtime < cutoff_date:
                     shutil.rmtree(job_dir)
+                    upload_store.release_job(job_dir.name)
+
+        # Clean up uploads no job uses anymore
+        upload_store.purge_unreferenced(older_than_seconds=days * 86400)
 
-        # Clean up uploads
+        # Clean up abandoned partial uploads and files from the old flat layout
         for upload_file in config.VIDEO_UPLOAD_DIR.iterdir():
             if upload_file.is_file():
                 mtime = datetime.fromtimestamp(upload_file.stat().st_mtime)
@@ -0,0 +1,111 @@
+"""
+Live HLS playlists of jobs that are still rendering.
+"""
+import os
+import uuid
+import shutil
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from video_engine.config import config
+
+
+PLAYLIST_NAME = "index.m3u8"
+
+
+class HLSPlaylist:
+    """
+    An HLS event playlist that grows as segments are published.
+
+    Segments are MPEG-TS files carrying their position on the job timeline,
+    so players can start with the first shot and keep polling the playlist
+    for later ones. The playlist is rewritten atomically on every change.
+    Its target duration is fixed up front, as players only read it once.
+    """
+
+    def __init__(self, directory: Path, target_duration: Optional[int] = None):
+        """
+        Initialize playlist.
+
+        Args:
+            directory: Directory holding the playlist and its segments
+            target_duration: Longest segment in whole seconds (defaults to
+                config.HLS_TARGET_DURATION)
+        """
+        self.directory = Path(directory)
+        self.path = self.directory / PLAYLIST_NAME
+        self.target_duration = target_duration or config.HLS_TARGET_DURATION
+        self._lock = threading.Lock()
+        self._segments: List[Tuple[str, float]] = []
+        self._ended = False
+
+    @property
+    def ended(self) -> bool:
+        """Whether the playlist has been marked complete."""
+        return self._ended
+
+    def reset(self):
+        """Remove the playlist and its segments (e.g. of an earlier run)."""
+        with self._lock:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            self._segments = []
+            self._ended = False
+
+    def publish(self, segment_path: Path, duration: float):
+        """
+        Move a TS segment into the playlist directory and list it.
+
+        Args:
+            segment_path: Rendered TS segment (moved, not copied)
+            duration: Segment duration in seconds
+        """
+        if round(duration) > self.target_duration:
+            print(f"HLS segment of {duration:.3f}s exceeds the {self.target_duration}s target duration")
+
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            name = f"segment_{len(self._segments):04d}.ts"
+            os.replace(segment_path, self.directory / name)
+            self._segments.append((name, duration))
+            self._write()
+
+    def end(self):
+        """Mark the playlist complete so players stop polling."""
+        with self._lock:
+            if self._segments and not self._ended:
+                self._ended = True
+                self._write()
+
+    def render(self) -> str:
+        """
+        Render the playlist text.
+
+        Returns:
+            M3U8 playlist
+        """
+        lines = [
+            "#EXTM3U",
+            "#EXT-X-VERSION:3",
+            "#EXT-X-PLAYLIST-TYPE:EVENT",
+            f"#EXT-X-TARGETDURATION:{self.target_duration}",
+            "#EXT-X-MEDIA-SEQUENCE:0",
+        ]
+
+        for number, (name, duration) in enumerate(self._segments):
+            if number:
+                # Shots and re-encoded transitions come from different encodes
+                lines.append("#EXT-X-DISCONTINUITY")
+            lines.append(f"#EXTINF:{duration:.3f},")
+            lines.append(name)
+
+        if self._ended:
+            lines.append("#EXT-X-ENDLIST")
+
+        return "\n".join(lines) + "\n"
+
+    def _write(self):
+        """Replace the playlist file atomically."""
+        tmp_path = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex}")
+        tmp_path.write_text(self.render())
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,229 @@
+"""
+Preprocessed, model-ready variants of uploaded images.
+"""
+import os
+import json
+import uuid
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+from PIL import Image, ImageOps
+
+from video_engine.storage.render_cache import hash_file
+from video_engine.config import config
+
+
+# Formats adapters can send as-is, with their file suffixes
+PASSTHROUGH_FORMATS = {"PNG": ".png", "JPEG": ".jpg", "WEBP": ".webp"}
+
+
+def dhash(image: Image.Image, size: int = 8) -> str:
+    """
+    Compute a difference hash (perceptual hash) of an image.
+
+    Args:
+        image: Image to hash
+        size: Hash grid width (the hash has size * size bits)
+
+    Returns:
+        Hex string; similar images differ in few bits
+    """
+    pixels = image.convert("L").resize((size + 1, size), Image.Resampling.LANCZOS).tobytes()
+
+    bits = 0
+    for row in range(size):
+        for col in range(size):
+            left = pixels[row * (size + 1) + col]
+            right = pixels[row * (size + 1) + col + 1]
+            bits = (bits << 1) | (left > right)
+
+    return f"{bits:0{size * size // 4}x}"
+
+
+def _variant_name(resolution: Optional[Tuple[int, int]]) -> str:
+    """File stem of the variant for a target resolution."""
+    return f"{resolution[0]}x{resolution[1]}" if resolution else "rgb"
+
+
+class ImageVariantStore:
+    """
+    Uploaded images decoded once and stored ready for each model.
+
+    Entries are keyed by the SHA-256 of the source file and live at
+    ``<root>/<digest[:2]>/<digest>/``: ``meta.json`` (dimensions, format,
+    perceptual hash, variants per model) plus one RGB PNG per target
+    resolution, fitted inside it with the aspect ratio kept. Images that are
+    already RGB in a passthrough format are their own full-size variant.
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        """
+        Initialize variant store.
+
+        Args:
+            root: Storage directory (defaults to config.IMAGE_VARIANTS_DIR)
+        """
+        self.root = Path(root or config.IMAGE_VARIANTS_DIR)
+        self._lock = threading.Lock()
+        # (path, size, mtime) -> digest, so repeat lookups skip hashing
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+
+    def _entry_dir(self, digest: str) -> Path:
+        """Directory holding an image's metadata and variants."""
+        return self.root / digest[:2] / digest
+
+    def digest_for(self, source: Union[str, Path]) -> str:
+        """
+        Get the content hash of an image file.
+
+        Args:
+            source: Image file
+
+        Returns:
+            SHA-256 hex digest
+        """
+        source = Path(source)
+        stat = source.stat()
+        key = (str(source.resolve()), stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            digest = self._digests.get(key)
+        if digest is None:
+            digest = hash_file(source)
+            with self._lock:
+                self._digests[key] = digest
+        return digest
+
+    def get_metadata(self, digest: str) -> Optional[dict]:
+        """
+        Get stored metadata for an image.
+
+        Args:
+            digest: Content hash
+
+        Returns:
+            Metadata dict or None if the image was never processed
+        """
+        try:
+            return json.loads((self._entry_dir(digest) / "meta.json").read_text())
+        except (OSError, ValueError):
+            return None
+
+    def process(
+        self,
+        source: Union[str, Path],
+        resolutions: Dict[str, Optional[Tuple[int, int]]],
+        digest: Optional[str] = None,
+    ) -> dict:
+        """
+        Preprocess an image for a set of models.
+
+        The image is decoded at most once; variants that already exist are
+        kept.
+
+        Args:
+            source: Image file
+            resolutions: Target (width, height) per model ID (None keeps the
+                original size)
+            digest: Content hash if already known (e.g. computed while
+                the file was uploaded)
+
+        Returns:
+            Image metadata
+
+        Raises:
+            OSError: If the image cannot be decoded
+            Image.DecompressionBombError: If the image has too many pixels
+        """
+        source = Path(source)
+        digest = digest or self.digest_for(source)
+        entry_dir = self._entry_dir(digest)
+
+        metadata = self.get_metadata(digest)
+        wanted = {model_id: _variant_name(resolution) for model_id, resolution in resolutions.items()}
+        if metadata and all(metadata["models"].get(m) == v for m, v in wanted.items()):
+            return metadata
+
+        with Image.open(source) as original:
+            # Sources that need no rotation or conversion can be reused byte-for-byte
+            passthrough = (
+                original.format in PASSTHROUGH_FORMATS
+                and original.mode == "RGB"
+                and original.getexif().get(0x0112, 1) == 1
+            )
+            source_format = original.format
+            image = ImageOps.exif_transpose(original).convert("RGB")
+
+        entry_dir.mkdir(parents=True, exist_ok=True)
+
+        metadata = metadata or {
+            "sha256": digest,
+            "width": image.width,
+            "height": image.height,
+            "format": source_format,
+            "dhash": dhash(image),
+            "variants": {},
+            "models": {},
+        }
+
+        for model_id, resolution in resolutions.items():
+            name = _variant_name(resolution)
+
+            if name not in metadata["variants"]:
+                variant = image
+                if resolution and (image.width, image.height) != tuple(resolution):
+                    variant = ImageOps.contain(image, tuple(resolution), Image.Resampling.LANCZOS)
+
+                if variant is image and passthrough:
+                    # Already model-ready - keep a copy of the original bytes
+                    variant_path = entry_dir / f"{name}{PASSTHROUGH_FORMATS[source_format]}"
+                    self._write_atomic(variant_path, source.read_bytes())
+                else:
+                    variant_path = entry_dir / f"{name}.png"
+                    self._save_atomic(variant, variant_path)
+
+                metadata["variants"][name] = {
+                    "file": variant_path.name,
+                    "width": variant.width,
+                    "height": variant.height,
+                }
+
+            metadata["models"][model_id] = name
+
+        self._write_atomic(entry_dir / "meta.json", json.dumps(metadata, indent=2).encode())
+        return metadata
+
+    def variant_for(
+        self,
+        source: Union[str, Path],
+        model_id: str,
+        resolution: Optional[Tuple[int, int]] = None,
+    ) -> Path:
+        """
+        Get the model-ready variant of an image, preprocessing on a miss.
+
+        Args:
+            source: Image file
+            model_id: Model the image is for
+            resolution: The model's input resolution (None keeps the size)
+
+        Returns:
+            Path of the variant file
+        """
+        metadata = self.process(source, {model_id: resolution})
+        variant = metadata["variants"][metadata["models"][model_id]]
+        return self._entry_dir(metadata["sha256"]) / variant["file"]
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        """Write a file so readers never see it half-written."""
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _save_atomic(image: Image.Image, path: Path):
+        """Save an image as PNG atomically."""
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+        image.save(tmp_path, format="PNG")
+        os.replace(tmp_path, path)
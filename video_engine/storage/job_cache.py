@@ -0,0 +1,137 @@
+"""
+In-memory LRU cache of loaded jobs.
+"""
+import time
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Tuple, Union
+
+from video_engine.models.schemas import VideoJob
+from video_engine.storage.job_store import JobStore
+from video_engine.config import config
+
+
+class JobCache:
+    """
+    Bounded LRU cache in front of a JobStore.
+
+    Entries are validated against the job's index version, which every write
+    bumps (including writes from other processes). Within
+    ``revalidate_interval`` seconds of the last validation an entry is served
+    without touching disk at all, so aggressive pollers cost nothing.
+
+    Cached jobs are shared between callers and must be treated as read-only;
+    code that mutates a job should load it from the JobStore directly.
+    """
+
+    def __init__(
+        self,
+        job_store: JobStore,
+        max_size: Optional[int] = None,
+        revalidate_interval: Optional[float] = None,
+    ):
+        """
+        Initialize job cache.
+
+        Args:
+            job_store: Store to load jobs from
+            max_size: Maximum cached jobs (defaults to config.JOB_CACHE_SIZE)
+            revalidate_interval: Seconds an entry is trusted without checking
+                its version (defaults to config.JOB_CACHE_REVALIDATE_INTERVAL)
+        """
+        self.job_store = job_store
+        self.max_size = max_size if max_size is not None else config.JOB_CACHE_SIZE
+        self.revalidate_interval = (
+            revalidate_interval
+            if revalidate_interval is not None
+            else config.JOB_CACHE_REVALIDATE_INTERVAL
+        )
+
+        self._lock = threading.Lock()
+        # job_id -> (version, validated_at, job)
+        self._entries: "OrderedDict[str, Tuple[int, float, VideoJob]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, job_id: str) -> Optional[VideoJob]:
+        """
+        Get a job, loading it from the store on a miss.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            VideoJob (shared, read-only) or None if not found
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(job_id)
+            if entry and now - entry[1] < self.revalidate_interval:
+                self._entries.move_to_end(job_id)
+                self.hits += 1
+                return entry[2]
+
+        version = self.job_store.index.get_version(job_id)
+
+        with self._lock:
+            entry = self._entries.get(job_id)
+
+            if version is None:
+                self._entries.pop(job_id, None)
+            elif entry and entry[0] == version:
+                self._entries[job_id] = (version, now, entry[2])
+                self._entries.move_to_end(job_id)
+                self.hits += 1
+                return entry[2]
+
+            self.misses += 1
+
+        job = self.job_store.load_job(job_id)
+        if job is None or version is None:
+            return job
+
+        with self._lock:
+            self._entries[job_id] = (version, now, job)
+            self._entries.move_to_end(job_id)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return job
+
+    def invalidate(self, job_id: str):
+        """
+        Drop a cached job.
+
+        Args:
+            job_id: Job identifier
+        """
+        with self._lock:
+            self._entries.pop(job_id, None)
+
+    def clear(self):
+        """Drop all cached jobs."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Get cache counters for monitoring.
+
+        Returns:
+            Dictionary with hits, misses, evictions, size and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,329 @@
+"""
+Indexed job metadata for fast listing.
+
+The JSON job documents remain the source of truth; the index keeps one SQLite
+row per job with the columns needed to filter, sort and paginate without
+opening every document. Each row also carries a JobSummary projection so
+list pages never have to load the storyboard.
+"""
+import base64
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, List, Tuple
+
+from video_engine.models.schemas import VideoJob, JobStatus, JobSummary
+from video_engine.storage.sqlite import SQLiteDatabase
+
+
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    model_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs (created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs (status, created_at DESC, id DESC);
+"""
+
+INDEX_MIGRATIONS = [
+    # 1: summary projection columns
+    """
+    ALTER TABLE jobs ADD COLUMN user_prompt TEXT NOT NULL DEFAULT '';
+    ALTER TABLE jobs ADD COLUMN current_step TEXT NOT NULL DEFAULT '';
+    ALTER TABLE jobs ADD COLUMN progress_percentage REAL NOT NULL DEFAULT 0;
+    ALTER TABLE jobs ADD COLUMN output_video_path TEXT;
+    ALTER TABLE jobs ADD COLUMN error_message TEXT
+    """,
+    # 2: live progress written between snapshots
+    """
+    ALTER TABLE jobs ADD COLUMN current_shot_id TEXT
+    """,
+    # 3: change counter for cache validation
+    """
+    ALTER TABLE jobs ADD COLUMN version INTEGER NOT NULL DEFAULT 0
+    """,
+]
+
+SUMMARY_COLUMNS = (
+    "id, status, created_at, updated_at, model_id, user_prompt, "
+    "current_step, progress_percentage, output_video_path, error_message"
+)
+
+
+def encode_cursor(created_at: float, job_id: str) -> str:
+    """Encode a keyset pagination cursor."""
+    raw = f"{created_at!r}|{job_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[float, str]:
+    """
+    Decode a keyset pagination cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, job_id = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        return float(created_at), job_id
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+class JobIndex:
+    """SQLite index of job metadata (WAL mode, safe across processes)."""
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize job index.
+
+        Args:
+            db_path: Index database path
+        """
+        self.db = SQLiteDatabase(db_path, INDEX_SCHEMA, INDEX_MIGRATIONS)
+
+    @property
+    def needs_rebuild(self) -> bool:
+        """Whether rows may be missing or predate the current columns."""
+        return self.db.migrations_applied > 0 or self.is_empty()
+
+    def upsert(self, job: VideoJob):
+        """
+        Insert or update a job's index row.
+
+        Args:
+            job: Job to index
+        """
+        self.db.connection().execute(
+            f"""
+            INSERT INTO jobs ({SUMMARY_COLUMNS}, current_shot_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (id) DO UPDATE SET
+                status = excluded.status,
+                updated_at = excluded.updated_at,
+                model_id = excluded.model_id,
+                user_prompt = excluded.user_prompt,
+                current_step = excluded.current_step,
+                progress_percentage = excluded.progress_percentage,
+                output_video_path = excluded.output_video_path,
+                error_message = excluded.error_message,
+                current_shot_id = excluded.current_shot_id,
+                version = jobs.version + 1
+            """,
+            (
+                job.id,
+                job.status.value,
+                job.created_at.timestamp(),
+                job.updated_at.timestamp(),
+                job.model_id,
+                job.user_prompt,
+                job.current_step,
+                job.progress_percentage,
+                job.output_video_path,
+                job.error_message,
+                job.current_shot_id,
+            ),
+        )
+
+    def update_progress(self, job: VideoJob):
+        """
+        Update only the progress columns of a job's row.
+
+        Args:
+            job: Job whose progress changed
+        """
+        self.db.connection().execute(
+            """
+            UPDATE jobs
+            SET current_step = ?, progress_percentage = ?, current_shot_id = ?, updated_at = ?,
+                version = version + 1
+            WHERE id = ?
+            """,
+            (
+                job.current_step,
+                job.progress_percentage,
+                job.current_shot_id,
+                job.updated_at.timestamp(),
+                job.id,
+            ),
+        )
+
+    def get_version(self, job_id: str) -> Optional[int]:
+        """
+        Get a job's change counter, bumped on every write.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Version number, or None if the job is not indexed
+        """
+        row = self.db.connection().execute(
+            "SELECT version FROM jobs WHERE id = ?",
+            (job_id,),
+        ).fetchone()
+        return None if row is None else row["version"]
+
+    def get_progress(self, job_id: str) -> Optional[dict]:
+        """
+        Get the latest progress recorded for a job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Dict with current_step, progress_percentage, current_shot_id and
+            updated_at, or None if the job is not indexed
+        """
+        row = self.db.connection().execute(
+            """
+            SELECT current_step, progress_percentage, current_shot_id, updated_at
+            FROM jobs WHERE id = ?
+            """,
+            (job_id,),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        return {
+            "current_step": row["current_step"],
+            "progress_percentage": row["progress_percentage"],
+            "current_shot_id": row["current_shot_id"],
+            "updated_at": datetime.fromtimestamp(row["updated_at"]),
+        }
+
+    def delete(self, job_id: str):
+        """
+        Remove a job's index row.
+
+        Args:
+            job_id: Job identifier
+        """
+        self.db.connection().execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+
+    def is_empty(self) -> bool:
+        """Check whether the index has no rows."""
+        return self.db.connection().execute("SELECT 1 FROM jobs LIMIT 1").fetchone() is None
+
+    def count(self, status: Optional[JobStatus] = None) -> int:
+        """
+        Count indexed jobs.
+
+        Args:
+            status: Only count jobs with this status
+
+        Returns:
+            Number of jobs
+        """
+        if status:
+            row = self.db.connection().execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = ?", (status.value,)
+            ).fetchone()
+        else:
+            row = self.db.connection().execute("SELECT COUNT(*) FROM jobs").fetchone()
+        return row[0]
+
+    def query(
+        self,
+        status: Optional[JobStatus] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+    ) -> Tuple[List[str], Optional[str]]:
+        """
+        List job IDs newest first.
+
+        Pass the returned cursor back to fetch the next page; this uses the
+        (created_at, id) index directly instead of scanning skipped rows.
+        ``offset`` is supported for page-number clients but costs O(offset).
+
+        Args:
+            status: Only return jobs with this status
+            limit: Maximum number of IDs to return
+            cursor: Cursor returned by a previous call
+            offset: Rows to skip (ignored when a cursor is given)
+
+        Returns:
+            Tuple of (job IDs, cursor for the next page or None)
+        """
+        rows, next_cursor = self._select("id, created_at", status, limit, cursor, offset)
+        return [row["id"] for row in rows], next_cursor
+
+    def query_summaries(
+        self,
+        status: Optional[JobStatus] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+    ) -> Tuple[List[JobSummary], Optional[str]]:
+        """
+        List job summaries newest first.
+
+        Same paging semantics as ``query``.
+
+        Returns:
+            Tuple of (job summaries, cursor for the next page or None)
+        """
+        rows, next_cursor = self._select(SUMMARY_COLUMNS, status, limit, cursor, offset)
+
+        summaries = [
+            JobSummary(
+                id=row["id"],
+                status=JobStatus(row["status"]),
+                created_at=datetime.fromtimestamp(row["created_at"]),
+                updated_at=datetime.fromtimestamp(row["updated_at"]),
+                user_prompt=row["user_prompt"],
+                model_id=row["model_id"],
+                current_step=row["current_step"],
+                progress_percentage=row["progress_percentage"],
+                output_video_path=row["output_video_path"],
+                error_message=row["error_message"],
+            )
+            for row in rows
+        ]
+
+        return summaries, next_cursor
+
+    def _select(
+        self,
+        columns: str,
+        status: Optional[JobStatus],
+        limit: int,
+        cursor: Optional[str],
+        offset: int,
+    ) -> Tuple[list, Optional[str]]:
+        """Run a paginated newest-first query."""
+        clauses = []
+        params: list = []
+
+        if status:
+            clauses.append("status = ?")
+            params.append(status.value)
+
+        if cursor:
+            created_at, job_id = decode_cursor(cursor)
+            clauses.append("(created_at < ? OR (created_at = ? AND id < ?))")
+            params.extend([created_at, created_at, job_id])
+            offset = 0
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        rows = self.db.connection().execute(
+            f"""
+            SELECT {columns} FROM jobs {where}
+            ORDER BY created_at DESC, id DESC
+            LIMIT ? OFFSET ?
+            """,
+            (*params, limit + 1, offset),
+        ).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+
+        return rows, next_cursor
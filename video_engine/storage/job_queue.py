@@ -0,0 +1,268 @@
+"""
+Persistent job queue backed by SQLite.
+
+The API process enqueues job IDs and worker processes lease them. A lease
+expires unless the worker heartbeats, so jobs held by a crashed worker become
+visible again and are picked up by another worker. Workers also publish
+progress events that the API relays to WebSocket clients.
+"""
+import json
+import time
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+
+from video_engine.storage.sqlite import SQLiteDatabase
+from video_engine.config import config
+
+
+QUEUE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS queue (
+    job_id TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    enqueued_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_queue_state ON queue (state, enqueued_at);
+
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_created ON events (created_at);
+"""
+
+
+class QueueState:
+    """Queue entry states."""
+    QUEUED = "queued"
+    LEASED = "leased"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class JobQueue:
+    """SQLite-backed work queue with visibility timeouts."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Initialize job queue.
+
+        Args:
+            db_path: Queue database path (defaults to config.QUEUE_DB_PATH)
+        """
+        self.db = SQLiteDatabase(db_path or config.QUEUE_DB_PATH, QUEUE_SCHEMA)
+
+    def enqueue(self, job_id: str):
+        """
+        Add a job to the queue (re-queues finished entries).
+
+        Args:
+            job_id: Job identifier
+        """
+        self.db.connection().execute(
+            """
+            INSERT INTO queue (job_id, state, enqueued_at) VALUES (?, ?, ?)
+            ON CONFLICT (job_id) DO UPDATE SET
+                state = excluded.state,
+                attempts = 0,
+                enqueued_at = excluded.enqueued_at,
+                lease_owner = NULL,
+                lease_expires_at = NULL
+            WHERE queue.state IN (?, ?)
+            """,
+            (job_id, QueueState.QUEUED, time.time(), QueueState.DONE, QueueState.FAILED),
+        )
+
+    def claim(self, worker_id: str, visibility_timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Lease the oldest available job.
+
+        Jobs whose lease has expired (their worker crashed or hung) are
+        available again, with their attempt counter incremented.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+            visibility_timeout: Lease length in seconds
+
+        Returns:
+            Dict with job_id and attempts, or None if the queue is empty
+        """
+        timeout = visibility_timeout or config.QUEUE_VISIBILITY_TIMEOUT
+        now = time.time()
+
+        with self.db.transaction() as conn:
+            row = conn.execute(
+                """
+                SELECT job_id, attempts FROM queue
+                WHERE state = ? OR (state = ? AND lease_expires_at < ?)
+                ORDER BY enqueued_at
+                LIMIT 1
+                """,
+                (QueueState.QUEUED, QueueState.LEASED, now),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            conn.execute(
+                """
+                UPDATE queue
+                SET state = ?, attempts = attempts + 1, lease_owner = ?, lease_expires_at = ?
+                WHERE job_id = ?
+                """,
+                (QueueState.LEASED, worker_id, now + timeout, row["job_id"]),
+            )
+
+        return {"job_id": row["job_id"], "attempts": row["attempts"] + 1}
+
+    def heartbeat(self, job_id: str, worker_id: str, visibility_timeout: Optional[float] = None) -> bool:
+        """
+        Extend a lease held by a worker.
+
+        Args:
+            job_id: Job identifier
+            worker_id: Worker holding the lease
+            visibility_timeout: New lease length in seconds
+
+        Returns:
+            False if the lease has been lost to another worker
+        """
+        timeout = visibility_timeout or config.QUEUE_VISIBILITY_TIMEOUT
+        cursor = self.db.connection().execute(
+            """
+            UPDATE queue SET lease_expires_at = ?
+            WHERE job_id = ? AND state = ? AND lease_owner = ?
+            """,
+            (time.time() + timeout, job_id, QueueState.LEASED, worker_id),
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: str, worker_id: str):
+        """
+        Acknowledge a finished job.
+
+        Args:
+            job_id: Job identifier
+            worker_id: Worker holding the lease
+        """
+        self._finish(job_id, worker_id, QueueState.DONE, None)
+
+    def fail(self, job_id: str, worker_id: str, error: str):
+        """
+        Record a job that failed permanently.
+
+        Args:
+            job_id: Job identifier
+            worker_id: Worker holding the lease
+            error: Error message
+        """
+        self._finish(job_id, worker_id, QueueState.FAILED, error)
+
+    def _finish(self, job_id: str, worker_id: str, state: str, error: Optional[str]):
+        """Move a leased job to a terminal state."""
+        self.db.connection().execute(
+            """
+            UPDATE queue
+            SET state = ?, last_error = ?, lease_owner = NULL, lease_expires_at = NULL
+            WHERE job_id = ? AND lease_owner = ?
+            """,
+            (state, error, job_id, worker_id),
+        )
+
+    def is_pending(self, job_id: str) -> bool:
+        """
+        Check whether a job is queued or leased.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            True if the job is waiting for or held by a worker
+        """
+        row = self.db.connection().execute(
+            "SELECT state FROM queue WHERE job_id = ?",
+            (job_id,),
+        ).fetchone()
+        return row is not None and row["state"] in (QueueState.QUEUED, QueueState.LEASED)
+
+    def publish_event(self, job_id: str, event_type: str, payload: Dict[str, Any]):
+        """
+        Publish a job event for the API to relay.
+
+        Args:
+            job_id: Job identifier
+            event_type: "progress", "job_complete" or "error"
+            payload: Event data
+        """
+        self.db.connection().execute(
+            "INSERT INTO events (job_id, type, payload, created_at) VALUES (?, ?, ?, ?)",
+            (job_id, event_type, json.dumps(payload, default=str), time.time()),
+        )
+
+    def read_events(self, after_id: int, limit: int = 500) -> List[Dict[str, Any]]:
+        """
+        Read events published after a cursor.
+
+        Args:
+            after_id: Last event ID already seen
+            limit: Maximum events to return
+
+        Returns:
+            List of event dicts (id, job_id, type, payload)
+        """
+        rows = self.db.connection().execute(
+            "SELECT id, job_id, type, payload FROM events WHERE id > ? ORDER BY id LIMIT ?",
+            (after_id, limit),
+        ).fetchall()
+
+        return [
+            {
+                "id": row["id"],
+                "job_id": row["job_id"],
+                "type": row["type"],
+                "payload": json.loads(row["payload"]),
+            }
+            for row in rows
+        ]
+
+    def last_event_id(self) -> int:
+        """Get the ID of the most recent event (0 if none)."""
+        row = self.db.connection().execute("SELECT MAX(id) AS id FROM events").fetchone()
+        return row["id"] or 0
+
+    def purge_events(self, max_age_seconds: float = 3600.0) -> int:
+        """
+        Delete old events.
+
+        Args:
+            max_age_seconds: Age after which events are deleted
+
+        Returns:
+            Number of deleted events
+        """
+        cursor = self.db.connection().execute(
+            "DELETE FROM events WHERE created_at < ?",
+            (time.time() - max_age_seconds,),
+        )
+        return cursor.rowcount
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get number of entries per queue state.
+
+        Returns:
+            Dictionary of state -> count
+        """
+        rows = self.db.connection().execute(
+            "SELECT state, COUNT(*) AS count FROM queue GROUP BY state"
+        ).fetchall()
+
+        counts = {state: 0 for state in (QueueState.QUEUED, QueueState.LEASED, QueueState.DONE, QueueState.FAILED)}
+        counts.update({row["state"]: row["count"] for row in rows})
+        return counts
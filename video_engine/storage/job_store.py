@@ -1,12 +1,22 @@
 """
 Job storage and metadata management.
+
+Full job documents are written as JSON snapshots at state transitions.
+Progress ticks in between only update the job's index row, coalesced to at
+most one write per PROGRESS_WRITE_INTERVAL seconds per job; the latest
+skipped tick is written when the interval ends.
 """
+import os
 import json
+import time
+import uuid
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple, List, Any
 from datetime import datetime
 
-from video_engine.models.schemas import VideoJob, Storyboard
+from video_engine.models.schemas import VideoJob, Storyboard, JobStatus, JobSummary
+from video_engine.storage.job_index import JobIndex
 from video_engine.config import config
 
 
@@ -23,17 +33,94 @@ class JobStore:
         self.storage_dir = storage_dir or config.JOBS_DIR
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
+        self._progress_lock = threading.Lock()
+        self._last_progress_write: dict[str, float] = {}
+        # Latest coalesced tick per job, written by a timer when its interval ends
+        self._pending_progress: dict[str, VideoJob] = {}
+
+        self.index = JobIndex(self.storage_dir / "index.db")
+        if self.index.needs_rebuild:
+            # First run against existing JSON documents, or new index columns
+            self.rebuild_index()
+
+    @staticmethod
+    def _write_json_atomic(path: Path, data: Any):
+        """Write JSON via a temp file and rename so readers never see a torn file."""
+        temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+
+        try:
+            with open(temp_path, "w") as f:
+                json.dump(data, f, indent=2, default=str)
+            os.replace(temp_path, path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
     def save_job(self, job: VideoJob):
         """
-        Save job to disk.
+        Save a full job snapshot to disk.
+
+        Use at state transitions; use save_progress for progress ticks.
 
         Args:
             job: VideoJob to save
         """
         job_file = self.storage_dir / f"{job.id}.json"
+        self._write_json_atomic(job_file, job.model_dump())
 
-        with open(job_file, "w") as f:
-            json.dump(job.model_dump(), f, indent=2, default=str)
+        self.index.upsert(job)
+
+        with self._progress_lock:
+            self._last_progress_write[job.id] = time.monotonic()
+            # The snapshot carries the latest progress
+            self._pending_progress.pop(job.id, None)
+
+    def save_progress(self, job: VideoJob, force: bool = False) -> bool:
+        """
+        Persist a job's progress without rewriting its document.
+
+        Writes within config.PROGRESS_WRITE_INTERVAL of the previous write for
+        the same job are deferred: the latest one is written when the interval
+        ends, unless a newer write or snapshot has carried it already.
+
+        Args:
+            job: Job whose progress changed
+            force: Write even inside the coalescing interval
+
+        Returns:
+            True if the progress was written now, False if it was deferred
+        """
+        now = time.monotonic()
+
+        with self._progress_lock:
+            last_write = self._last_progress_write.get(job.id)
+            if not force and last_write is not None and now - last_write < config.PROGRESS_WRITE_INTERVAL:
+                if job.id not in self._pending_progress:
+                    timer = threading.Timer(
+                        last_write + config.PROGRESS_WRITE_INTERVAL - now,
+                        self._flush_progress,
+                        args=(job.id,),
+                    )
+                    timer.daemon = True
+                    timer.start()
+                # Copy so the timer writes the values of this tick
+                self._pending_progress[job.id] = job.model_copy()
+                return False
+
+            self._last_progress_write[job.id] = now
+            self._pending_progress.pop(job.id, None)
+
+        self.index.update_progress(job)
+        return True
+
+    def _flush_progress(self, job_id: str):
+        """Write a job's deferred progress tick, if one is still pending."""
+        with self._progress_lock:
+            job = self._pending_progress.pop(job_id, None)
+            if job is None:
+                return
+            self._last_progress_write[job_id] = time.monotonic()
+
+        self.index.update_progress(job)
 
     def load_job(self, job_id: str) -> Optional[VideoJob]:
         """
@@ -67,6 +154,11 @@ class JobStore:
                 storyboard_data["generated_at"] = datetime.fromisoformat(storyboard_data["generated_at"])
             data["storyboard"] = Storyboard(**storyboard_data)
 
+        # Overlay progress written since the last snapshot
+        progress = self.index.get_progress(job_id)
+        if progress and progress["updated_at"] > data.get("updated_at", progress["updated_at"]):
+            data.update(progress)
+
         return VideoJob(**data)
 
     def delete_job(self, job_id: str) -> bool:
@@ -80,6 +172,10 @@ class JobStore:
             True if deleted
         """
         job_file = self.storage_dir / f"{job_id}.json"
+        self.index.delete(job_id)
+
+        with self._progress_lock:
+            self._last_progress_write.pop(job_id, None)
 
         if job_file.exists():
             job_file.unlink()
@@ -89,12 +185,91 @@ class JobStore:
 
     def list_jobs(self) -> list[str]:
         """
-        List all job IDs.
+        List all job IDs stored on disk.
 
         Returns:
             List of job IDs
         """
-        return [f.stem for f in self.storage_dir.glob("*.json")]
+        return [
+            f.stem for f in self.storage_dir.glob("*.json")
+            if not f.stem.startswith("storyboard_")
+        ]
+
+    def query_jobs(
+        self,
+        status: Optional[JobStatus] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+    ) -> Tuple[List[str], Optional[str]]:
+        """
+        List job IDs newest first using the index.
+
+        Args:
+            status: Only return jobs with this status
+            limit: Maximum number of IDs
+            cursor: Keyset cursor from a previous call
+            offset: Rows to skip when no cursor is given
+
+        Returns:
+            Tuple of (job IDs, cursor for the next page or None)
+        """
+        return self.index.query(status=status, limit=limit, cursor=cursor, offset=offset)
+
+    def query_job_summaries(
+        self,
+        status: Optional[JobStatus] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+    ) -> Tuple[List[JobSummary], Optional[str]]:
+        """
+        List job summaries newest first without loading job documents.
+
+        Args:
+            status: Only return jobs with this status
+            limit: Maximum number of summaries
+            cursor: Keyset cursor from a previous call
+            offset: Rows to skip when no cursor is given
+
+        Returns:
+            Tuple of (job summaries, cursor for the next page or None)
+        """
+        return self.index.query_summaries(status=status, limit=limit, cursor=cursor, offset=offset)
+
+    def count_jobs(self, status: Optional[JobStatus] = None) -> int:
+        """
+        Count jobs using the index.
+
+        Args:
+            status: Only count jobs with this status
+
+        Returns:
+            Number of jobs
+        """
+        return self.index.count(status)
+
+    def rebuild_index(self) -> int:
+        """
+        Import every JSON job document into the index.
+
+        Returns:
+            Number of jobs indexed
+        """
+        indexed = 0
+
+        for job_id in self.list_jobs():
+            try:
+                job = self.load_job(job_id)
+            except Exception as e:
+                print(f"Skipping unreadable job {job_id}: {e}")
+                continue
+
+            if job:
+                self.index.upsert(job)
+                indexed += 1
+
+        return indexed
 
     def save_storyboard(self, storyboard: Storyboard):
         """
@@ -104,9 +279,7 @@ class JobStore:
             storyboard: Storyboard to save
         """
         storyboard_file = self.storage_dir / f"storyboard_{storyboard.id}.json"
-
-        with open(storyboard_file, "w") as f:
-            json.dump(storyboard.model_dump(), f, indent=2, default=str)
+        self._write_json_atomic(storyboard_file, storyboard.model_dump())
 
     def load_storyboard(self, storyboard_id: str) -> Optional[Storyboard]:
         """
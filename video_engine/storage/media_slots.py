@@ -0,0 +1,205 @@
+"""
+Host-wide media process slots.
+
+Every process that runs ffmpeg (the API and each queue worker) shares this
+database, so the concurrency limits of the media executor hold for the whole
+host rather than per process. Each process also publishes its executor
+counters here, letting the API report metrics of work done by workers.
+"""
+import os
+import json
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from video_engine.storage.sqlite import SQLiteDatabase
+from video_engine.config import config
+
+
+MEDIA_SLOTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS media_slots (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    state TEXT NOT NULL,
+    pid INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_media_slots_state ON media_slots (state, kind);
+
+CREATE TABLE IF NOT EXISTS media_stats (
+    pid INTEGER PRIMARY KEY,
+    stats TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+# Counters of processes that stopped publishing are dropped after this long
+STATS_RETENTION_SECONDS = 86400.0
+
+
+class SlotState:
+    """Media slot states."""
+    WAITING = "waiting"
+    RUNNING = "running"
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process exists on this host."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MediaSlotStore:
+    """SQLite table of waiting and running media processes on this host."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Initialize slot store.
+
+        Args:
+            db_path: Database path (defaults to config.MEDIA_SLOTS_DB_PATH)
+        """
+        self.db = SQLiteDatabase(db_path or config.MEDIA_SLOTS_DB_PATH, MEDIA_SLOTS_SCHEMA)
+
+    def enqueue(self, slot_id: str, kind: str):
+        """
+        Register an operation waiting for a slot.
+
+        Args:
+            slot_id: Unique operation ID
+            kind: Operation kind (see media_executor)
+        """
+        self.db.connection().execute(
+            "INSERT INTO media_slots (id, kind, state, pid, created_at) VALUES (?, ?, ?, ?, ?)",
+            (slot_id, kind, SlotState.WAITING, os.getpid(), time.time()),
+        )
+
+    def try_start(
+        self,
+        slot_id: str,
+        kind: str,
+        can_start: Callable[[Dict[str, Dict[str, int]], str], bool],
+    ) -> Optional[Dict[str, Dict[str, int]]]:
+        """
+        Move a waiting operation to running if the limits allow it.
+
+        Slots held by processes that no longer exist are freed first, so a
+        crashed worker cannot block the host.
+
+        Args:
+            slot_id: ID passed to ``enqueue``
+            kind: Operation kind passed to ``enqueue``
+            can_start: Callable(usage, kind) deciding whether the operation
+                may start, given ``usage()`` counts of all other operations
+
+        Returns:
+            Usage including this operation as running, or None if it has to
+            keep waiting
+        """
+        with self.db.transaction() as conn:
+            self._reap(conn)
+
+            usage = self._usage(conn, exclude=slot_id)
+            if not can_start(usage, kind):
+                return None
+
+            conn.execute(
+                "UPDATE media_slots SET state = ? WHERE id = ?",
+                (SlotState.RUNNING, slot_id),
+            )
+            usage.setdefault(kind, {SlotState.RUNNING: 0, SlotState.WAITING: 0})[SlotState.RUNNING] += 1
+            return usage
+
+    def release(self, slot_id: str):
+        """
+        Free a slot (running or still waiting).
+
+        Args:
+            slot_id: ID passed to ``enqueue``
+        """
+        self.db.connection().execute("DELETE FROM media_slots WHERE id = ?", (slot_id,))
+
+    def usage(self) -> Dict[str, Dict[str, int]]:
+        """
+        Count operations across all processes.
+
+        Returns:
+            Per operation kind with any slots: running and waiting counts
+        """
+        with self.db.transaction() as conn:
+            self._reap(conn)
+            return self._usage(conn)
+
+    def publish_stats(self, stats: Dict[str, Dict[str, float]]):
+        """
+        Store this process's executor counters.
+
+        Args:
+            stats: Per operation kind: completed, failed, wait_total,
+                wait_max and run_total
+        """
+        now = time.time()
+        conn = self.db.connection()
+        conn.execute(
+            """
+            INSERT INTO media_stats (pid, stats, updated_at) VALUES (?, ?, ?)
+            ON CONFLICT (pid) DO UPDATE SET stats = excluded.stats, updated_at = excluded.updated_at
+            """,
+            (os.getpid(), json.dumps(stats), now),
+        )
+        conn.execute(
+            "DELETE FROM media_stats WHERE updated_at < ?",
+            (now - STATS_RETENTION_SECONDS,),
+        )
+
+    def collect_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Combine the counters published by all processes.
+
+        Returns:
+            Per operation kind: summed completed, failed, wait_total and
+            run_total, and the largest wait_max
+        """
+        totals: Dict[str, Dict[str, float]] = {}
+        rows = self.db.connection().execute("SELECT stats FROM media_stats").fetchall()
+
+        for row in rows:
+            for kind, counters in json.loads(row["stats"]).items():
+                total = totals.setdefault(kind, {})
+                for name, value in counters.items():
+                    if name == "wait_max":
+                        total[name] = max(total.get(name, 0.0), value)
+                    else:
+                        total[name] = total.get(name, 0) + value
+
+        return totals
+
+    @staticmethod
+    def _usage(conn, exclude: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """Count slots by kind and state (call inside a transaction)."""
+        usage: Dict[str, Dict[str, int]] = {}
+        rows = conn.execute(
+            """
+            SELECT kind, state, COUNT(*) AS count FROM media_slots
+            WHERE id != ? GROUP BY kind, state
+            """,
+            (exclude or "",),
+        ).fetchall()
+
+        for row in rows:
+            counts = usage.setdefault(row["kind"], {SlotState.RUNNING: 0, SlotState.WAITING: 0})
+            counts[row["state"]] = row["count"]
+        return usage
+
+    @staticmethod
+    def _reap(conn):
+        """Delete slots of processes that have exited (call inside a transaction)."""
+        pids = [row["pid"] for row in conn.execute("SELECT DISTINCT pid FROM media_slots")]
+        for pid in pids:
+            if not _pid_alive(pid):
+                conn.execute("DELETE FROM media_slots WHERE pid = ?", (pid,))
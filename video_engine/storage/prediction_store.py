@@ -0,0 +1,88 @@
+"""
+Webhook deliveries for remote model predictions.
+
+The API process receives provider webhooks, but the prediction may be awaited
+by a worker process. Deliveries are recorded here so any process sharing the
+workspace can pick them up without polling the provider.
+"""
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+from video_engine.storage.sqlite import SQLiteDatabase
+from video_engine.config import config
+
+
+PREDICTION_SCHEMA = """
+CREATE TABLE IF NOT EXISTS predictions (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    received_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_predictions_received ON predictions (received_at);
+"""
+
+
+class PredictionStore:
+    """SQLite record of the latest webhook payload per prediction."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Initialize prediction store.
+
+        Args:
+            db_path: Database path (defaults to config.PREDICTIONS_DB_PATH)
+        """
+        self.db = SQLiteDatabase(db_path or config.PREDICTIONS_DB_PATH, PREDICTION_SCHEMA)
+
+    def record(self, payload: dict):
+        """
+        Store a webhook payload, replacing earlier ones for the prediction.
+
+        Args:
+            payload: Prediction object as sent by the provider
+        """
+        self.db.connection().execute(
+            """
+            INSERT INTO predictions (id, status, payload, received_at) VALUES (?, ?, ?, ?)
+            ON CONFLICT (id) DO UPDATE SET
+                status = excluded.status,
+                payload = excluded.payload,
+                received_at = excluded.received_at
+            """,
+            (payload["id"], payload.get("status", ""), json.dumps(payload), time.time()),
+        )
+
+    def get(self, prediction_id: str) -> Optional[dict]:
+        """
+        Get the latest payload delivered for a prediction.
+
+        Args:
+            prediction_id: Provider prediction ID
+
+        Returns:
+            Payload dict or None if nothing was delivered
+        """
+        row = self.db.connection().execute(
+            "SELECT payload FROM predictions WHERE id = ?",
+            (prediction_id,),
+        ).fetchone()
+        return json.loads(row["payload"]) if row else None
+
+    def purge(self, older_than_seconds: float = 86400.0) -> int:
+        """
+        Delete old deliveries.
+
+        Args:
+            older_than_seconds: Age threshold
+
+        Returns:
+            Number of rows deleted
+        """
+        cursor = self.db.connection().execute(
+            "DELETE FROM predictions WHERE received_at < ?",
+            (time.time() - older_than_seconds,),
+        )
+        return cursor.rowcount
@@ -0,0 +1,242 @@
+"""
+Content-addressed cache of rendered shot videos.
+"""
+import os
+import json
+import shutil
+import hashlib
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Union
+
+from video_engine.models.schemas import Shot
+from video_engine.config import config
+
+
+def hash_file(path: Union[str, Path], chunk_size: int = 1024 * 1024) -> str:
+    """
+    Compute the SHA-256 of a file's contents.
+
+    Args:
+        path: File to hash
+        chunk_size: Bytes read per iteration
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """
+    Shot renders stored under the hash of everything that determines them.
+
+    Entries live at ``<cache_dir>/<key[:2]>/<key>.mp4``. Each hit refreshes
+    the entry's mtime, and when the cache grows past ``max_bytes`` the
+    least recently used entries are deleted. The directory is shared by all
+    processes using the same workspace.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        """
+        Initialize render cache.
+
+        Args:
+            cache_dir: Cache directory (defaults to config.RENDER_CACHE_DIR)
+            max_bytes: Size bound (defaults to config.RENDER_CACHE_MAX_BYTES)
+            enabled: Whether lookups and stores happen at all
+                (defaults to config.RENDER_CACHE_ENABLED)
+        """
+        self.cache_dir = Path(cache_dir or config.RENDER_CACHE_DIR)
+        self.max_bytes = max_bytes if max_bytes is not None else config.RENDER_CACHE_MAX_BYTES
+        self.enabled = enabled if enabled is not None else config.RENDER_CACHE_ENABLED
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def key_for_shot(self, shot: Shot) -> str:
+        """
+        Compute the cache key for a shot.
+
+        The key covers the model, prompt, generation settings and the
+        contents (not paths) of any conditioning images.
+
+        Args:
+            shot: Shot about to be rendered
+
+        Returns:
+            Hex digest identifying the render
+        """
+        images = {}
+        for name in ("reference_image_path", "first_frame_path", "last_frame_path"):
+            path = getattr(shot, name)
+            images[name] = hash_file(path) if path else None
+
+        params = {
+            "model_id": shot.model_id,
+            "text_prompt": shot.text_prompt,
+            "num_frames": shot.num_frames,
+            "fps": shot.fps,
+            "guidance_scale": shot.guidance_scale,
+            "num_inference_steps": shot.num_inference_steps,
+            "seed": shot.seed,
+            "images": images,
+        }
+
+        encoded = json.dumps(params, sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.mp4"
+
+    def fetch(self, key: str, dest: Path) -> bool:
+        """
+        Materialize a cached render at ``dest``.
+
+        Args:
+            key: Cache key from ``key_for_shot``
+            dest: Where the shot video should be written
+
+        Returns:
+            True on a hit, False if the render must be generated
+        """
+        if not self.enabled:
+            return False
+
+        entry = self._entry_path(key)
+        try:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            self._materialize(entry, dest)
+            os.utime(entry)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return False
+
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def store(self, key: str, src: Path):
+        """
+        Add a rendered shot to the cache.
+
+        Failures are logged and otherwise ignored; the cache is an
+        optimization only.
+
+        Args:
+            key: Cache key from ``key_for_shot``
+            src: Rendered shot video
+        """
+        if not self.enabled:
+            return
+
+        entry = self._entry_path(key)
+        temp = entry.with_name(f"{entry.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            self._materialize(src, temp)
+            os.replace(temp, entry)
+        except OSError as e:
+            temp.unlink(missing_ok=True)
+            print(f"Warning: could not cache render {key[:12]}: {e}")
+            return
+
+        with self._lock:
+            self.stores += 1
+
+        self.evict()
+
+    @staticmethod
+    def _materialize(src: Path, dest: Path):
+        """Hard-link src to dest, copying when linking is not possible."""
+        dest.unlink(missing_ok=True)
+        try:
+            os.link(src, dest)
+        except FileNotFoundError:
+            raise
+        except OSError:
+            shutil.copyfile(src, dest)
+
+    def _entries(self) -> list:
+        """List (mtime, size, path) for every cache entry."""
+        entries = []
+        if not self.cache_dir.exists():
+            return entries
+
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for item in os.scandir(shard.path):
+                if not item.name.endswith(".mp4"):
+                    continue
+                try:
+                    stat = item.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, Path(item.path)))
+
+        return entries
+
+    def evict(self) -> int:
+        """
+        Delete least recently used entries until the cache fits max_bytes.
+
+        Returns:
+            Number of entries deleted
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return 0
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        with self._lock:
+            self.evictions += removed
+        return removed
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Get cache counters for monitoring.
+
+        Hit/miss counters are per process; entry and byte counts describe
+        the shared cache directory.
+
+        Returns:
+            Dictionary with hits, misses, stores, evictions, hit_rate,
+            entries, bytes and max_bytes
+        """
+        entries = self._entries()
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(entries),
+                "bytes": sum(size for _, size, _ in entries),
+                "max_bytes": self.max_bytes,
+            }
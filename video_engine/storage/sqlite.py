@@ -0,0 +1,102 @@
+"""
+SQLite helpers shared by the storage backends.
+"""
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Sequence
+
+
+def connect(db_path: Path, timeout: float = 30.0) -> sqlite3.Connection:
+    """
+    Open a SQLite connection tuned for concurrent readers and writers.
+
+    The database runs in WAL mode so readers (API processes) never block on
+    writers (worker processes) and vice versa.
+
+    Args:
+        db_path: Database file path
+        timeout: Seconds to wait on a locked database
+
+    Returns:
+        SQLite connection in autocommit mode
+    """
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(str(db_path), timeout=timeout, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA busy_timeout={int(timeout * 1000)}")
+    return conn
+
+
+class SQLiteDatabase:
+    """
+    Per-thread SQLite connections to a single database file.
+
+    sqlite3 connections must not be shared between threads, so each thread
+    lazily opens its own connection on first use.
+    """
+
+    def __init__(self, db_path: Path, schema: str, migrations: Optional[Sequence[str]] = None):
+        """
+        Initialize database.
+
+        Args:
+            db_path: Database file path
+            schema: SQL script creating tables and indexes (must be idempotent)
+            migrations: SQL scripts applied in order on top of the schema;
+                progress is tracked in PRAGMA user_version
+        """
+        self.db_path = db_path
+        self._local = threading.local()
+
+        conn = self.connection()
+        conn.executescript(schema)
+
+        # Number of migrations applied when this database was opened
+        self.migrations_applied = self._migrate(conn, migrations or [])
+
+    def _migrate(self, conn: sqlite3.Connection, migrations: Sequence[str]) -> int:
+        """Apply migrations newer than the database's user_version."""
+        with self.transaction():
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            pending = migrations[version:]
+
+            for number, script in enumerate(pending, start=version + 1):
+                for statement in filter(str.strip, script.split(";")):
+                    conn.execute(statement)
+                conn.execute(f"PRAGMA user_version={number}")
+
+        return len(pending)
+
+    def connection(self) -> sqlite3.Connection:
+        """Get the calling thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = connect(self.db_path)
+            self._local.conn = conn
+        return conn
+
+    def transaction(self) -> "_Transaction":
+        """Open a write transaction that takes the database lock immediately."""
+        return _Transaction(self.connection())
+
+
+class _Transaction:
+    """Context manager for BEGIN IMMEDIATE ... COMMIT/ROLLBACK."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.conn.execute("COMMIT")
+        else:
+            self.conn.execute("ROLLBACK")
+        return False
@@ -0,0 +1,219 @@
+"""
+Persistent cache of generated storyboards.
+"""
+import json
+import time
+import uuid
+import hashlib
+import threading
+import unicodedata
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Union
+
+from video_engine.models.schemas import Storyboard
+from video_engine.storage.sqlite import SQLiteDatabase
+from video_engine.config import config
+
+
+# Per-job render state that must not leak between jobs sharing a storyboard
+RENDER_FIELDS = {
+    "reference_image_path",
+    "first_frame_path",
+    "last_frame_path",
+    "output_video_path",
+    "output_duration_seconds",
+    "generation_time_seconds",
+}
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS storyboards (
+    key TEXT PRIMARY KEY,
+    storyboard TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_storyboards_accessed ON storyboards (accessed_at);
+"""
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalize a prompt so trivially different spellings share a cache entry."""
+    return " ".join(unicodedata.normalize("NFKC", prompt).split()).casefold()
+
+
+class StoryboardCache:
+    """
+    SQLite-backed storyboard memoization keyed on the generation inputs.
+
+    Entries expire ``ttl`` seconds after they were generated, and the least
+    recently used entries are dropped once the cache holds more than
+    ``max_entries``. Every hit returns a copy with fresh storyboard and shot
+    IDs so jobs sharing a cached storyboard never share identifiers.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        """
+        Initialize storyboard cache.
+
+        Args:
+            db_path: Cache database (defaults to config.STORYBOARD_CACHE_PATH)
+            ttl: Entry lifetime in seconds (defaults to config.STORYBOARD_CACHE_TTL)
+            max_entries: Size bound (defaults to config.STORYBOARD_CACHE_MAX_ENTRIES)
+        """
+        self.db = SQLiteDatabase(db_path or config.STORYBOARD_CACHE_PATH, CACHE_SCHEMA)
+        self.ttl = ttl if ttl is not None else config.STORYBOARD_CACHE_TTL
+        self.max_entries = max_entries if max_entries is not None else config.STORYBOARD_CACHE_MAX_ENTRIES
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        user_prompt: str,
+        max_shots: int,
+        style_preferences: Optional[dict] = None,
+        llm: str = "",
+        model: Optional[str] = None,
+    ) -> str:
+        """
+        Compute the cache key for a storyboard request.
+
+        Args:
+            user_prompt: User's video description (normalized before hashing)
+            max_shots: Maximum number of shots
+            style_preferences: Optional style guidance
+            llm: LLM provider name
+            model: LLM model identifier
+
+        Returns:
+            Hex digest identifying the request
+        """
+        params = {
+            "prompt": normalize_prompt(user_prompt),
+            "max_shots": max_shots,
+            "style_preferences": style_preferences or {},
+            "llm": llm,
+            "model": model,
+        }
+        encoded = json.dumps(params, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str, user_prompt: str) -> Optional[Storyboard]:
+        """
+        Look up a cached storyboard.
+
+        Args:
+            key: Cache key from ``make_key``
+            user_prompt: Prompt of the current request (stored on the copy)
+
+        Returns:
+            Storyboard with fresh IDs, or None on a miss
+        """
+        now = time.time()
+        conn = self.db.connection()
+
+        row = conn.execute(
+            "SELECT storyboard FROM storyboards WHERE key = ? AND created_at > ?",
+            (key, now - self.ttl),
+        ).fetchone()
+
+        if row is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        conn.execute("UPDATE storyboards SET accessed_at = ? WHERE key = ?", (now, key))
+
+        with self._lock:
+            self.hits += 1
+
+        storyboard = Storyboard.model_validate_json(row["storyboard"])
+        return self._with_fresh_ids(storyboard, user_prompt)
+
+    def put(self, key: str, storyboard: Storyboard):
+        """
+        Cache a generated storyboard and apply eviction.
+
+        Per-job render state on the shots (conditioning frames, outputs) is
+        not stored.
+
+        Args:
+            key: Cache key from ``make_key``
+            storyboard: Storyboard returned by the LLM
+        """
+        now = time.time()
+
+        with self.db.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO storyboards (key, storyboard, created_at, accessed_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    storyboard = excluded.storyboard,
+                    created_at = excluded.created_at,
+                    accessed_at = excluded.accessed_at
+                """,
+                (
+                    key,
+                    storyboard.model_dump_json(exclude={"shots": {"__all__": RENDER_FIELDS}}),
+                    now,
+                    now,
+                ),
+            )
+            conn.execute("DELETE FROM storyboards WHERE created_at <= ?", (now - self.ttl,))
+            conn.execute(
+                """
+                DELETE FROM storyboards WHERE key IN (
+                    SELECT key FROM storyboards
+                    ORDER BY accessed_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+
+    @staticmethod
+    def _with_fresh_ids(storyboard: Storyboard, user_prompt: str) -> Storyboard:
+        """Copy a storyboard, assigning new IDs and remapping shot links."""
+        id_map = {shot.id: f"shot_{uuid.uuid4().hex[:8]}" for shot in storyboard.shots}
+
+        shots = []
+        for shot in storyboard.shots:
+            shots.append(shot.model_copy(update={
+                "id": id_map[shot.id],
+                "first_frame_from_shot": id_map.get(shot.first_frame_from_shot),
+                "last_frame_from_shot": id_map.get(shot.last_frame_from_shot),
+            }))
+
+        return storyboard.model_copy(update={
+            "id": f"storyboard_{uuid.uuid4().hex[:8]}",
+            "user_prompt": user_prompt,
+            "shots": shots,
+            "generated_at": datetime.now(),
+        })
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Get cache counters for monitoring.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate and entries
+        """
+        entries = self.db.connection().execute("SELECT COUNT(*) FROM storyboards").fetchone()[0]
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": entries,
+                "max_entries": self.max_entries,
+            }
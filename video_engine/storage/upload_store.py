@@ -0,0 +1,204 @@
+"""
+Content-addressed store of uploaded reference images.
+
+Uploads are stored once per SHA-256 under sharded directories
+(``uploads/<h[:2]>/<h[2:4]>/<h><ext>``) and given a stable file ID derived
+from the hash. Jobs using an upload hold a reference to it; unreferenced
+uploads are removed by ``purge_unreferenced``.
+"""
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from video_engine.storage.sqlite import SQLiteDatabase
+from video_engine.config import config
+
+
+UPLOAD_SCHEMA = """
+CREATE TABLE IF NOT EXISTS uploads (
+    id TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL UNIQUE,
+    path TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    uploaded_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS upload_refs (
+    upload_id TEXT NOT NULL REFERENCES uploads (id),
+    job_id TEXT NOT NULL,
+    PRIMARY KEY (upload_id, job_id)
+);
+CREATE INDEX IF NOT EXISTS idx_upload_refs_job ON upload_refs (job_id);
+"""
+
+
+def file_id_for(digest: str) -> str:
+    """
+    Get the stable file ID of an upload.
+
+    Args:
+        digest: SHA-256 hex digest of the file
+
+    Returns:
+        File ID ("upload_" + first 16 hex digits)
+    """
+    return f"upload_{digest[:16]}"
+
+
+def upload_path_for(digest: str, extension: str) -> Path:
+    """
+    Get the sharded storage path of an upload.
+
+    Args:
+        digest: SHA-256 hex digest of the file
+        extension: File extension including the dot
+
+    Returns:
+        Path under config.VIDEO_UPLOAD_DIR
+    """
+    return config.VIDEO_UPLOAD_DIR / digest[:2] / digest[2:4] / f"{digest}{extension.lower()}"
+
+
+class UploadStore:
+    """SQLite index of stored uploads and the jobs referencing them."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Initialize upload store.
+
+        Args:
+            db_path: Database path (defaults to config.UPLOADS_DB_PATH)
+        """
+        self.db = SQLiteDatabase(db_path or config.UPLOADS_DB_PATH, UPLOAD_SCHEMA)
+
+    def register(self, path: Path, digest: str, filename: str, size_bytes: int) -> dict:
+        """
+        Record a stored upload (re-uploads of known content only refresh
+        its upload time).
+
+        Args:
+            path: Stored file path
+            digest: SHA-256 hex digest
+            filename: Original filename
+            size_bytes: File size
+
+        Returns:
+            Upload record
+        """
+        file_id = file_id_for(digest)
+        self.db.connection().execute(
+            """
+            INSERT INTO uploads (id, sha256, path, filename, size_bytes, uploaded_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (id) DO UPDATE SET
+                path = excluded.path,
+                uploaded_at = excluded.uploaded_at
+            """,
+            (file_id, digest, str(path), filename, size_bytes, time.time()),
+        )
+        return self.get(file_id)
+
+    def get(self, file_id: str) -> Optional[dict]:
+        """
+        Get an upload record.
+
+        Args:
+            file_id: Upload file ID
+
+        Returns:
+            Record with id, sha256, path, filename, size_bytes,
+            uploaded_at and refcount, or None if unknown
+        """
+        row = self.db.connection().execute(
+            """
+            SELECT uploads.*, COUNT(upload_refs.job_id) AS refcount
+            FROM uploads LEFT JOIN upload_refs ON upload_refs.upload_id = uploads.id
+            WHERE uploads.id = ?
+            GROUP BY uploads.id
+            """,
+            (file_id,),
+        ).fetchone()
+        return dict(row) if row else None
+
+    def resolve(self, file_id: str) -> Path:
+        """
+        Get the stored file of an upload.
+
+        Args:
+            file_id: Upload file ID
+
+        Returns:
+            Path of the stored file
+
+        Raises:
+            ValueError: If the upload is unknown or its file is gone
+        """
+        record = self.get(file_id)
+        if record is None or not Path(record["path"]).exists():
+            raise ValueError(f"Upload not found: {file_id}")
+        return Path(record["path"])
+
+    def acquire(self, file_id: str, job_id: str) -> Path:
+        """
+        Resolve an upload and record that a job uses it.
+
+        Both happen in one transaction, so the upload cannot be purged in
+        between.
+
+        Args:
+            file_id: Upload file ID
+            job_id: Job identifier
+
+        Returns:
+            Path of the stored file
+
+        Raises:
+            ValueError: If the upload is unknown or its file is gone
+        """
+        with self.db.transaction() as conn:
+            row = conn.execute("SELECT path FROM uploads WHERE id = ?", (file_id,)).fetchone()
+            if row is None or not Path(row["path"]).exists():
+                raise ValueError(f"Upload not found: {file_id}")
+
+            conn.execute(
+                "INSERT OR IGNORE INTO upload_refs (upload_id, job_id) VALUES (?, ?)",
+                (file_id, job_id),
+            )
+
+        return Path(row["path"])
+
+    def release_job(self, job_id: str):
+        """
+        Drop all references held by a job.
+
+        Args:
+            job_id: Job identifier
+        """
+        self.db.connection().execute("DELETE FROM upload_refs WHERE job_id = ?", (job_id,))
+
+    def purge_unreferenced(self, older_than_seconds: float = 0.0) -> List[str]:
+        """
+        Delete uploads no job references.
+
+        Args:
+            older_than_seconds: Only purge uploads last uploaded at least
+                this long ago (gives clients time to create a job)
+
+        Returns:
+            IDs of the purged uploads
+        """
+        with self.db.transaction() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, path FROM uploads
+                WHERE uploaded_at < ?
+                AND NOT EXISTS (SELECT 1 FROM upload_refs WHERE upload_refs.upload_id = uploads.id)
+                """,
+                (time.time() - older_than_seconds,),
+            ).fetchall()
+            conn.executemany("DELETE FROM uploads WHERE id = ?", [(row["id"],) for row in rows])
+
+        for row in rows:
+            Path(row["path"]).unlink(missing_ok=True)
+
+        return [row["id"] for row in rows]
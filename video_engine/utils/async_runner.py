@@ -0,0 +1,103 @@
+"""
+Shared background event loop for running coroutines from synchronous code.
+"""
+import queue
+import asyncio
+import threading
+from typing import Any, Callable, Coroutine, Optional
+
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the shared event loop, starting its thread on first use.
+
+    Returns:
+        Running event loop owned by a daemon thread
+    """
+    global _loop
+
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever,
+                name="async-runner",
+                daemon=True,
+            )
+            thread.start()
+            _loop = loop
+
+    return _loop
+
+
+class CallbackRelay:
+    """
+    Carries callback invocations from the shared loop to the calling thread.
+
+    Callbacks such as progress reporting may block (they write job state to
+    SQLite). Run on the shared loop they would stall every coroutine on it,
+    so the coroutine gets the relay in place of the callback; calls are
+    queued and ``run_async`` executes them, in order, on the thread that is
+    waiting for the result.
+    """
+
+    _DONE = object()
+
+    def __init__(self, callback: Callable[..., Any]):
+        """
+        Initialize relay.
+
+        Args:
+            callback: Callback to run on the waiting thread
+        """
+        self.callback = callback
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+
+    def __call__(self, *args):
+        """Queue a call (never blocks, safe on the event loop)."""
+        self._queue.put(args)
+
+    def pump(self, future):
+        """
+        Run queued calls until the future completes.
+
+        Args:
+            future: concurrent.futures.Future of the coroutine
+        """
+        future.add_done_callback(lambda _: self._queue.put(self._DONE))
+
+        while True:
+            args = self._queue.get()
+            if args is self._DONE:
+                return
+            try:
+                self.callback(*args)
+            except BaseException:
+                future.cancel()
+                raise
+
+
+def run_async(coro: Coroutine[Any, Any, Any], relay: Optional[CallbackRelay] = None) -> Any:
+    """
+    Run a coroutine on the shared loop and wait for its result.
+
+    All coroutines submitted this way share one loop, so many concurrent
+    network waits (e.g. prediction polling) cost no extra threads beyond the
+    callers themselves.
+
+    Args:
+        coro: Coroutine to run
+        relay: Callback relay passed to the coroutine, whose calls are run
+            on this thread while waiting
+
+    Returns:
+        The coroutine's result
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_loop())
+    if relay:
+        relay.pump(future)
+    return future.result()
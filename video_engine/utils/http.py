@@ -0,0 +1,350 @@
+"""
+Pooled HTTP clients and streaming downloads.
+"""
+import asyncio
+import re
+import threading
+import weakref
+import importlib.util
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import httpx
+
+from video_engine.config import config
+
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+_lock = threading.Lock()
+_transport: Optional["PooledTransport"] = None
+_sync_client: Optional[httpx.Client] = None
+# Async clients are bound to the event loop they are used on
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class IncompleteDownloadError(IOError):
+    """Raised when a download ends before Content-Length bytes arrived."""
+
+
+def http2_enabled() -> bool:
+    """Whether HTTP/2 is enabled and the h2 package is installed."""
+    return config.HTTP2_ENABLED and importlib.util.find_spec("h2") is not None
+
+
+def pool_limits(max_connections: Optional[int] = None) -> httpx.Limits:
+    """
+    Connection pool limits from config.
+
+    Args:
+        max_connections: Override for the total connection cap
+
+    Returns:
+        httpx.Limits for a pooled transport
+    """
+    max_connections = max_connections or config.HTTP_MAX_CONNECTIONS
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY,
+    )
+
+
+def http_timeout() -> httpx.Timeout:
+    """Default request timeouts from config."""
+    return httpx.Timeout(
+        config.HTTP_READ_TIMEOUT,
+        connect=config.HTTP_CONNECT_TIMEOUT,
+        pool=config.HTTP_POOL_TIMEOUT,
+    )
+
+
+class _ReleasingStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response body that frees its host slot when closed."""
+
+    def __init__(self, stream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    def _release_once(self):
+        if not self._released:
+            self._released = True
+            self._release()
+
+    def __iter__(self):
+        yield from self._stream
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    def close(self):
+        try:
+            self._stream.close()
+        finally:
+            self._release_once()
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release_once()
+
+
+class PooledTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Process-wide keep-alive connection pool.
+
+    Serves both sync and async clients, so SDKs that build one of each
+    (e.g. replicate) share connections with everything else. Requests to a
+    single host are capped at ``max_per_host`` concurrent connections; a
+    request waits for a free slot up to the client's pool timeout.
+
+    The pool outlives the clients sharing it: closing a client does not
+    close the transport.
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_per_host: Optional[int] = None,
+        http2: Optional[bool] = None,
+    ):
+        """
+        Initialize transport.
+
+        Args:
+            max_connections: Total connection cap (defaults to config)
+            max_per_host: Per-host connection cap (defaults to config)
+            http2: Negotiate HTTP/2 (defaults to http2_enabled())
+        """
+        self.limits = pool_limits(max_connections)
+        self.max_per_host = max_per_host or config.HTTP_MAX_CONNECTIONS_PER_HOST
+        self.http2 = http2_enabled() if http2 is None else http2
+
+        self._lock = threading.Lock()
+        self._sync_transport: Optional[httpx.HTTPTransport] = None
+        self._sync_slots: Dict[Tuple[bytes, bytes, Optional[int]], threading.BoundedSemaphore] = {}
+        # Async connection pools and semaphores are bound to their event loop
+        self._async_transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._async_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @staticmethod
+    def _host_key(request: httpx.Request) -> Tuple[bytes, bytes, Optional[int]]:
+        url = request.url
+        return url.raw_scheme, url.raw_host, url.port
+
+    @staticmethod
+    def _pool_timeout(request: httpx.Request) -> Optional[float]:
+        return request.extensions.get("timeout", {}).get("pool")
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request from a sync client."""
+        with self._lock:
+            if self._sync_transport is None:
+                self._sync_transport = httpx.HTTPTransport(limits=self.limits, http2=self.http2)
+            slot = self._sync_slots.setdefault(
+                self._host_key(request), threading.BoundedSemaphore(self.max_per_host)
+            )
+            transport = self._sync_transport
+
+        if not slot.acquire(timeout=self._pool_timeout(request)):
+            raise httpx.PoolTimeout(f"No free connection to {request.url.host}", request=request)
+
+        try:
+            response = transport.handle_request(request)
+        except BaseException:
+            slot.release()
+            raise
+
+        response.stream = _ReleasingStream(response.stream, slot.release)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request from an async client."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._async_transports.get(loop)
+            if transport is None:
+                transport = httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2)
+                self._async_transports[loop] = transport
+            slot = self._async_slots.setdefault(loop, {}).setdefault(
+                self._host_key(request), asyncio.Semaphore(self.max_per_host)
+            )
+
+        try:
+            await asyncio.wait_for(slot.acquire(), self._pool_timeout(request))
+        except asyncio.TimeoutError:
+            raise httpx.PoolTimeout(f"No free connection to {request.url.host}", request=request)
+
+        try:
+            response = await transport.handle_async_request(request)
+        except BaseException:
+            slot.release()
+            raise
+
+        response.stream = _ReleasingStream(response.stream, slot.release)
+        return response
+
+    def close(self):
+        """Keep the shared pool open when a client is closed."""
+
+    async def aclose(self):
+        """Keep the shared pool open when a client is closed."""
+
+
+def get_transport() -> PooledTransport:
+    """
+    Get the process-wide pooled transport.
+
+    Returns:
+        Shared PooledTransport for building HTTP clients
+    """
+    global _transport
+
+    with _lock:
+        if _transport is None:
+            _transport = PooledTransport()
+        return _transport
+
+
+def get_client() -> httpx.Client:
+    """
+    Get the shared sync HTTP client.
+
+    Returns:
+        httpx.Client backed by the shared connection pool
+    """
+    global _sync_client
+
+    transport = get_transport()
+    with _lock:
+        if _sync_client is None or _sync_client.is_closed:
+            _sync_client = httpx.Client(
+                transport=transport,
+                timeout=http_timeout(),
+                follow_redirects=True,
+            )
+        return _sync_client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client for the running event loop.
+
+    Returns:
+        httpx.AsyncClient backed by the shared connection pool
+    """
+    loop = asyncio.get_running_loop()
+    transport = get_transport()
+    with _lock:
+        client = _async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                transport=transport,
+                timeout=http_timeout(),
+                follow_redirects=True,
+            )
+            _async_clients[loop] = client
+        return client
+
+
+def _expected_size(response: httpx.Response) -> Optional[int]:
+    """Total file size announced by a (possibly partial) response."""
+    if response.status_code == 206:
+        match = _CONTENT_RANGE.match(response.headers.get("content-range", ""))
+        if match and match.group(3) != "*":
+            return int(match.group(3))
+        return None
+
+    length = response.headers.get("content-length")
+    return int(length) if length is not None else None
+
+
+async def download_file(
+    url: str,
+    dest: Path,
+    client: Optional[httpx.AsyncClient] = None,
+    chunk_size: Optional[int] = None,
+    max_attempts: Optional[int] = None,
+) -> int:
+    """
+    Stream a URL to disk in constant memory.
+
+    Chunks are written straight to ``dest``. If the connection drops, the
+    download resumes from the bytes already written with an HTTP Range
+    request (or starts over if the server ignores the range). The final size
+    is checked against Content-Length. ``dest`` is removed on failure.
+
+    Args:
+        url: URL to download
+        dest: Destination file
+        client: HTTP client (defaults to the pooled client)
+        chunk_size: Bytes per write (defaults to config.DOWNLOAD_CHUNK_SIZE)
+        max_attempts: Attempts before giving up (defaults to config.DOWNLOAD_MAX_ATTEMPTS)
+
+    Returns:
+        Number of bytes written
+
+    Raises:
+        httpx.HTTPError or IncompleteDownloadError when all attempts fail
+    """
+    client = client or get_async_client()
+    chunk_size = chunk_size or config.DOWNLOAD_CHUNK_SIZE
+    max_attempts = max_attempts or config.DOWNLOAD_MAX_ATTEMPTS
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    expected = None
+
+    try:
+        with open(dest, "wb") as f:
+            for attempt in range(1, max_attempts + 1):
+                headers = {"Accept-Encoding": "identity"}
+                if written:
+                    headers["Range"] = f"bytes={written}-"
+
+                try:
+                    async with client.stream("GET", url, headers=headers) as response:
+                        if response.status_code == 416 and expected == written:
+                            return written
+                        response.raise_for_status()
+
+                        if written and response.status_code != 206:
+                            # Range ignored - start over
+                            f.seek(0)
+                            f.truncate()
+                            written = 0
+
+                        expected = _expected_size(response)
+
+                        async for chunk in response.aiter_raw(chunk_size):
+                            f.write(chunk)
+                            written += len(chunk)
+
+                    if expected is not None and written != expected:
+                        raise IncompleteDownloadError(
+                            f"Received {written} of {expected} bytes from {url}"
+                        )
+
+                    return written
+
+                except (httpx.TransportError, IncompleteDownloadError, httpx.HTTPStatusError) as e:
+                    retryable = not isinstance(e, httpx.HTTPStatusError) or e.response.status_code >= 500
+                    if not retryable or attempt == max_attempts:
+                        raise
+
+                    f.flush()
+                    print(f"Download interrupted at {written} bytes ({e}); retrying")
+                    await asyncio.sleep(min(0.25 * 2 ** (attempt - 1), 10.0))
+
+    except BaseException:
+        dest.unlink(missing_ok=True)
+        raise
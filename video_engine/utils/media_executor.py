@@ -0,0 +1,224 @@
+"""
+Host-wide bounded execution of ffmpeg/ffprobe processes.
+"""
+import os
+import time
+import uuid
+import threading
+import subprocess
+from typing import Dict, List, Optional, Union
+
+from video_engine.storage.media_slots import MediaSlotStore, SlotState
+from video_engine.config import config
+
+
+SHORT = "short"
+ENCODE = "encode"
+
+# How often an operation waiting for a slot re-checks other processes' slots
+SLOT_POLL_SECONDS = 0.05
+
+
+def _count(usage: Dict[str, Dict[str, int]], kind: str, state: str) -> int:
+    """Read a count from MediaSlotStore usage."""
+    return usage.get(kind, {}).get(state, 0)
+
+
+class MediaExecutor:
+    """
+    Runs media processes with concurrency limits shared by all processes.
+
+    Operations are either short (probes, frame extraction, stream-copy
+    remuxes) or encodes. At most ``max_processes`` run at once on the host,
+    of which at most ``max_encodes`` are encodes; when a slot frees up,
+    waiting short operations go first so a probe never queues behind a long
+    encode. Each encode gets an ffmpeg ``-threads`` budget of the cores
+    divided by the number of encodes running or queued, so concurrent
+    encodes share the machine instead of each spawning a thread per core.
+
+    Slots live in a MediaSlotStore in the workspace, so the API process and
+    every queue worker draw from the same limits, and each process publishes
+    its counters there for ``stats``.
+    """
+
+    def __init__(
+        self,
+        cpu_count: Optional[int] = None,
+        max_encodes: Optional[int] = None,
+        max_processes: Optional[int] = None,
+        slots: Optional[MediaSlotStore] = None,
+    ):
+        """
+        Initialize executor.
+
+        Args:
+            cpu_count: Cores available for encoding (defaults to
+                config.MEDIA_CPU_COUNT, then os.cpu_count())
+            max_encodes: Concurrent encode limit (defaults to
+                config.MAX_CONCURRENT_ENCODES, then cpu_count // 4)
+            max_processes: Concurrent process limit (defaults to
+                config.MAX_MEDIA_PROCESSES, then max_encodes + cpu_count)
+            slots: Host-wide slot store (opened lazily by default)
+        """
+        self.cpu_count = cpu_count or config.MEDIA_CPU_COUNT or os.cpu_count() or 1
+        self.max_encodes = max_encodes or config.MAX_CONCURRENT_ENCODES or max(1, self.cpu_count // 4)
+        self.max_processes = max(
+            self.max_encodes + 1,
+            max_processes or config.MAX_MEDIA_PROCESSES or self.max_encodes + self.cpu_count,
+        )
+
+        self._slots = slots
+        # Wakes local waiters as soon as a slot of this process frees up
+        self._cond = threading.Condition()
+        self._completed = {SHORT: 0, ENCODE: 0}
+        self._failed = {SHORT: 0, ENCODE: 0}
+        self._wait_total = {SHORT: 0.0, ENCODE: 0.0}
+        self._wait_max = {SHORT: 0.0, ENCODE: 0.0}
+        self._run_total = {SHORT: 0.0, ENCODE: 0.0}
+
+    @property
+    def slots(self) -> MediaSlotStore:
+        """Slot store, opened on first use."""
+        with self._cond:
+            if self._slots is None:
+                self._slots = MediaSlotStore()
+            return self._slots
+
+    def _can_start(self, usage: Dict[str, Dict[str, int]], kind: str) -> bool:
+        """Check whether an operation may start alongside the others in ``usage``."""
+        if _count(usage, SHORT, SlotState.RUNNING) + _count(usage, ENCODE, SlotState.RUNNING) >= self.max_processes:
+            return False
+
+        if kind == ENCODE:
+            # Short operations waiting for a slot take it first
+            return (
+                _count(usage, ENCODE, SlotState.RUNNING) < self.max_encodes
+                and not _count(usage, SHORT, SlotState.WAITING)
+            )
+
+        return True
+
+    def _acquire(self, kind: str) -> tuple:
+        """
+        Wait for a slot.
+
+        Returns:
+            Tuple of (slot ID, queue wait in seconds, encoder threads)
+        """
+        start = time.monotonic()
+        slot_id = uuid.uuid4().hex
+        slots = self.slots
+
+        slots.enqueue(slot_id, kind)
+        try:
+            while True:
+                usage = slots.try_start(slot_id, kind, self._can_start)
+                if usage is not None:
+                    break
+                with self._cond:
+                    self._cond.wait(SLOT_POLL_SECONDS)
+        except BaseException:
+            slots.release(slot_id)
+            raise
+
+        # Split the cores between the encodes that will run side by side
+        encodes = min(
+            self.max_encodes,
+            _count(usage, ENCODE, SlotState.RUNNING) + _count(usage, ENCODE, SlotState.WAITING),
+        )
+        threads = max(1, self.cpu_count // max(1, encodes))
+
+        return slot_id, time.monotonic() - start, threads
+
+    def _release(self, slot_id: str, kind: str, waited: float, ran: float, failed: bool):
+        """Free a slot and record metrics."""
+        self.slots.release(slot_id)
+
+        with self._cond:
+            self._completed[kind] += 1
+            self._failed[kind] += int(failed)
+            self._wait_total[kind] += waited
+            self._wait_max[kind] = max(self._wait_max[kind], waited)
+            self._run_total[kind] += ran
+            self._cond.notify_all()
+
+            counters = {
+                kind: {
+                    "completed": self._completed[kind],
+                    "failed": self._failed[kind],
+                    "wait_total": self._wait_total[kind],
+                    "wait_max": self._wait_max[kind],
+                    "run_total": self._run_total[kind],
+                }
+                for kind in (SHORT, ENCODE)
+            }
+
+        try:
+            self.slots.publish_stats(counters)
+        except Exception as e:
+            print(f"Failed to publish media metrics: {e}")
+
+    def run(
+        self,
+        cmd: List[str],
+        kind: str = SHORT,
+        check: bool = False,
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a media command once a slot is free.
+
+        Args:
+            cmd: ffmpeg/ffprobe command; for encodes the output path must
+                be the last argument
+            kind: SHORT or ENCODE
+            check: Raise CalledProcessError on a non-zero exit
+
+        Returns:
+            Completed process with text stdout/stderr
+        """
+        slot_id, waited, threads = self._acquire(kind)
+
+        if kind == ENCODE:
+            cmd = [cmd[0], "-filter_complex_threads", str(threads), *cmd[1:-1], "-threads", str(threads), cmd[-1]]
+
+        start = time.monotonic()
+        failed = True
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=check)
+            failed = result.returncode != 0
+            return result
+        finally:
+            self._release(slot_id, kind, waited, time.monotonic() - start, failed)
+
+    def stats(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """
+        Get host-wide executor counters for monitoring.
+
+        Returns:
+            Per operation kind: running, waiting, limit, and - summed over
+            the processes that ran media operations in the last day -
+            completed, failed, average/maximum queue wait and average run
+            time in seconds
+        """
+        usage = self.slots.usage()
+        totals = self.slots.collect_stats()
+
+        stats = {}
+        for kind in (SHORT, ENCODE):
+            counters = totals.get(kind, {})
+            completed = counters.get("completed", 0)
+            stats[kind] = {
+                "running": _count(usage, kind, SlotState.RUNNING),
+                "waiting": _count(usage, kind, SlotState.WAITING),
+                "limit": self.max_encodes if kind == ENCODE else self.max_processes,
+                "completed": completed,
+                "failed": counters.get("failed", 0),
+                "queue_wait_avg": counters.get("wait_total", 0.0) / completed if completed else 0.0,
+                "queue_wait_max": counters.get("wait_max", 0.0),
+                "run_time_avg": counters.get("run_total", 0.0) / completed if completed else 0.0,
+            }
+        return stats
+
+
+# Global executor of this process; limits are enforced across processes
+media_executor = MediaExecutor()
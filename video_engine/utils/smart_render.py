@@ -0,0 +1,197 @@
+"""
+Planning of smart-rendered crossfades.
+
+A crossfade only changes the frames inside the transition window, so only
+those need encoding. Each clip is split at keyframes: its interior (from
+the first keyframe after the incoming fade to the last keyframe before the
+outgoing one) is stream-copied, and the pieces around each transition are
+re-encoded together with the fade. Clips too short to have such keyframes
+are encoded whole as part of the surrounding window. Such windows can span
+several clips, so when the pieces become segments of a live playlist they
+are split into encodes of bounded length, cutting outside the fades.
+
+Pieces are plain dicts:
+
+- ``{"type": "copy", "clip": i, "start": s, "end": e}``
+- ``{"type": "encode", "clips": [(i, start, end), ...]}`` - the listed clip
+  ranges joined with crossfades (a single range is encoded as is)
+"""
+from typing import List, Optional, Sequence
+
+
+# Tolerance when comparing keyframe times with cut points (seconds)
+KEYFRAME_EPSILON = 1e-3
+
+
+def piece_duration(piece: dict, transition_duration: float) -> float:
+    """
+    Get the length of a piece on the output timeline.
+
+    Args:
+        piece: Copy or encode piece
+        transition_duration: Crossfade duration in seconds
+
+    Returns:
+        Duration in seconds
+    """
+    if piece["type"] == "copy":
+        return piece["end"] - piece["start"]
+
+    clips = piece["clips"]
+    return sum(end - start for _, start, end in clips) - (len(clips) - 1) * transition_duration
+
+
+class CrossfadePlanner:
+    """
+    Splits crossfaded clips into copy and encode pieces, one clip at a time.
+
+    Clips are added in timeline order; each call returns the pieces it
+    completed, so the output can be assembled while later clips are still
+    being rendered. ``finish`` returns whatever is left after the last clip.
+    """
+
+    def __init__(self, transition_duration: float, max_encode_duration: Optional[float] = None):
+        """
+        Initialize planner.
+
+        Args:
+            transition_duration: Crossfade duration in seconds
+            max_encode_duration: Longest encode piece in seconds; longer
+                transition windows are split between fades (None keeps each
+                window in one piece)
+        """
+        self.transition_duration = transition_duration
+        self.max_encode_duration = max_encode_duration
+        self._count = 0
+        # Clip ranges waiting to be encoded with the next transition
+        self._window: List[tuple] = []
+
+    def add(self, duration: float, keyframes: Sequence[float]) -> List[dict]:
+        """
+        Add the next clip.
+
+        Args:
+            duration: Clip duration in seconds
+            keyframes: Keyframe times of the clip in seconds
+
+        Returns:
+            Pieces completed by this clip
+        """
+        index = self._count
+        self._count += 1
+        fade = self.transition_duration
+
+        # Stream copy may start at the first keyframe after the incoming fade
+        # and must stop at the last keyframe before the outgoing one
+        head: Optional[float] = 0.0
+        if index > 0:
+            head = next((k for k in sorted(keyframes) if k >= fade - KEYFRAME_EPSILON), None)
+        tail = max((k for k in keyframes if k <= duration - fade + KEYFRAME_EPSILON), default=None)
+
+        if head is None or tail is None or head > tail:
+            # Nothing to copy - the whole clip joins the transition window
+            self._window.append((index, 0.0, duration))
+            return []
+
+        pieces = []
+        if index > 0:
+            self._window.append((index, 0.0, head))
+            pieces.extend(self._encode(self._window))
+        if tail > head:
+            pieces.append({"type": "copy", "clip": index, "start": head, "end": tail})
+
+        self._window = [(index, tail, duration)]
+        return pieces
+
+    def finish(self) -> List[dict]:
+        """
+        Complete the plan after the last clip.
+
+        Returns:
+            Remaining pieces
+        """
+        window, self._window = self._window, []
+
+        if not window:
+            return []
+
+        if len(window) == 1:
+            # The last clip has no outgoing fade - copy it to the end
+            index, start, end = window[0]
+            return [{"type": "copy", "clip": index, "start": start, "end": end}]
+
+        return self._encode(window)
+
+    def _encode(self, window: List[tuple]) -> List[dict]:
+        """Turn a transition window into encode pieces within the length limit."""
+        fade = self.transition_duration
+        limit = self.max_encode_duration
+        pieces = []
+
+        while limit and piece_duration({"type": "encode", "clips": window}, fade) > limit + KEYFRAME_EPSILON:
+            cut = self._find_cut(window, limit)
+            if cut is None:
+                break
+
+            position, at = cut
+            index, start, end = window[position]
+            pieces.append({"type": "encode", "clips": window[:position] + [(index, start, at)]})
+            window = [(index, at, end)] + window[position + 1:]
+
+        pieces.append({"type": "encode", "clips": window})
+        return pieces
+
+    def _find_cut(self, window: List[tuple], limit: float) -> Optional[tuple]:
+        """
+        Find the latest cut keeping the first part of a window within a limit.
+
+        Cuts never fall inside a fade, so each fade stays within one piece.
+
+        Args:
+            window: Clip ranges joined with crossfades
+            limit: Longest first part in seconds
+
+        Returns:
+            Tuple of (position in the window, cut time in that clip), or None
+        """
+        fade = self.transition_duration
+        last = len(window) - 1
+
+        for position in range(last, -1, -1):
+            _, start, end = window[position]
+            # Output time at which this clip range starts
+            range_start = sum(e - s for _, s, e in window[:position]) - position * fade
+            earliest = fade if position > 0 else 0.0
+            latest = end - start - (fade if position < last else 0.0)
+
+            cut = min(latest, limit - range_start)
+            if cut >= earliest and cut > 0:
+                return position, start + cut
+
+        return None
+
+
+def plan_crossfade(
+    durations: Sequence[float],
+    keyframes: Sequence[Sequence[float]],
+    transition_duration: float,
+    max_encode_duration: Optional[float] = None,
+) -> List[dict]:
+    """
+    Split a full list of clips into copy and encode pieces.
+
+    Args:
+        durations: Duration of every clip in seconds
+        keyframes: Keyframe times of every clip in seconds
+        transition_duration: Crossfade duration in seconds
+        max_encode_duration: Longest encode piece in seconds (see CrossfadePlanner)
+
+    Returns:
+        Pieces in timeline order
+    """
+    planner = CrossfadePlanner(transition_duration, max_encode_duration)
+    pieces = []
+    for duration, clip_keyframes in zip(durations, keyframes):
+        pieces.extend(planner.add(duration, clip_keyframes))
+    pieces.extend(planner.finish())
+    return pieces
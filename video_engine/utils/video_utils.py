@@ -1,26 +1,54 @@
 """
 Video processing utilities using FFmpeg.
 """
+import re
+import uuid
+import shutil
 import subprocess
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import json
 
+from video_engine.utils.smart_render import KEYFRAME_EPSILON, piece_duration, plan_crossfade
+from video_engine.utils.media_executor import ENCODE, SHORT, media_executor
 from video_engine.config import config
 
 
+# Audio format of the silence substituted for clips without an audio track
+SILENCE_SOURCE = "anullsrc=channel_layout=stereo:sample_rate=48000"
+
+_INPUT_HEADER = re.compile(r"^Input #(\d+)", re.MULTILINE)
+_DURATION = re.compile(r"Duration: (\d+):(\d+):(\d+(?:\.\d+)?)")
+_AUDIO_STREAM = re.compile(r"Stream #\d+:\d+.*: Audio:")
+_VIDEO_STREAM = re.compile(r"Video: (\w+)[^,]*, (\w+)(?:\([^)]*\))?, (\d+)x(\d+)")
+_FPS = re.compile(r", ([\d.]+) fps")
+
+# Stream codec produced by each encoder (smart rendering must match it)
+ENCODER_CODECS = {"libx264": "h264", "libx265": "hevc"}
+
+
 def concatenate_videos(
     input_paths: List[Path],
     output_path: Path,
     transition_duration: float = 0.0,
+    durations: Optional[List[Optional[float]]] = None,
+    has_audio: Optional[bool] = None,
 ) -> bool:
     """
     Concatenate multiple videos into one.
 
+    Crossfades need every clip's duration and whether clips carry audio.
+    Known values (e.g. from generation results) are used as-is; if anything
+    is missing, all clips are inspected with a single ffmpeg process. Smart
+    crossfades (config.SMART_CROSSFADE) always run that probe, as they also
+    need each clip's format, and re-encode only the transition windows.
+
     Args:
         input_paths: List of input video paths
         output_path: Output video path
         transition_duration: Duration of crossfade transition (0 = cut)
+        durations: Known clip durations in seconds (None entries are probed)
+        has_audio: Whether every clip has an audio track (None = probe)
 
     Returns:
         True if successful
@@ -36,7 +64,9 @@ def concatenate_videos(
             return _concat_simple(input_paths, output_path)
         else:
             # Concatenation with crossfade transitions
-            return _concat_with_crossfade(input_paths, output_path, transition_duration)
+            return _concat_with_crossfade(
+                input_paths, output_path, transition_duration, durations, has_audio
+            )
     except Exception as e:
         print(f"Error concatenating videos: {e}")
         return False
@@ -45,7 +75,7 @@ def concatenate_videos(
 def _concat_simple(input_paths: List[Path], output_path: Path) -> bool:
     """Simple concatenation using concat demuxer."""
     # Create file list
-    list_file = config.TEMP_DIR / f"concat_list_{output_path.stem}.txt"
+    list_file = config.TEMP_DIR / f"concat_list_{uuid.uuid4().hex}.txt"
 
     with open(list_file, "w") as f:
         for path in input_paths:
@@ -65,12 +95,7 @@ def _concat_simple(input_paths: List[Path], output_path: Path) -> bool:
             str(output_path),
         ]
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        result = media_executor.run(cmd, SHORT, check=True)
 
         return True
 
@@ -83,33 +108,31 @@ def _concat_with_crossfade(
     input_paths: List[Path],
     output_path: Path,
     transition_duration: float,
+    durations: Optional[List[Optional[float]]] = None,
+    has_audio: Optional[bool] = None,
 ) -> bool:
-    """Concatenation with crossfade transitions."""
+    """Concatenation with video and audio crossfade transitions."""
     if len(input_paths) == 1:
         # No transitions needed
         return _concat_simple(input_paths, output_path)
 
-    # Build complex filter for crossfade
-    filter_parts = []
-    input_labels = [f"[{i}:v]" for i in range(len(input_paths))]
+    if config.SMART_CROSSFADE:
+        try:
+            if _concat_with_smart_crossfade(input_paths, output_path, transition_duration):
+                return True
+        except Exception as e:
+            print(f"Smart crossfade failed, re-encoding all clips: {e}")
 
-    current_label = input_labels[0]
+    durations = list(durations or [None] * len(input_paths))
 
-    for i in range(len(input_paths) - 1):
-        next_label = input_labels[i + 1]
-        output_label = f"[v{i}]" if i < len(input_paths) - 2 else "[outv]"
+    if has_audio is None or any(d is None for d in durations):
+        probed = probe_inputs(input_paths)
+        durations = [d if d is not None else info["duration"] for d, info in zip(durations, probed)]
+        audio_flags = [info["has_audio"] for info in probed]
+    else:
+        audio_flags = [has_audio] * len(input_paths)
 
-        # Get duration of current video
-        duration = get_video_duration(input_paths[i])
-        offset = max(0, duration - transition_duration)
-
-        filter_parts.append(
-            f"{current_label}{next_label}xfade=transition=fade:duration={transition_duration}:offset={offset}{output_label}"
-        )
-
-        current_label = output_label
-
-    filter_complex = ";".join(filter_parts)
+    filter_complex, audio = build_crossfade_filter(durations, transition_duration, audio_flags)
 
     # Build ffmpeg command
     cmd = [
@@ -120,20 +143,413 @@ def _concat_with_crossfade(
         "-c:v", config.VIDEO_CODEC,
         "-pix_fmt", config.VIDEO_PIXEL_FORMAT,
         "-crf", str(config.VIDEO_CRF),
-        "-y",
-        str(output_path),
     ]
 
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
+    if audio:
+        cmd += ["-map", "[outa]", "-c:a", "aac"]
+
+    cmd += ["-y", str(output_path)]
+
+    result = media_executor.run(cmd, ENCODE, check=True)
 
     return True
 
 
+def _concat_with_smart_crossfade(
+    input_paths: List[Path],
+    output_path: Path,
+    transition_duration: float,
+) -> bool:
+    """
+    Crossfade by encoding only the transition windows.
+
+    Clip interiors are stream-copied between keyframes; only the pieces
+    around each transition are re-encoded. Returns False when the clips
+    cannot be mixed with freshly encoded pieces (different formats, mixed
+    audio) or have no keyframes to cut at.
+    """
+    probed = probe_inputs(input_paths)
+    if not can_smart_render(probed):
+        return False
+
+    durations = [info["duration"] for info in probed]
+    keyframes = [get_keyframe_times(path) for path in input_paths]
+    pieces = plan_crossfade(durations, keyframes, transition_duration)
+
+    if not any(piece["type"] == "copy" for piece in pieces):
+        # Everything needs encoding - the single filter graph is cheaper
+        return False
+
+    work_dir = config.TEMP_DIR / f"crossfade_{output_path.stem}_{uuid.uuid4().hex}"
+    work_dir.mkdir(parents=True, exist_ok=True)
+    joined_path = work_dir / "joined.ts"
+
+    try:
+        offset = 0.0
+        for number, piece in enumerate(pieces):
+            piece_path = work_dir / f"piece_{number:04d}.ts"
+            if not render_crossfade_piece(
+                piece, input_paths, piece_path, offset, transition_duration, probed[0]["has_audio"]
+            ):
+                raise RuntimeError(f"Failed to render piece {number}")
+
+            with open(piece_path, "rb") as src, open(joined_path, "ab") as dst:
+                shutil.copyfileobj(src, dst)
+            piece_path.unlink()
+
+            offset += piece_duration(piece, transition_duration)
+
+        return remux_to_mp4(joined_path, output_path)
+
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def can_smart_render(probed: List[dict]) -> bool:
+    """
+    Check whether clips can be stream-copied next to encoded pieces.
+
+    All clips must share the codec the encoder produces, the pixel format,
+    frame size and rate, and either all or none must have audio.
+
+    Args:
+        probed: Results of probe_inputs for the clips
+
+    Returns:
+        True if smart rendering is possible
+    """
+    expected_codec = ENCODER_CODECS.get(config.VIDEO_CODEC)
+    formats = {info["video"] for info in probed}
+    if len(formats) != 1 or None in formats:
+        return False
+
+    codec, pixel_format, _, _, _ = formats.pop()
+    if codec != expected_codec or pixel_format != config.VIDEO_PIXEL_FORMAT:
+        return False
+
+    return len({info["has_audio"] for info in probed}) == 1
+
+
+def render_crossfade_piece(
+    piece: dict,
+    input_paths: List[Path],
+    output_path: Path,
+    offset: float,
+    transition_duration: float,
+    has_audio: bool,
+) -> bool:
+    """
+    Render one smart-render piece as an MPEG-TS segment.
+
+    Args:
+        piece: Copy or encode piece (see smart_render)
+        input_paths: Clip paths indexed by the piece's clip numbers
+        output_path: Output .ts path
+        offset: Start of the piece on the output timeline (seconds)
+        transition_duration: Crossfade duration in seconds
+        has_audio: Whether the clips have audio tracks
+
+    Returns:
+        True if successful
+    """
+    if piece["type"] == "copy":
+        return remux_to_ts(
+            input_paths[piece["clip"]], output_path, offset, piece["start"], piece["end"]
+        )
+
+    return encode_crossfade_window(
+        [(input_paths[index], start, end) for index, start, end in piece["clips"]],
+        output_path,
+        offset,
+        transition_duration,
+        has_audio,
+    )
+
+
+def encode_crossfade_window(
+    segments: List[Tuple[Path, float, float]],
+    output_path: Path,
+    offset: float,
+    transition_duration: float,
+    has_audio: bool,
+) -> bool:
+    """
+    Encode clip ranges joined with crossfades as an MPEG-TS segment.
+
+    Args:
+        segments: (clip path, start, end) ranges in timeline order
+        output_path: Output .ts path
+        offset: Start of the segment on the output timeline (seconds)
+        transition_duration: Crossfade duration in seconds
+        has_audio: Whether the clips have audio tracks
+
+    Returns:
+        True if successful
+    """
+    filter_complex, audio = build_crossfade_filter(
+        [end - start for _, start, end in segments],
+        transition_duration,
+        [has_audio] * len(segments),
+    )
+
+    cmd = ["ffmpeg"]
+    for path, start, end in segments:
+        cmd += ["-ss", f"{start:.6f}", "-t", f"{end - start:.6f}", "-i", str(path)]
+
+    cmd += [
+        "-filter_complex", filter_complex,
+        "-map", "[outv]",
+        "-c:v", config.VIDEO_CODEC,
+        "-pix_fmt", config.VIDEO_PIXEL_FORMAT,
+        "-crf", str(config.VIDEO_CRF),
+    ]
+
+    if audio:
+        cmd += ["-map", "[outa]", "-c:a", "aac"]
+
+    cmd += ["-output_ts_offset", f"{offset:.6f}", "-f", "mpegts", "-y", str(output_path)]
+
+    try:
+        media_executor.run(cmd, ENCODE, check=True)
+        return True
+
+    except subprocess.CalledProcessError as e:
+        print(f"Error encoding crossfade: {e}")
+        return False
+
+
+def build_crossfade_filter(
+    durations: List[float],
+    transition_duration: float,
+    audio_flags: Optional[List[bool]] = None,
+) -> tuple:
+    """
+    Build the filter graph chaining clips with crossfades.
+
+    Each xfade offset is measured on the output timeline: the sum of all
+    previous clip durations minus the transitions already applied. Audio is
+    crossfaded alongside when any clip has an audio track; clips without one
+    contribute silence of their length.
+
+    Args:
+        durations: Duration of every clip in seconds
+        transition_duration: Crossfade duration in seconds
+        audio_flags: Whether each clip has an audio track
+
+    Returns:
+        Tuple of (filter_complex string, whether "[outa]" is produced)
+    """
+    audio_flags = audio_flags or [False] * len(durations)
+    audio = any(audio_flags)
+    last = len(durations) - 1
+
+    filter_parts = []
+    audio_labels = []
+
+    if audio:
+        for i, (duration, has_track) in enumerate(zip(durations, audio_flags)):
+            if has_track:
+                audio_labels.append(f"[{i}:a]")
+            else:
+                filter_parts.append(f"{SILENCE_SOURCE},atrim=duration={duration}[silence{i}]")
+                audio_labels.append(f"[silence{i}]")
+
+    video_label = "[0:v]"
+    audio_label = audio_labels[0] if audio else None
+    elapsed = 0.0
+
+    for i in range(last):
+        output_suffix = "out" if i == last - 1 else str(i)
+
+        # Timeline position where clip i+1 starts fading in
+        elapsed += durations[i] - transition_duration
+        offset = max(0.0, elapsed)
+
+        filter_parts.append(
+            f"{video_label}[{i + 1}:v]xfade=transition=fade:duration={transition_duration}"
+            f":offset={offset:.3f}[{output_suffix}v]"
+        )
+        video_label = f"[{output_suffix}v]"
+
+        if audio:
+            filter_parts.append(
+                f"{audio_label}{audio_labels[i + 1]}acrossfade=d={transition_duration}[{output_suffix}a]"
+            )
+            audio_label = f"[{output_suffix}a]"
+
+    if last == 0:
+        # A single clip has nothing to fade into
+        filter_parts.append("[0:v]null[outv]")
+        if audio:
+            filter_parts.append(f"{audio_label}anull[outa]")
+
+    return ";".join(filter_parts), audio
+
+
+def probe_inputs(video_paths: List[Path]) -> List[dict]:
+    """
+    Get duration and audio presence of several videos with one process.
+
+    ffmpeg prints a header for every input before it notices there is no
+    output, so a single invocation replaces one ffprobe per file.
+
+    Args:
+        video_paths: Videos to inspect
+
+    Returns:
+        One dict per video with "duration" (seconds), "has_audio" and
+        "video" ((codec, pixel format, width, height, fps) or None)
+    """
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        *[item for path in video_paths for item in ["-i", str(path)]],
+    ]
+
+    # Exits non-zero because no output is given; the headers are on stderr
+    result = media_executor.run(cmd, SHORT)
+
+    sections = _INPUT_HEADER.split(result.stderr)[1:]
+    info = {}
+    for index, section in zip(sections[::2], sections[1::2]):
+        match = _DURATION.search(section)
+        if match is None:
+            continue
+        hours, minutes, seconds = match.groups()
+
+        video = _VIDEO_STREAM.search(section)
+        fps = _FPS.search(section)
+        if video:
+            codec, pixel_format, width, height = video.groups()
+            video = (codec, pixel_format, int(width), int(height), float(fps.group(1)) if fps else None)
+
+        info[int(index)] = {
+            "duration": int(hours) * 3600 + int(minutes) * 60 + float(seconds),
+            "has_audio": bool(_AUDIO_STREAM.search(section)),
+            "video": video,
+        }
+
+    if len(info) != len(video_paths):
+        raise RuntimeError(f"Could not probe videos: {result.stderr.strip()[-500:]}")
+
+    return [info[i] for i in range(len(video_paths))]
+
+
+def remux_to_ts(
+    input_path: Path,
+    output_path: Path,
+    offset: float = 0.0,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+) -> bool:
+    """
+    Stream-copy a video into an MPEG-TS segment.
+
+    TS segments can be appended byte-for-byte; shifting each one to its
+    position on the joined timeline keeps timestamps monotonic.
+
+    Args:
+        input_path: Input video path
+        output_path: Output .ts path
+        offset: Start time of the segment on the joined timeline (seconds)
+        start: Copy from this keyframe time (seconds) instead of the start
+        end: Stop before this keyframe time (seconds) instead of the end
+
+    Returns:
+        True if successful
+    """
+    try:
+        cmd = ["ffmpeg"]
+
+        if start:
+            cmd += ["-ss", f"{start:.6f}"]
+        if end is not None:
+            # Stop just short of the keyframe starting the next piece
+            cmd += ["-t", f"{end - (start or 0.0) - KEYFRAME_EPSILON:.6f}"]
+
+        cmd += [
+            "-i", str(input_path),
+            "-c", "copy",
+            "-output_ts_offset", f"{offset:.6f}",
+            "-f", "mpegts",
+            "-y",
+            str(output_path),
+        ]
+
+        media_executor.run(cmd, SHORT, check=True)
+        return True
+
+    except subprocess.CalledProcessError as e:
+        print(f"Error remuxing video: {e}")
+        return False
+
+
+def remux_to_mp4(input_path: Path, output_path: Path) -> bool:
+    """
+    Stream-copy a video (e.g. joined TS segments) into an MP4.
+
+    Args:
+        input_path: Input video path
+        output_path: Output video path
+
+    Returns:
+        True if successful
+    """
+    try:
+        cmd = [
+            "ffmpeg",
+            "-i", str(input_path),
+            "-c", "copy",
+            "-bsf:a", "aac_adtstoasc",
+            "-movflags", "+faststart",
+            "-y",
+            str(output_path),
+        ]
+
+        media_executor.run(cmd, SHORT, check=True)
+        return True
+
+    except subprocess.CalledProcessError as e:
+        print(f"Error remuxing video: {e}")
+        return False
+
+
+def get_keyframe_times(video_path: Path) -> List[float]:
+    """
+    Get the keyframe times of a video.
+
+    Only packet flags are read, so nothing is decoded.
+
+    Args:
+        video_path: Path to video file
+
+    Returns:
+        Keyframe times in seconds from the first packet, sorted
+    """
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "packet=pts_time,flags",
+        "-of", "csv=p=0",
+        str(video_path),
+    ]
+
+    result = media_executor.run(cmd, SHORT, check=True)
+
+    packets = []
+    for line in result.stdout.splitlines():
+        pts_time, _, flags = line.partition(",")
+        if pts_time and pts_time != "N/A":
+            packets.append((float(pts_time), "K" in flags))
+
+    if not packets:
+        return []
+
+    first = min(pts for pts, _ in packets)
+    return sorted(pts - first for pts, keyframe in packets if keyframe)
+
+
 def get_video_duration(video_path: Path) -> float:
     """
     Get video duration in seconds.
@@ -152,12 +568,7 @@ def get_video_duration(video_path: Path) -> float:
         str(video_path),
     ]
 
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
+    result = media_executor.run(cmd, SHORT, check=True)
 
     data = json.loads(result.stdout)
     return float(data["format"]["duration"])
@@ -181,12 +592,7 @@ def get_video_info(video_path: Path) -> dict:
         str(video_path),
     ]
 
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
+    result = media_executor.run(cmd, SHORT, check=True)
 
     data = json.loads(result.stdout)
 
@@ -207,6 +613,24 @@ def get_video_info(video_path: Path) -> dict:
     }
 
 
+def get_frame_count(video_path: Path) -> int:
+    """
+    Get number of frames in a video.
+
+    Args:
+        video_path: Path to video file
+
+    Returns:
+        Frame count (estimated from duration when the container omits it)
+    """
+    info = get_video_info(video_path)
+
+    if info["num_frames"]:
+        return info["num_frames"]
+
+    return int(round(info["duration"] * info["fps"]))
+
+
 def extract_frame(video_path: Path, output_path: Path, frame_number: int = 0) -> bool:
     """
     Extract a single frame from video.
@@ -229,7 +653,7 @@ def extract_frame(video_path: Path, output_path: Path, frame_number: int = 0) ->
             str(output_path),
         ]
 
-        subprocess.run(cmd, capture_output=True, text=True, check=True)
+        media_executor.run(cmd, SHORT, check=True)
         return True
 
     except subprocess.CalledProcessError as e:
@@ -237,6 +661,39 @@ def extract_frame(video_path: Path, output_path: Path, frame_number: int = 0) ->
         return False
 
 
+def extract_last_frame(video_path: Path, output_path: Path) -> bool:
+    """
+    Extract the last decodable frame of a video.
+
+    Decodes only the final second and keeps overwriting the output, so the
+    result is the real last frame even when the container's frame count or
+    duration is off.
+
+    Args:
+        video_path: Input video path
+        output_path: Output image path
+
+    Returns:
+        True if successful
+    """
+    try:
+        cmd = [
+            "ffmpeg",
+            "-sseof", "-1",
+            "-i", str(video_path),
+            "-update", "1",
+            "-y",
+            str(output_path),
+        ]
+
+        media_executor.run(cmd, SHORT, check=True)
+        return output_path.exists()
+
+    except subprocess.CalledProcessError as e:
+        print(f"Error extracting last frame: {e}")
+        return False
+
+
 def convert_to_standard_format(input_path: Path, output_path: Path) -> bool:
     """
     Convert video to standard format (H.264, yuv420p).
@@ -259,7 +716,7 @@ def convert_to_standard_format(input_path: Path, output_path: Path) -> bool:
             str(output_path),
         ]
 
-        subprocess.run(cmd, capture_output=True, text=True, check=True)
+        media_executor.run(cmd, ENCODE, check=True)
         return True
 
     except subprocess.CalledProcessError as e:
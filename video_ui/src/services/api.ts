@@ -2,7 +2,7 @@
  * API client for video generation backend
  */
 import axios from 'axios';
-import type { Job, ModelInfo, CreateJobRequest } from '../types/api';
+import type { Job, JobSummary, ModelInfo, CreateJobRequest } from '../types/api';
 
 const API_BASE_URL = process.env.REACT_APP_API_URL || 'http://localhost:8000/api/v1';
 
@@ -37,7 +37,7 @@ export const apiClient = {
     return response.data;
   },
 
-  listJobs: async (page: number = 1, pageSize: number = 20): Promise<{ jobs: Job[], total: number }> => {
+  listJobs: async (page: number = 1, pageSize: number = 20): Promise<{ jobs: JobSummary[], total: number }> => {
     const response = await api.get('/jobs', {
       params: { page, page_size: pageSize },
     });
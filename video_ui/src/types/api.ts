@@ -29,6 +29,19 @@ export interface Storyboard {
   generated_by: string;
 }
 
+export interface JobSummary {
+  id: string;
+  status: JobStatus;
+  created_at: string;
+  updated_at: string;
+  user_prompt: string;
+  model_id: string;
+  current_step: string;
+  progress_percentage: number;
+  output_video_url?: string;
+  error_message?: string;
+}
+
 export interface Job {
   id: string;
   status: JobStatus;
@@ -41,6 +54,7 @@ export interface Job {
   progress_percentage: number;
   current_shot_id?: string;
   output_video_url?: string;
+  stream_url?: string;
   storyboard?: Storyboard;
   error_message?: string;
 }
@@ -64,6 +78,8 @@ export interface CreateJobRequest {
   model_id?: string;
   max_shots?: number;
   style_preferences?: Record<string, any>;
+  fresh_storyboard?: boolean;
+  reference_file_id?: string;
 }
 
 export interface ProgressUpdate {